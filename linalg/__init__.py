@@ -1,11 +1,14 @@
-from linalg.det import det
+from linalg.condest import condest, rcond
+from linalg.det import det, slogdet
 from linalg.inv import inv
 from linalg.solve_band import solve_band, solves_band
 from linalg.solve_triangle import solve_triangle
 from linalg.solve_tridiag import solve_tridiag, solve_sympos_tridiag
 from linalg.solve import solve
+from linalg.solve_stream import solve_stream
 from linalg.transforms import house
 from linalg.qr_interface import qr
+from linalg.utils.workspace import Workspace
 
 from linalg import elim
 from linalg import lu
@@ -16,7 +19,10 @@ from linalg import svd_decomp
 from linalg import eig_unsym
 
 __all__ = [
+    "condest",
+    "rcond",
     "det",
+    "slogdet",
     "inv",
     "solve_band",
     "solves_band",
@@ -24,8 +30,10 @@ __all__ = [
     "solve_tridiag",
     "solve_sympos_tridiag",
     "solve",
+    "solve_stream",
     "house",
     "qr",
+    "Workspace",
     "elim",
     "lu",
     "sym_decomp",
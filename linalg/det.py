@@ -1,45 +1,115 @@
 import numpy as np
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, NDArray
+from typing import Literal, Tuple, Union
 
-from .lu.lu import lu
-from .utils._validations import _ensure_ndarray
+from .lu.lu import _lu
+from .sympos_decomp.cholesky import _cholesky
+from .utils._validations import _ensure_ndarray, FLOAT_DTYPES
+from .utils.permutation import permutation_sign
 
 def det(
     a: ArrayLike,
     overwrite_a: bool = False
-) -> float:
+) -> Union[float, NDArray]:
     """
     Get determinant of square matrix A
     using LU decomposition
 
-    Use identity det(A) = det(L)*det(U) = det(U)
+    Use identity det(A) = det(P)*det(L)*det(U) = det(P)*det(U)
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        input square matrix A
+    a : ArrayLike of shape (n, n) or (k, n, n)
+        input square matrix A or stack of k matrices
     overwrite_a : bool (default: False)
         allow to overwrite `a`
     
     Returns
     -------
-    det : float
+    det : float or ndarray of shape (k,)
         determinant of `a`
     """
     copy = not overwrite_a
     a = _ensure_ndarray(
         a,
         ensure_square=True,
+        allow_stacked=True,
         copy=copy,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
-    a, row_ids, _ = lu(a, mode="economic", overwrite_a=True)
+    row_ids, _ = _lu(a)
 
-    n = a.shape[0]
-    ids = np.arange(n)
-    n_transpos = np.sum(row_ids != ids) - 1
-    n_transpos = 0 if n_transpos < 0 else n_transpos
-    det_sign = (-1)**n_transpos
+    det_sign = permutation_sign(row_ids)
 
-    return det_sign * np.prod(np.diag(a))
\ No newline at end of file
+    return det_sign * np.prod(np.diagonal(a, axis1=-2, axis2=-1), axis=-1)
+
+
+def slogdet(
+    a: ArrayLike,
+    assume_a: Literal["gen", "pos"] = "gen",
+    overwrite_a: bool = False
+) -> Tuple[Union[float, NDArray], Union[float, NDArray]]:
+    """
+    Get sign and natural logarithm of absolute value of determinant
+    of square matrix A or of each matrix of a stack, it does not
+    overflow or underflow unlike `det` for large matrices.
+    Stack of matrices is decomposed at once (vectorized across stack).
+
+    Use identities:
+    - ``"gen"``: det(A) = det(P)*det(U), log|det(A)| = sum(log|U[i, i]|)
+    - ``"pos"``: det(A) = det(L)^2, log(det(A)) = 2 * sum(log(L[i, i]))
+
+    Parameters
+    ----------
+    a : ArrayLike of shape (n, n) or (k, n, n)
+        input square matrix A or stack of k matrices
+    assume_a : ["gen", "pos"] (default: "gen")
+        Assume type of input matrix A:
+        - ``"gen"`` - general square matrix, use LU decomposition
+        - ``"pos"`` - symmetric positive definite matrix, use Cholesky
+          decomposition (half the flops of LU), raise RuntimeError
+          if any matrix is not SPD
+    
+    overwrite_a : bool (default: False)
+        allow to overwrite `a`
+    
+    Returns
+    -------
+    tuple(sign, logdet):
+        - `sign` - float or ndarray of shape (k,), sign of determinant:
+          ``1.0``, ``-1.0`` or ``0.0`` for singular matrix
+        - `logdet` - float or ndarray of shape (k,), natural logarithm
+          of absolute value of determinant, ``-inf`` for singular matrix
+    """
+    copy = not overwrite_a
+    a = _ensure_ndarray(
+        a,
+        ensure_square=True,
+        allow_stacked=True,
+        copy=copy,
+        dtype=FLOAT_DTYPES
+    )
+
+    if assume_a not in ["gen", "pos"]:
+        raise ValueError(
+            "Unknown `assume_a` option: availible ['gen', 'pos'],"
+            f" got {assume_a}."
+        )
+
+    if assume_a == "gen":
+        # zero pivot is kept on diagonal of U of singular matrix,
+        # it gives zero sign and -inf logdet of this matrix only
+        row_ids, _ = _lu(a, allow_singular=True)
+        diag = np.diagonal(a, axis1=-2, axis2=-1)
+        sign = permutation_sign(row_ids) * np.prod(np.sign(diag), axis=-1)
+        with np.errstate(divide="ignore"):
+            logdet = np.sum(np.log(np.abs(diag)), axis=-1)
+    elif assume_a == "pos":
+        _cholesky(a)
+        # diagonal of L is positive
+        diag = np.diagonal(a, axis1=-2, axis2=-1)
+        sign = np.prod(np.sign(diag), axis=-1)
+        logdet = 2.0 * np.sum(np.log(diag), axis=-1)
+
+    return sign.astype(a.dtype), logdet
\ No newline at end of file
@@ -2,7 +2,8 @@ import numpy as np
 from typing import Literal
 from numpy.typing import ArrayLike
 
-from ..utils._validations import _ensure_ndarray
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
+from ..transforms.cy_pivot import cy_argmax_abs, cy_argmax_abs_2d, cy_swap_rows, cy_swap_cols
 
 def determinant(
     a: ArrayLike,
@@ -31,7 +32,7 @@ def determinant(
     a = _ensure_ndarray(
         a,
         ensure_square=True,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     if piv_option not in ["row", "col", "full"]:
@@ -47,26 +48,25 @@ def determinant(
     for i in range(n-1):
         if piv_option == "row":
             # get pivoting elemnt
-            piv_row = np.argmax(np.abs(a[i:, i]))
+            piv_row = cy_argmax_abs(a[i:, i])
             piv_row += i
             
             if piv_row != i:
                 det_sign *= -1
             
-            a[[piv_row, i]] = a[[i, piv_row]]
+            cy_swap_rows(a, piv_row, i)
         elif piv_option == "col":
             # get pivoting elemnt
-            piv_col = np.argmax(np.abs(a[i, i:]))
+            piv_col = cy_argmax_abs(a[i, i:])
             piv_col += i
 
             if piv_col != i:
                 det_sign *= -1
 
-            a[:, [piv_col, i]] = a[:, [i, piv_col]]
+            cy_swap_cols(a, piv_col, i)
         elif piv_option == "full":
             # get pivoting elemnt
-            piv_idx = np.argmax(np.abs(a[i:, i:]))
-            piv_row, piv_col = np.unravel_index(piv_idx, a[i:, i:].shape)
+            piv_row, piv_col = cy_argmax_abs_2d(a[i:, i:])
             piv_row += i
             piv_col += i
             
@@ -75,8 +75,8 @@ def determinant(
             if piv_col != i:
                 det_sign *= -1
             
-            a[[piv_row, i]] = a[[i, piv_row]]
-            a[:, [piv_col, i]] = a[:, [i, piv_col]]
+            cy_swap_rows(a, piv_row, i)
+            cy_swap_cols(a, piv_col, i)
         
         if a[i, i] == 0.0:
             raise RuntimeError("`a` is a singular matrix.")
@@ -3,14 +3,17 @@ import warnings
 from typing import Literal, Union
 from numpy.typing import ArrayLike, NDArray
 
-from ..utils._validations import _ensure_ndarray
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
 from ..utils._validations import PivotingWarning
-from ..utils.solve import solve_diag, solve_upper
+from ..utils._kernels import solve_triangular, solve_diagonal
+from ..transforms.cy_pivot import (
+    cy_argmax_abs, cy_argmax_abs_2d, cy_rook_pivot, cy_swap_rows, cy_swap_cols
+)
     
 def solve_elim(
     a: ArrayLike,
     b: ArrayLike,
-    piv_option: Union[None, Literal["row", "col", "full"]] = "row",
+    piv_option: Union[None, Literal["row", "col", "full", "rook"]] = "row",
     strategy: Literal["gauss", "gaussj"] = "gauss",
     overwrite_a: bool = False,
     overwrite_b: bool = False,
@@ -26,12 +29,14 @@ def solve_elim(
     b : ArrayLike of shape (n, m)
         input matrix B, such that
         m - number of systems A x X[:,i] = B[:,i], i in [1, m]
-    piv_option : None or ["row", "col", "full"] (default: "row")
+    piv_option : None or ["row", "col", "full", "rook"] (default: "row")
         pivoting strategy:
         - ``None`` no pivoting (bad option)
         - ``"row"`` to interchange rows only
         - ``"col"`` to interchange cols only
         - ``"full"`` to interchange both rows and cols
+        - ``"rook"`` to interchange both rows and cols, pivot is
+          maximal in its row and its col (alternating searches)
 
     strategy : ["gauss", "gaussj"] (default: "gauss")
         elimination strategy:
@@ -61,13 +66,13 @@ def solve_elim(
         a,
         ensure_square=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     
     is_b1d = False
@@ -75,9 +80,9 @@ def solve_elim(
         b = b[:, np.newaxis]
         is_b1d = True
     
-    if piv_option not in [None, "row", "col", "full"]:
+    if piv_option not in [None, "row", "col", "full", "rook"]:
         raise ValueError(
-            "`piv_option` must be None or in ['row', 'col', 'full'],"
+            "`piv_option` must be None or in ['row', 'col', 'full', 'rook'],"
             f" got {piv_option}."
         )
 
@@ -100,36 +105,38 @@ def solve_elim(
             )
         elif piv_option == "row":
             # get pivoting elemnt
-            piv_row = np.argmax(np.abs(a[i:, i]))
+            piv_row = cy_argmax_abs(a[i:, i])
             piv_row += i
             
             # interchange rows of `a` and `b`
-            a[[piv_row, i]] = a[[i, piv_row]]
-            b[[piv_row, i]] = b[[i, piv_row]]
+            cy_swap_rows(a, piv_row, i)
+            cy_swap_rows(b, piv_row, i)
         elif piv_option == "col":
             # get pivoting elemnt
-            piv_col = np.argmax(np.abs(a[i, i:]))
+            piv_col = cy_argmax_abs(a[i, i:])
             piv_col += i
             
             # interchange cols of `a` and note this
             # permutation in `col_ids`
-            a[:, [piv_col, i]] = a[:, [i, piv_col]]
-            col_ids[[piv_col, i]] = col_ids[[i, piv_col]]
-        elif piv_option == "full":
+            cy_swap_cols(a, piv_col, i)
+            col_ids[i], col_ids[piv_col] = col_ids[piv_col], col_ids[i]
+        elif piv_option in ["full", "rook"]:
             # get pivoting elemnt
-            piv_idx = np.argmax(np.abs(a[i:, i:]))
-            piv_row, piv_col = np.unravel_index(piv_idx, a[i:, i:].shape)
+            if piv_option == "full":
+                piv_row, piv_col = cy_argmax_abs_2d(a[i:, i:])
+            else:
+                piv_row, piv_col = cy_rook_pivot(a[i:, i:])
             piv_row += i
             piv_col += i
             
             # interchange rows of `a` and `b`
-            a[[piv_row, i]] = a[[i, piv_row]]
-            b[[piv_row, i]] = b[[i, piv_row]]
+            cy_swap_rows(a, piv_row, i)
+            cy_swap_rows(b, piv_row, i)
             
             # interchange cols of `a` and note this
             # permutation in `col_ids`
-            a[:, [piv_col, i]] = a[:, [i, piv_col]]
-            col_ids[[piv_col, i]] = col_ids[[i, piv_col]]
+            cy_swap_cols(a, piv_col, i)
+            col_ids[i], col_ids[piv_col] = col_ids[piv_col], col_ids[i]
         
         if a[i, i] == 0.0:
             raise RuntimeError("`a` is a singular matrix.")
@@ -148,11 +155,11 @@ def solve_elim(
         raise RuntimeError("`a` is a singular matrix.")
 
     if strategy == "gauss":
-        b = solve_upper(a, b, overwrite_b=True)
+        solve_triangular(a, b, lower=False)
     elif strategy == "gaussj":
         b[:-1] -= a[:-1, -1, np.newaxis] * b[-1] / a[-1, -1]
         a[:-1, -1] = 0.0
-        b = solve_diag(a, b, overwrite_b=True)
+        solve_diagonal(a, b)
 
     # get output `b` in the same form as input
     if is_b1d:
@@ -1,14 +1,23 @@
 import numpy as np
-from typing import Literal
+import warnings
+from typing import Literal, Union
 from numpy.typing import ArrayLike, NDArray
 
 from .elim import solve_elim
-from ..utils._validations import _ensure_ndarray
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
+from ..utils._validations import PivotingWarning
+from ..transforms.cy_pivot import (
+    cy_argmax_abs, cy_argmax_abs_2d, cy_rook_pivot, cy_swap_rows, cy_swap_cols
+)
+
+# number of rows updated at once by in-place Gauss-Jordan
+GAUSSJ_BLOCK_SIZE = 64
 
 def inverse(
     a: ArrayLike,
-    piv_option: Literal["row", "col", "full"] = "row",
-    strategy: Literal["gauss", "gaussj"] = "gauss"
+    piv_option: Union[None, Literal["row", "col", "full", "rook"]] = "row",
+    strategy: Literal["gauss", "gaussj"] = "gauss",
+    overwrite_a: bool = False
 ) -> NDArray:
     """
     Get inverse matrix using gauss elimination
@@ -17,33 +26,115 @@ def inverse(
     ----------
     a : ArrayLike of shape (n, n)
         input square matrix A
-    piv_option : ["row", "col", "full"] (default: "row")
+    piv_option : ["row", "col", "full", "rook"] (default: "row")
         pivoting strategy:
         - ``None`` no pivoting (bad option)
         - ``"row"`` to interchange rows only
         - ``"col"`` to interchange cols only
         - ``"full"`` to interchange both rows and cols
-    
+        - ``"rook"`` to interchange both rows and cols, pivot is
+          maximal in its row and its col (alternating searches)
+
     strategy : ["gauss", "gaussj"] (default: "gauss")
         elimination strategy:
-        - ``"gauss"`` elimintates only lower rows to get upper
-          triangular matrix from `a`
-        - ``"gaussj"`` eliminates both lower and upper rows to
-          get diagonal matrix from `a`
-    
+        - ``"gauss"`` solves AX = I with `solve_elim`, it eliminates
+          only lower rows to get upper triangular matrix from `a`
+        - ``"gaussj"`` in-place Gauss-Jordan elimination, `a` is
+          overwritten with A^-1 without identity workspace, n^3 flops.
+          Interchanges are recorded and undone at the end.
+
+    overwrite_a : bool (default: False)
+        allow to overwrite `a` matrix
+
     Returns
     -------
     a : ndarray of shape (n, n)
         output permuted matrix A, such that A^-1 x A = A x A^-1 = I
     """
+    copy_a = not overwrite_a
     a = _ensure_ndarray(
         a,
         ensure_square=True,
-        dtype="float64"
+        copy=copy_a,
+        dtype=FLOAT_DTYPES
     )
+
+    if piv_option not in [None, "row", "col", "full", "rook"]:
+        raise ValueError(
+            "`piv_option` must be None or in ['row', 'col', 'full', 'rook'],"
+            f" got {piv_option}."
+        )
+
+    if strategy not in ["gauss", "gaussj"]:
+        raise ValueError(
+            "`strategy` must be in ['gauss', 'gaussj'],"
+            f" got {strategy}."
+        )
+
+    if strategy == "gauss":
+        b = np.identity(a.shape[0], dtype=a.dtype)
+        return solve_elim(
+            a, b,
+            piv_option=piv_option,
+            strategy=strategy,
+            overwrite_a=True,
+            overwrite_b=True
+        )
+
+    _gaussj(a, piv_option)
+    return a
+
+def _gaussj(
+    a: NDArray,
+    piv_option: Union[None, Literal["row", "col", "full", "rook"]]
+) -> None:
+    """
+    In-place Gauss-Jordan inversion, overwrites `a` with A^-1.
+    Row interchanges of A are column interchanges of A^-1
+    and vice versa, they are undone in reverse order.
+    """
     n = a.shape[0]
 
-    b = np.identity(n, dtype=np.float64)
-    
-    return solve_elim(a, b, piv_option=piv_option, strategy=strategy)
-    
\ No newline at end of file
+    # interchanged rows and cols at each step
+    row_swaps = np.arange(n)
+    col_swaps = np.arange(n)
+    for i in range(n):
+        if piv_option is None:
+            warnings.warn(
+                "Disable pivoting is a bad practice, ensure "
+                "there are no zeros on diagonal of `a` matrix.",
+                PivotingWarning
+            )
+        elif piv_option == "row":
+            row_swaps[i] = cy_argmax_abs(a[i:, i]) + i
+        elif piv_option == "col":
+            col_swaps[i] = cy_argmax_abs(a[i, i:]) + i
+        elif piv_option in ["full", "rook"]:
+            if piv_option == "full":
+                piv_row, piv_col = cy_argmax_abs_2d(a[i:, i:])
+            else:
+                piv_row, piv_col = cy_rook_pivot(a[i:, i:])
+            row_swaps[i] = piv_row + i
+            col_swaps[i] = piv_col + i
+
+        cy_swap_rows(a, row_swaps[i], i)
+        cy_swap_cols(a, col_swaps[i], i)
+
+        piv = a[i, i]
+        if piv == 0.0:
+            raise RuntimeError("`a` is a singular matrix.")
+
+        # column `i` of A^-1 is stored in place of eliminated column
+        a[i] /= piv
+        f = a[:, i].copy()
+        f[i] = 0.0
+        a[:, i] = 0.0
+        a[i, i] = 1.0 / piv
+        # rank-1 update by blocks of rows keeps workspace O(n)
+        for k in range(0, n, GAUSSJ_BLOCK_SIZE):
+            k_b = min(k + GAUSSJ_BLOCK_SIZE, n)
+            a[k:k_b] -= f[k:k_b, np.newaxis] * a[i]
+
+    for i in range(n-1, -1, -1):
+        cy_swap_rows(a, col_swaps[i], i)
+        cy_swap_cols(a, row_swaps[i], i)
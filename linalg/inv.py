@@ -1,45 +1,137 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
-from .lu.lu import lu
-from .utils._validations import _ensure_ndarray
-from .utils.solve import solve_lower, solve_upper
+from .lu.lu import _lu
+from .utils._validations import _ensure_ndarray, FLOAT_DTYPES
+from .utils._kernels import solve_triangular
 
 def inv(
     a: ArrayLike,
-    overwrite_a: bool = False
+    overwrite_a: bool = False,
+    block_size: int = 64
 ) -> NDArray:
     """
-    Inverse square matrix A using LU decomposition.
-    It solves equation U x A^-1 = L^-1
+    Inverse square matrix A using LU decomposition in-place (LAPACK GETRI).
+    A = PLU is decomposed, U is inverted in-place, then A^-1 P = U^-1 L^-1
+    is found from X L = U^-1 in-place, finally columns are permuted back.
+    No n x n workspace is used: only blocks of `block_size` columns or rows
+    are allocated, it takes ~2n^3 flops.
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        input square matrix
+    a : ArrayLike of shape (n, n) or (k, n, n)
+        input square matrix or stack of k matrices
     overwrite_a : bool (default: False)
         allow to overwrite `a`
-    
+    block_size : int (default: 64)
+        size of blocks of triangular inversion and solve
+
     Returns
     -------
-    a_inv : ndarray of shape (n, n)
+    a_inv : ndarray of shape (n, n) or (k, n, n)
         inverse `a`
     """
     copy = not overwrite_a
     a = _ensure_ndarray(
         a,
         ensure_square=True,
+        allow_stacked=True,
         copy=copy,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
-    a, row_ids, _ = lu(a, overwrite_a=True, mode="economic")
+    if not isinstance(block_size, int) or block_size < 1:
+        raise ValueError(
+            "`block_size` must be a positive integer,"
+            f" got {block_size}."
+        )
+
+    row_ids, _ = _lu(a)
+    if np.any(np.diagonal(a, axis1=-2, axis2=-1) == 0.0):
+        raise RuntimeError("`a` is a singular matrix.")
+
+    _invert_upper(a, block_size)
+    _solve_unit_lower_right(a, block_size)
+    # A[row_ids] = LU, so A^-1[:, row_ids] = U^-1 L^-1
+    _permute_cols(a, row_ids, block_size)
+
+    return a
+
+def _invert_upper(
+    a: NDArray,
+    block_size: int
+) -> None:
+    """
+    Overwrite upper triangle U of `a` with U^-1 by block columns (TRTRI),
+    lower triangle of `a` is not referenced.
+    """
+    n = a.shape[-1]
+    for j in range(0, n, block_size):
+        j_b = min(j + block_size, n)
+
+        # U^-1_12 = -U^-1_11 U_12 U^-1_22, U^-1_11 is already in `a`,
+        # row blocks go downward since they need rows below them
+        for i in range(0, j, block_size):
+            i_b = min(i + block_size, j)
+            t = np.matmul(np.triu(a[..., i:i_b, i:i_b]), a[..., i:i_b, j:j_b])
+            t += np.matmul(a[..., i:i_b, i_b:j], a[..., i_b:j, j:j_b])
+            a[..., i:i_b, j:j_b] = -t
+        # X U_22 = T is U_22^T X^T = T^T
+        solve_triangular(
+            a[..., j:j_b, j:j_b],
+            np.swapaxes(a[..., :j, j:j_b], -1, -2),
+            lower=False,
+            transposed=True
+        )
 
-    n = a.shape[0]
-    # probably it can be solved without allocation of new identity
-    b = np.identity(n)
-    b[:] = b[row_ids]
-    b = solve_lower(a, b, overwrite_b=True, unit=True)
-    # U x A^-1 = L^-1
-    b = solve_upper(a, b, overwrite_b=True)
-    return b
\ No newline at end of file
+        # invert diagonal block
+        u_22 = np.triu(a[..., j:j_b, j:j_b])
+        u_inv = np.broadcast_to(np.identity(j_b - j, dtype=a.dtype), u_22.shape).copy()
+        solve_triangular(u_22, u_inv, lower=False)
+        upper = np.triu(np.ones((j_b - j, j_b - j), dtype=bool))
+        a[..., j:j_b, j:j_b] = np.where(upper, u_inv, a[..., j:j_b, j:j_b])
+
+def _solve_unit_lower_right(
+    a: NDArray,
+    block_size: int
+) -> None:
+    """
+    Overwrite `a` containing U^-1 and unit lower L with X: X L = U^-1 (GETRI),
+    block columns of L are copied to workspace of `block_size` columns.
+    """
+    n = a.shape[-1]
+    starts = range(0, n, block_size)
+    for j in reversed(starts):
+        j_b = min(j + block_size, n)
+
+        # move multipliers of block column to workspace
+        l_panel = np.tril(a[..., j:, j:j_b], -1)
+        a[..., j:, j:j_b] -= l_panel
+
+        # X_1 L_11 = B_1 - X_2 L_21, X_2 is already solved
+        if j_b < n:
+            a[..., :, j:j_b] -= np.matmul(a[..., :, j_b:], l_panel[..., j_b - j:, :])
+        l_11 = l_panel[..., :j_b - j, :]
+        solve_triangular(
+            l_11,
+            np.swapaxes(a[..., :, j:j_b], -1, -2),
+            lower=True,
+            transposed=True,
+            unit=True
+        )
+
+def _permute_cols(
+    a: NDArray,
+    row_ids: NDArray,
+    block_size: int
+) -> None:
+    """
+    Set ``a[..., :, row_ids] = a`` by blocks of rows
+    """
+    n = a.shape[-1]
+    ids = row_ids[..., np.newaxis, :]
+    for i in range(0, n, block_size):
+        i_b = min(i + block_size, n)
+        block = np.empty_like(a[..., i:i_b, :])
+        np.put_along_axis(block, np.broadcast_to(ids, block.shape), a[..., i:i_b, :], axis=-1)
+        a[..., i:i_b, :] = block
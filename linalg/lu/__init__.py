@@ -1,9 +1,14 @@
 from linalg.lu.lu import lu, lu_solve
 from linalg.lu.lu_band import lu_band, lu_band_solve
+from linalg.lu.lu_factor import LUFactor, lu_factor
+from linalg.lu.lu_update import lu_update
 
 __all__ = [
     "lu",
     "lu_solve",
     "lu_band",
-    "lu_band_solve"
+    "lu_band_solve",
+    "LUFactor",
+    "lu_factor",
+    "lu_update"
 ]
\ No newline at end of file
@@ -1,36 +1,56 @@
+import os
 import numpy as np
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal, Tuple, Union
+from typing import Literal, Optional, Tuple, Union
 
-from ..utils._validations import _ensure_ndarray
+from ..utils._validations import _ensure_ndarray, _check_n_jobs, FLOAT_DTYPES
 from ..utils._validations import PivotingWarning
-from ..utils.solve import solve_lower, solve_upper
+from ..utils._kernels import solve_triangular, lu_solve_factored, solve_parallel
 from ..utils.permutation import decode_permutation
+from ..utils.workspace import Workspace
+from ..transforms.cy_pivot import (
+    cy_argmax_abs, cy_argmax_abs_2d, cy_rook_pivot, cy_swap_rows, cy_swap_cols, cy_gepp
+)
 
 def lu(
     a: ArrayLike,
-    piv_option: Union[None, Literal["row", "col", "full"]] = "row",
+    piv_option: Union[None, Literal["row", "col", "full", "rook", "tournament"]] = "row",
     mode: Literal["full", "economic"] = "full",
-    overwrite_a: bool = False
+    overwrite_a: bool = False,
+    block_size: int = 64,
+    n_jobs: Optional[int] = None,
+    workspace: Optional[Workspace] = None
 ) -> Tuple[NDArray, ...]:
     """
     Get LU (PLU, LUQ, PLUQ) decomposition of square matrix.
     If no pivoting: A = LU
-    If row pivoting: A = PLU, P - permutation matrix
+    If row or tournament pivoting: A = PLU, P - permutation matrix
     If col pivoting: A = LUQ, Q - permutation matrix
-    If full pivoting: A = PLUQ
+    If full or rook pivoting: A = PLUQ
+
+    Stack of matrices is decomposed at once, pivoting and
+    outer product updates are vectorized across the stack.
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        input square matrix to decompose
-    piv_option : ["row", "col", "full"] (default: "row")
+    a : ArrayLike of shape (n, n) or (k, n, n)
+        input square matrix or stack of k square matrices to decompose
+    piv_option : ["row", "col", "full", "rook", "tournament"] (default: "row")
         pivoting strategy:
         - ``None`` no pivoting (bad option)
         - ``"row"`` to interchange rows only
         - ``"col"`` to interchange cols only
         - ``"full"`` to interchange both rows and cols
+        - ``"rook"`` to interchange both rows and cols, pivot is
+          maximal in its row and its col (alternating searches)
+        - ``"tournament"`` to interchange rows only, pivot rows of each
+          panel are chosen by tournament (CALU): panel is split into row
+          blocks, candidates of each block are chosen by partial pivoting
+          in a thread pool and combined in a binary reduction tree.
+          LU factors of winners from the last game are reused for the panel
         
     mode : ["full", "economic"] (default: "full")
         return mode (see `Returns` section for details):
@@ -39,6 +59,19 @@ def lu(
     
     overwrite_a : bool (default: False)
         allow to overwrite `a` matrix
+    block_size : int (default: 64)
+        width of panels in blocked algorithm. Blocked algorithm
+        is used for `piv_option` in [None, "row", "tournament"] only, each panel
+        is factorized with partial pivoting, trailing matrix is updated
+        with one triangular solve and one matrix product per panel.
+        Set `block_size >= n` to use unblocked outer product algorithm.
+        Stacks of matrices are always decomposed with unblocked algorithm.
+    n_jobs : int or None (default: None)
+        number of threads for tournament pivoting, also an upper
+        bound of row blocks per panel. ``None`` means ``os.cpu_count()``.
+    workspace : Workspace or None (default: None)
+        reusable scratch buffers of outer product and trailing
+        updates, ``None`` allocates them once per call
     
     Returns
     -------
@@ -48,20 +81,18 @@ def lu(
         - `a` - ndarray of shape (n, n) contains L in low triangle, U in up triangle
         - `row_ids` - ndarray of shape (n,) encoded P
         - `col_ids` - ndarray of shape (n,) encoded Q
+    For stack of matrices all outputs have extra leading dimension k.
     """
     copy = not overwrite_a
     a = _ensure_ndarray(
         a,
         ensure_square=True,
+        allow_stacked=True,
         copy=copy,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
-    if piv_option not in [None, "row", "col", "full"]:
-        raise ValueError(
-            "`piv_option` must be in ['row', 'col', 'full'],"
-            f" got {piv_option}."
-        )
+    _check_piv_option(piv_option, a.ndim)
     
     if mode not in ["full", "economic"]:
         raise ValueError(
@@ -69,6 +100,81 @@ def lu(
             f" got {mode}."
         )
     
+    if not isinstance(block_size, int) or block_size < 1:
+        raise ValueError(
+            "`block_size` must be a positive integer,"
+            f" got {block_size}."
+        )
+
+    n_jobs = _check_n_jobs(n_jobs)
+
+    n = a.shape[-1]
+    row_ids, col_ids = _lu(a, piv_option, block_size, n_jobs, workspace)
+
+    if mode == "full":
+        l = np.tril(a)
+        ids = np.arange(n)
+        l[..., ids, ids] = 1.0
+        u = np.triu(a)
+        p = decode_permutation(row_ids)
+        q = np.swapaxes(decode_permutation(col_ids), -1, -2)
+        return l, u, p, q
+    elif mode == "economic":
+        return a, row_ids, col_ids
+
+def _check_piv_option(piv_option, ndim):
+    if piv_option not in [None, "row", "col", "full", "rook", "tournament"]:
+        raise ValueError(
+            "`piv_option` must be in ['row', 'col', 'full', 'rook', 'tournament'],"
+            f" got {piv_option}."
+        )
+
+    if ndim == 3 and piv_option == "tournament":
+        raise ValueError(
+            "`piv_option='tournament'` is not supported for stacks of matrices."
+        )
+
+def _lu(
+    a: NDArray,
+    piv_option: Union[None, Literal["row", "col", "full", "rook", "tournament"]] = "row",
+    block_size: int = 64,
+    n_jobs: Optional[int] = None,
+    workspace: Optional[Workspace] = None,
+    allow_singular: bool = False
+) -> Tuple[NDArray, NDArray]:
+    """
+    Trusted LU kernel for validated `a` (see `lu`), overwrites `a`
+    with L and U and returns encoded row and col permutations.
+    With `allow_singular` zero pivot is left on diagonal of U
+    and its elimination step is skipped instead of raising.
+    """
+    n = a.shape[-1]
+    if workspace is None:
+        workspace = Workspace()
+
+    if a.ndim == 3:
+        return _lu_stacked(a, piv_option, workspace, allow_singular)
+    elif piv_option == "tournament":
+        n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            return _lu_blocked(
+                a, piv_option, block_size, workspace, allow_singular, executor, n_jobs
+            )
+    elif piv_option in [None, "row"] and block_size < n:
+        return _lu_blocked(a, piv_option, block_size, workspace, allow_singular)
+    else:
+        return _lu_unblocked(a, piv_option, workspace, allow_singular)
+
+def _lu_unblocked(
+    a: NDArray,
+    piv_option: Union[None, Literal["row", "col", "full", "rook"]],
+    workspace: Workspace,
+    allow_singular: bool = False
+) -> Tuple[NDArray, NDArray]:
+    """
+    Outer product LU algorithm, overwrites `a` with L and U
+    and returns encoded row and col permutations.
+    """
     n = a.shape[0]
 
     row_ids = np.arange(n)
@@ -82,120 +188,358 @@ def lu(
             )
         elif piv_option == "row":
             # get pivoting elemnt
-            piv_row = np.argmax(np.abs(a[i:, i]))
+            piv_row = cy_argmax_abs(a[i:, i])
             piv_row += i
             
             # interchange rows of `a`
-            a[[piv_row, i]] = a[[i, piv_row]]
-            row_ids[[piv_row, i]] = row_ids[[i, piv_row]]
+            cy_swap_rows(a, piv_row, i)
+            row_ids[i], row_ids[piv_row] = row_ids[piv_row], row_ids[i]
         elif piv_option == "col":
             # get pivoting elemnt
-            piv_col = np.argmax(np.abs(a[i, i:]))
+            piv_col = cy_argmax_abs(a[i, i:])
             piv_col += i
             
             # interchange cols of `a` and note this
             # permutation in `col_ids`
-            a[:, [piv_col, i]] = a[:, [i, piv_col]]
-            col_ids[[piv_col, i]] = col_ids[[i, piv_col]]
-        elif piv_option == "full":
+            cy_swap_cols(a, piv_col, i)
+            col_ids[i], col_ids[piv_col] = col_ids[piv_col], col_ids[i]
+        elif piv_option in ["full", "rook"]:
             # get pivoting elemnt
-            piv_idx = np.argmax(np.abs(a[i:, i:]))
-            piv_row, piv_col = np.unravel_index(piv_idx, a[i:, i:].shape)
+            if piv_option == "full":
+                piv_row, piv_col = cy_argmax_abs_2d(a[i:, i:])
+            else:
+                piv_row, piv_col = cy_rook_pivot(a[i:, i:])
             piv_row += i
             piv_col += i
             
             # interchange rows of `a`
-            a[[piv_row, i]] = a[[i, piv_row]]
-            row_ids[[piv_row, i]] = row_ids[[i, piv_row]]
+            cy_swap_rows(a, piv_row, i)
+            row_ids[i], row_ids[piv_row] = row_ids[piv_row], row_ids[i]
             
             # interchange cols of `a` and note this
             # permutation in `col_ids`
-            a[:, [piv_col, i]] = a[:, [i, piv_col]]
-            col_ids[[piv_col, i]] = col_ids[[i, piv_col]]
+            cy_swap_cols(a, piv_col, i)
+            col_ids[i], col_ids[piv_col] = col_ids[piv_col], col_ids[i]
 
         if a[i, i] == 0.0:
-            raise RuntimeError("`a` is a singular matrix.")
+            if not allow_singular:
+                raise RuntimeError("`a` is a singular matrix.")
+            continue
 
         # perform outer product algorithm
         a[i+1:, i] /= a[i, i]
-        a[i+1:, i+1:] -= a[i+1:, i, np.newaxis] * a[i, i+1:]
+        t = workspace.get("update", (n - i - 1, n - i - 1), a.dtype)
+        np.multiply(a[i+1:, i, np.newaxis], a[i, i+1:], out=t)
+        a[i+1:, i+1:] -= t
 
-    if mode == "full":
-        l = np.tril(a)
-        np.fill_diagonal(l, 1.0)
-        u = np.triu(a)
-        p = decode_permutation(row_ids)
-        q = decode_permutation(col_ids).T
-        return l, u, p, q
-    elif mode == "economic":
-        return a, row_ids, col_ids
+    return row_ids, col_ids
+
+def _lu_blocked(
+    a: NDArray,
+    piv_option: Union[None, Literal["row", "tournament"]],
+    block_size: int,
+    workspace: Workspace,
+    allow_singular: bool = False,
+    executor: Optional[ThreadPoolExecutor] = None,
+    n_jobs: int = 1
+) -> Tuple[NDArray, NDArray]:
+    """
+    Right-looking blocked LU algorithm, overwrites `a` with L and U
+    and returns encoded row and col permutations.
+    For tournament pivoting `executor` runs tournament games.
+    """
+    n = a.shape[0]
+
+    row_ids = np.arange(n)
+    col_ids = np.arange(n)
+    for k in range(0, n, block_size):
+        k_b = np.minimum(k + block_size, n)
+
+        # factorize panel a[k:, k:k_b], interchanges are applied
+        # to whole rows of `a` in-place (LASWP)
+        panel = a[k:, k:k_b]
+        perm = np.arange(n - k)
+        if piv_option == "tournament":
+            winners, lu_11 = _tournament(panel, executor, n_jobs)
+            _move_on_top(a[k:], winners, perm)
+            # winners are factorized by the last game, only
+            # L21 = A21 U11^-1 remains for the rest of the panel
+            panel[:k_b - k] = lu_11
+            _panel_lower(panel, allow_singular)
+        else:
+            for j in range(k_b - k):
+                if k + j == n - 1:
+                    break
+
+                if piv_option is None:
+                    warnings.warn(
+                        "Disable pivoting is a bad practice, ensure "
+                        "there are no zeros on diagonal of `a` matrix.",
+                        PivotingWarning
+                    )
+                elif piv_option == "row":
+                    # get pivoting elemnt
+                    piv_row = cy_argmax_abs(panel[j:, j])
+                    piv_row += j
+
+                    cy_swap_rows(a[k:], piv_row, j)
+                    perm[j], perm[piv_row] = perm[piv_row], perm[j]
+
+                if panel[j, j] == 0.0:
+                    if not allow_singular:
+                        raise RuntimeError("`a` is a singular matrix.")
+                    continue
+
+                # perform outer product algorithm inside panel
+                panel[j+1:, j] /= panel[j, j]
+                t = workspace.get("update", (n - k - j - 1, k_b - k - j - 1), a.dtype)
+                np.multiply(panel[j+1:, j, np.newaxis], panel[j, j+1:], out=t)
+                panel[j+1:, j+1:] -= t
+
+        if piv_option in ["row", "tournament"]:
+            row_ids[k:] = row_ids[k:][perm]
+
+        if k_b < n:
+            # U12 = L11^-1 A12
+            solve_triangular(a[k:k_b, k:k_b], a[k:k_b, k_b:], lower=True, unit=True)
+            # A22 = A22 - L21 U12
+            t = workspace.get("update", (n - k_b, n - k_b), a.dtype)
+            np.matmul(a[k_b:, k:k_b], a[k:k_b, k_b:], out=t)
+            a[k_b:, k_b:] -= t
+
+    return row_ids, col_ids
+
+def _tournament(
+    panel: NDArray,
+    executor: ThreadPoolExecutor,
+    n_jobs: int
+) -> Tuple[NDArray, NDArray]:
+    """
+    Choose pivot rows of tall `panel` by tournament: row blocks play
+    partial pivoting in parallel, winners of pairs of blocks play again
+    until one set of `panel.shape[1]` rows remains. Return winners in
+    order of choice and their LU factors from the last game.
+    """
+    m, b = panel.shape
+    n_blocks = np.maximum(1, np.minimum(n_jobs, m // b))
+
+    def play(rows):
+        # compiled partial pivoting releases the GIL
+        x = panel[rows]
+        perm = np.arange(rows.size, dtype=np.intp)
+        cy_gepp(x, perm)
+        k = np.minimum(rows.size, b)
+        return rows[perm[:k]], x[:k]
+
+    candidates = np.array_split(np.arange(m), n_blocks)
+    while True:
+        games = list(executor.map(play, candidates))
+        if len(games) == 1:
+            return games[0]
+        candidates = [
+            np.concatenate([rows for rows, _ in games[i:i + 2]])
+            for i in range(0, len(games), 2)
+        ]
+
+def _move_on_top(
+    a: NDArray,
+    rows: NDArray,
+    perm: NDArray
+) -> None:
+    """
+    Interchange whole rows of `a` in-place to put `rows` on top
+    in given order, interchanges are applied to `perm`
+    """
+    # current position of each original row
+    pos = np.arange(a.shape[0])
+    for j, row in enumerate(rows):
+        i = pos[row]
+        cy_swap_rows(a, i, j)
+        pos[perm[j]], pos[perm[i]] = i, j
+        perm[j], perm[i] = perm[i], perm[j]
+
+def _panel_lower(
+    panel: NDArray,
+    allow_singular: bool
+) -> None:
+    """
+    Overwrite rows of `panel` below factorized top block L11 U11
+    with L21 = A21 U11^-1
+    """
+    m, b = panel.shape
+    u_11 = panel[:b]
+    # zero in the last row of `a` needs no division
+    zero_ids = np.flatnonzero(np.diagonal(u_11)[:m - 1] == 0.0)
+    if zero_ids.size > 0 and not allow_singular:
+        raise RuntimeError("`a` is a singular matrix.")
+
+    # zero pivot is kept in U, unit one is used for multipliers
+    u_11[zero_ids, zero_ids] = 1.0
+    # L21 U11 = A21 <=> U11^T L21^T = A21^T, small diagonal
+    # blocks move most of the work into matrix products
+    solve_triangular(u_11, panel[b:].T, lower=False, transposed=True, block_size=16)
+    u_11[zero_ids, zero_ids] = 0.0
+
+def _lu_stacked(
+    a: NDArray,
+    piv_option: Union[None, Literal["row", "col", "full", "rook"]],
+    workspace: Workspace,
+    allow_singular: bool = False
+) -> Tuple[NDArray, NDArray]:
+    """
+    Outer product LU algorithm vectorized across stack of matrices,
+    overwrites `a` with L and U and returns encoded row and col permutations.
+    """
+    k, n = a.shape[0], a.shape[-1]
+    batch_ids = np.arange(k)
+
+    row_ids = np.tile(np.arange(n), (k, 1))
+    col_ids = np.tile(np.arange(n), (k, 1))
+    for i in range(n-1):
+        if piv_option is None:
+            warnings.warn(
+                "Disable pivoting is a bad practice, ensure "
+                "there are no zeros on diagonal of `a` matrix.",
+                PivotingWarning
+            )
+        elif piv_option == "row":
+            # get pivoting elements
+            piv_row = np.argmax(np.abs(a[:, i:, i]), axis=1)
+            piv_row += i
+
+            # interchange rows of `a`
+            _swap_stacked(a, batch_ids, i, piv_row)
+            _swap_stacked(row_ids, batch_ids, i, piv_row)
+        elif piv_option == "col":
+            # get pivoting elements
+            piv_col = np.argmax(np.abs(a[:, i, i:]), axis=1)
+            piv_col += i
+
+            # interchange cols of `a` and note this
+            # permutation in `col_ids`
+            _swap_stacked(np.swapaxes(a, 1, 2), batch_ids, i, piv_col)
+            _swap_stacked(col_ids, batch_ids, i, piv_col)
+        elif piv_option in ["full", "rook"]:
+            # get pivoting elements
+            if piv_option == "full":
+                piv_idx = np.argmax(np.abs(a[:, i:, i:]).reshape(k, -1), axis=1)
+                piv_row, piv_col = np.unravel_index(piv_idx, (n - i, n - i))
+            else:
+                piv_row, piv_col = np.array(
+                    [cy_rook_pivot(a[j, i:, i:]) for j in range(k)]
+                ).T
+            piv_row += i
+            piv_col += i
+
+            # interchange rows of `a`
+            _swap_stacked(a, batch_ids, i, piv_row)
+            _swap_stacked(row_ids, batch_ids, i, piv_row)
+
+            # interchange cols of `a` and note this
+            # permutation in `col_ids`
+            _swap_stacked(np.swapaxes(a, 1, 2), batch_ids, i, piv_col)
+            _swap_stacked(col_ids, batch_ids, i, piv_col)
+
+        piv = a[:, i, i, np.newaxis]
+        singular = piv == 0.0
+        if np.any(singular):
+            if not allow_singular:
+                raise RuntimeError("`a` contains a singular matrix.")
+            # skip elimination step of singular matrices
+            piv = np.where(singular, 1.0, piv)
+            a[:, i+1:, i] *= ~singular
+
+        # perform outer product algorithm
+        a[:, i+1:, i] /= piv
+        t = workspace.get("update", (k, n - i - 1, n - i - 1), a.dtype)
+        np.multiply(a[:, i+1:, i, np.newaxis], a[:, np.newaxis, i, i+1:], out=t)
+        a[:, i+1:, i+1:] -= t
+
+    return row_ids, col_ids
+
+def _swap_stacked(
+    x: NDArray,
+    batch_ids: NDArray,
+    i: int,
+    j: NDArray
+) -> None:
+    # interchange `x[b, i]` and `x[b, j[b]]` for each `b` in stack
+    tmp = x[:, i].copy()
+    x[:, i] = x[batch_ids, j]
+    x[batch_ids, j] = tmp
 
 def lu_solve(
     a: ArrayLike,
     b: ArrayLike,
-    piv_option: Union[None, Literal["row", "col", "full"]] = "row",
+    piv_option: Union[None, Literal["row", "col", "full", "rook", "tournament"]] = "row",
     overwrite_a: bool = False,
-    overwrite_b: bool = False
+    overwrite_b: bool = False,
+    n_jobs: Optional[int] = 1
 ) -> NDArray:
     """
     Solve AX=B using LU decomposition
     
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        square input matrix A
-    b : ArrayLike of shape (n, m)
+    a : ArrayLike of shape (n, n) or (k, n, n)
+        square input matrix A or stack of k matrices
+    b : ArrayLike of shape (n, m) or (k, n, m)
         input matrix B, such that
         m - number of systems A x X[:,i] = B[:,i], i in [1, m]
-    piv_option : ["row", "col", "full"] (default: "row")
+    piv_option : ["row", "col", "full", "rook", "tournament"] (default: "row")
         pivoting strategy:
         - ``None`` no pivoting (bad option)
         - ``"row"`` to interchange rows only
         - ``"col"`` to interchange cols only
         - ``"full"`` to interchange both rows and cols
+        - ``"rook"`` to interchange both rows and cols, pivot is
+          maximal in its row and its col (alternating searches)
+        - ``"tournament"`` to interchange rows only, pivot rows
+          are chosen by tournament (CALU, see `lu`)
 
     overwrite_a : bool (default: False)
         allow to overwrite `a` matrix
     
     overwrite_b : bool (default: False)
         allow to overwrite `b` matrix
+    n_jobs : int or None (default: 1)
+        number of threads, columns of B are split into `n_jobs` chunks
+        solved in parallel after decomposition. ``None`` means ``os.cpu_count()``.
     
     Returns
     -------
-    b : ndarray of shape (n, m)
+    b : ndarray of shape (n, m) or (k, n, m)
         overwriten array `b` with m solution vectors
     """
     copy_a = not overwrite_a
     a = _ensure_ndarray(
         a,
         ensure_square=True,
+        allow_stacked=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     
+    _check_piv_option(piv_option, a.ndim)
+    n_jobs = _check_n_jobs(n_jobs)
+    
     is_b1d = False
-    if b.ndim == 1:
-        b = b[:, np.newaxis]
+    if b.ndim == a.ndim - 1:
+        b = b[..., np.newaxis]
         is_b1d = True
 
     # use workspace effective LU
-    a, row_ids, col_ids = lu(a, piv_option=piv_option, mode="economic", overwrite_a=True)
-
-    n = a.shape[0]
-    b[:] = b[row_ids]
-    b = solve_lower(a, b, overwrite_b=True, unit=True)
-    b = solve_upper(a, b, overwrite_b=True)
-    ids = np.arange(n)
-    b[col_ids] = b[ids]
+    row_ids, col_ids = _lu(a, piv_option)
+    solve_parallel(partial(lu_solve_factored, a, row_ids, col_ids), b, n_jobs)
 
     if is_b1d:
-        b = b.ravel()
+        b = b[..., 0]
 
     return b
     
\ No newline at end of file
@@ -1,12 +1,12 @@
 import numpy as np
 import warnings
+from functools import partial
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal, Tuple, Union
+from typing import Literal, Optional, Tuple, Union
 
-from ..utils._validations import _ensure_ndarray
+from ..utils._validations import _ensure_ndarray, _check_n_jobs, FLOAT_DTYPES
 from ..utils._validations import PivotingWarning
-from ..utils.solve_band import solve_upper_band
-from ..utils.solve import solve_lower
+from ..utils._kernels import solve_parallel, solve_triangular_band, lu_band_forward
 from ..utils.permutation import decode_permutation
 
 def lu_band(
@@ -15,7 +15,8 @@ def lu_band(
     u: int,
     piv_option: Union[None, Literal["row"]] = "row",
     mode: Literal["full", "economic"] = "full",
-    overwrite_a: bool = False
+    overwrite_a: bool = False,
+    storage: Literal["dense", "band"] = "dense"
 ) -> Tuple[NDArray, ...]:
     """
     LU decomposition of square banded matrix A.
@@ -29,8 +30,9 @@ def lu_band(
 
     Paramters
     ---------
-    a : ArrayLike of shape (n, n)
-        input square matrix A assumed to be banded
+    a : ArrayLike of shape (n, n) or (2 * l + u + 1, n)
+        input square matrix A assumed to be banded,
+        or A in compact band storage if `storage == "band"`
     l : int
         lower bandwidth of A
     u : int
@@ -47,21 +49,88 @@ def lu_band(
         
     overwrite_a : bool (default: False)
         allow to overwrite `a` matrix
+    storage : ["dense", "band"] (default: "dense")
+        storage of `a` (see `utils.band.dense_to_band`):
+        - ``"dense"`` square (n, n) matrix
+        - ``"band"`` compact (2 * l + u + 1, n) band storage,
+          A[i, j] is stored in `a[l + u + i - j, j]`, first `l` rows
+          are workspace for fill-in of U due to pivoting.
+          Memory is O(n(l + u)) instead of O(n^2).
     
     Returns
     -------
     if `mode == "full"` than return tuple(L, U, P, Q):
         `l`, `u`, `p`- ndarrays of shape (n, n), such that A = PLU
-    if `mode == "economic"` than return tuple(a, row_ids, col_ids):
-        - `a` - ndarray of shape (n, n) contains L in low triangle, U in up triangle
-        - `row_ids` - ndarray of shape (n,) encoded P
+    if `mode == "economic"` than return tuple(a, piv):
+        - `a` - ndarray of shape (n, n) contains multipliers of L with bandwidth l
+          in low triangle, U with bandwidth l + u in up triangle
+        - `piv` - ndarray of shape (n,), row i was interchanged with row piv[i]
+          on i-th step of elimination (LAPACK-style interchange sequence).
+          Multipliers of L are not permuted by later interchanges.
+    if `mode == "economic"` and `storage == "band"` than return tuple(a, piv):
+        - `a` - ndarray of shape (2 * l + u + 1, n) contains U with bandwidth
+          l + u in first l + u + 1 rows and multipliers of L in last l rows
+        - `piv` - ndarray of shape (n,) interchange sequence as above
     """
     copy = not overwrite_a
+    a = _check_lu_band_args(a, l, u, piv_option, storage, copy)
+
+    if mode not in ["full", "economic"]:
+        raise ValueError(
+            "`mode` must be in ['full', 'economic'],"
+            f" got {mode}."
+        )
+
+    if storage == "dense":
+        piv = _lu_band(a, l, u, piv_option)
+    elif storage == "band":
+        piv = _lu_band_compact(a, l, u, piv_option)
+
+    if mode == "economic":
+        return a, piv
+
+    n = a.shape[1]
+    if storage == "dense":
+        l_full = np.tril(a)
+        np.fill_diagonal(l_full, 1.0)
+        u_full = np.triu(a)
+    elif storage == "band":
+        kv = l + u
+        l_full = np.identity(n, dtype=a.dtype)
+        u_full = np.zeros((n, n), dtype=a.dtype)
+        for i in range(n):
+            k_m = np.minimum(l, n - 1 - i)
+            l_full[i + 1:i + k_m + 1, i] = a[kv + 1:kv + k_m + 1, i]
+            u_b = np.minimum(i + kv + 1, n)
+            cols = np.arange(i, u_b)
+            u_full[i, cols] = a[kv + i - cols, cols]
+    row_ids = _apply_interchanges(l_full, piv)
+    p = decode_permutation(row_ids)
+    return l_full, u_full, p
+
+def _check_lu_band_args(
+    a: ArrayLike,
+    l: int,
+    u: int,
+    piv_option: Union[None, Literal["row"]],
+    storage: Literal["dense", "band"],
+    copy: bool
+) -> NDArray:
+    """
+    Validate arguments of `lu_band` and `lu_band_solve`, return `a`
+    """
+    if storage not in ["dense", "band"]:
+        raise ValueError(
+            "`storage` must be in ['dense', 'band'],"
+            f" got {storage}."
+        )
+
     a = _ensure_ndarray(
         a,
-        ensure_square=True,
+        ensure_square=storage == "dense",
+        ensure_2d=storage == "band",
         copy=copy,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     if piv_option not in [None, "row"]:
@@ -70,22 +139,38 @@ def lu_band(
             f" got {piv_option}."
         )
 
-    if mode not in ["full", "economic"]:
+    if storage == "band" and a.shape[0] != 2 * l + u + 1:
         raise ValueError(
-            "`mode` must be in ['full', 'economic'],"
-            f" got {mode}."
+            "`a` in band storage must have `2 * l + u + 1` rows,"
+            f" got {a.shape[0]} != {2 * l + u + 1}."
         )
 
-    n = a.shape[0]
-
+    n = a.shape[1]
     if l + u + 1 > n:
         raise ValueError(
-            "`l + u + 1` must be <= a.shape[0],"
-            f" got {l + u + 1} > {a.shape[0]}."
+            "`l + u + 1` must be <= n,"
+            f" got {l + u + 1} > {n}."
         )
 
-    row_ids = np.arange(n)
+    return a
+
+def _lu_band(
+    a: NDArray,
+    l: int,
+    u: int,
+    piv_option: Union[None, Literal["row"]]
+) -> NDArray:
+    """
+    Trusted band LU kernel for validated `a` (see `lu_band`),
+    overwrites `a` with L and U and returns interchange sequence.
+    """
+    n = a.shape[0]
+
+    piv = np.arange(n)
     for i in range(n-1):
+        l_b = np.minimum(i + l + 1, n)
+        u_b = np.minimum(i + u + l + 1, n)
+
         if piv_option is None:
             warnings.warn(
                 "Disable pivoting is a bad practice, ensure "
@@ -94,30 +179,90 @@ def lu_band(
             )
         elif piv_option == "row":
             # get pivoting elemnt
-            piv_row = np.argmax(np.abs(a[i:i + l + 1, i]))
+            piv_row = np.argmax(np.abs(a[i:l_b, i]))
             piv_row += i
+            piv[i] = piv_row
             
-            # interchange rows of `a`
-            a[[piv_row, i]] = a[[i, piv_row]]
-            row_ids[[piv_row, i]] = row_ids[[i, piv_row]]
+            # interchange rows of U part of `a`, multipliers
+            # of L stay in place to keep band structure of L
+            a[[piv_row, i], i:u_b] = a[[i, piv_row], i:u_b]
         
         if a[i, i] == 0.0:
             raise RuntimeError("`a` is a singular matrix.")
-        
-        l_b = np.minimum(i + l + 1, n)
-        u_b = np.minimum(i + u + l + 1, n)
 
         a[i + 1:l_b, i] /= a[i, i]
         a[i + 1:l_b, i + 1:u_b] -= a[i + 1:l_b, i, np.newaxis] * a[i, i + 1:u_b]
 
-    if mode == "full":
-        l = np.tril(a)
-        np.fill_diagonal(l, 1.0)
-        u = np.triu(a)
-        p = decode_permutation(row_ids)
-        return l, u, p
-    elif mode == "economic":
-        return a, row_ids
+    return piv
+
+def _apply_interchanges(
+    l: NDArray,
+    piv: NDArray
+) -> NDArray:
+    """
+    Apply interchange sequence to multipliers of unit lower
+    triangle `l` in-place to get A = PLU, return encoded P.
+    """
+    n = piv.size
+    row_ids = np.arange(n)
+    for i in range(n):
+        if piv[i] != i:
+            l[[piv[i], i], :i] = l[[i, piv[i]], :i]
+            row_ids[[piv[i], i]] = row_ids[[i, piv[i]]]
+    return row_ids
+
+def _lu_band_compact(
+    ab: NDArray,
+    l: int,
+    u: int,
+    piv_option: Union[None, Literal["row"]]
+) -> NDArray:
+    """
+    Trusted band LU kernel in compact (2 * l + u + 1, n) band storage.
+    L multipliers are not permuted by later interchanges, so
+    pivots are returned as sequence of interchanges.
+    """
+    n = ab.shape[1]
+
+    # A[i, j] is stored in ab[kv + i - j, j]
+    kv = l + u
+    # clear workspace for fill-in
+    ab[:l] = 0.0
+
+    piv = np.arange(n)
+    for i in range(n-1):
+        k_m = np.minimum(l, n - 1 - i)
+        u_b = np.minimum(i + kv + 1, n)
+        cols = np.arange(i, u_b)
+
+        piv_row = 0
+        if piv_option is None:
+            warnings.warn(
+                "Disable pivoting is a bad practice, ensure "
+                "there are no zeros on diagonal of `a` matrix.",
+                PivotingWarning
+            )
+        elif piv_option == "row":
+            # get pivoting elemnt
+            piv_row = np.argmax(np.abs(ab[kv:kv + k_m + 1, i]))
+            piv[i] = piv_row + i
+
+            # interchange rows of U part of `a`
+            if piv_row != 0:
+                rows = kv + i - cols
+                tmp = ab[rows, cols]
+                ab[rows, cols] = ab[rows + piv_row, cols]
+                ab[rows + piv_row, cols] = tmp
+
+        if ab[kv, i] == 0.0:
+            raise RuntimeError("`a` is a singular matrix.")
+
+        ab[kv + 1:kv + k_m + 1, i] /= ab[kv, i]
+        # A[i + r, c] is stored in ab[kv + i + r - c, c]
+        rows = kv + i + np.arange(1, k_m + 1)[:, np.newaxis] - cols[np.newaxis, 1:]
+        ab[rows, cols[1:]] -= ab[kv + 1:kv + k_m + 1, i, np.newaxis] * ab[kv + i - cols[1:], cols[1:]]
+
+    return piv
 
 def lu_band_solve(
     a: ArrayLike,
@@ -126,7 +271,9 @@ def lu_band_solve(
     b: ArrayLike,
     piv_option: Union[None, Literal["row"]] = "row",
     overwrite_a: bool = False,
-    overwrite_b: bool = False
+    overwrite_b: bool = False,
+    storage: Literal["dense", "band"] = "dense",
+    n_jobs: Optional[int] = 1
 ) -> NDArray:
     """
     Solve AX = B, where A is a square nonsingular matrix
@@ -135,8 +282,9 @@ def lu_band_solve(
     
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        square input matrix A
+    a : ArrayLike of shape (n, n) or (2 * l + u + 1, n)
+        square input matrix A, or A in compact
+        band storage if `storage == "band"`
     l : int
         lower bandwidth of A
     u : int
@@ -154,6 +302,11 @@ def lu_band_solve(
     
     overwrite_b : bool (default: False)
         allow to overwrite `b` matrix
+    storage : ["dense", "band"] (default: "dense")
+        storage of `a` (see `lu_band` for details)
+    n_jobs : int or None (default: 1)
+        number of threads, columns of B are split into `n_jobs` chunks
+        solved in parallel after decomposition. ``None`` means ``os.cpu_count()``.
     
     Returns
     -------
@@ -161,32 +314,77 @@ def lu_band_solve(
         overwriten array `b` with m solution vectors
     """
     copy_a = not overwrite_a
-    a = _ensure_ndarray(
-        a,
-        ensure_square=True,
-        copy=copy_a,
-        dtype="float64"
-    )
+    a = _check_lu_band_args(a, l, u, piv_option, storage, copy_a)
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
+
+    n_jobs = _check_n_jobs(n_jobs)
     
     is_b1d = False
     if b.ndim == 1:
         b = b[:, np.newaxis]
         is_b1d = True
 
-    a, row_ids = lu_band(a, l, u, piv_option=piv_option, mode="economic", overwrite_a=True)
+    if a.shape[1] != b.shape[0]:
+        raise ValueError(
+            "`a` and `b` must have equal number of rows,"
+            f" got {a.shape[1]} and {b.shape[0]}."
+        )
 
-    b[:] = b[row_ids]
-    # L have unknown bandwidth, U have upper bandwidth l + u
-    b = solve_lower(a, b, overwrite_b=True, unit=True)
-    b = solve_upper_band(a, u + l, b, overwrite_b=True)
+    if storage == "dense":
+        piv = _lu_band(a, l, u, piv_option)
+
+        solve_parallel(partial(_lu_band_solve, a, l, u, piv), b, n_jobs)
+    elif storage == "band":
+        piv = _lu_band_compact(a, l, u, piv_option)
+
+        solve_parallel(partial(_lu_band_solve_compact, a, l, u, piv), b, n_jobs)
 
     if is_b1d:
         b = b.ravel()
 
     return b
+
+def _lu_band_solve(
+    a: NDArray,
+    l: int,
+    u: int,
+    piv: NDArray,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with economic dense band LU decomposition, overwrites `b`
+    """
+    # L have bandwidth l, U have upper bandwidth l + u
+    lu_band_forward(a, l, piv, b)
+    return solve_triangular_band(a, b, lower=False, bw=u + l)
+
+def _lu_band_solve_compact(
+    a: NDArray,
+    l: int,
+    u: int,
+    piv: NDArray,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with economic compact band LU decomposition, overwrites `b`
+    """
+    n = a.shape[1]
+    kv = l + u
+    # apply interchanges and L multipliers in one forward sweep
+    for i in range(n-1):
+        if piv[i] != i:
+            b[[piv[i], i]] = b[[i, piv[i]]]
+        k_m = np.minimum(l, n - 1 - i)
+        b[i + 1:i + k_m + 1] -= a[kv + 1:kv + k_m + 1, i, np.newaxis] * b[i]
+    # column oriented back substitution with U of bandwidth l + u
+    for i in range(n-1, -1, -1):
+        b[i] /= a[kv, i]
+        l_b = np.maximum(i - kv, 0)
+        b[l_b:i] -= a[kv - i + l_b:kv, i, np.newaxis] * b[i]
+
+    return b
\ No newline at end of file
@@ -0,0 +1,337 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from typing import Literal, Optional, Union
+
+from .lu import lu, _lu
+from .lu_update import _bennett
+from ..utils._validations import _ensure_ndarray, _check_rhs, FLOAT_DTYPES
+from ..utils._kernels import solve_triangular
+from ..utils.permutation import permutation_sign
+
+class LUFactor:
+    """
+    LU (PLU, LUQ, PLUQ) decomposition of square matrix A
+    kept in economic form for repeated solves.
+    Each solve costs O(n^2) instead of O(n^3).
+
+    Factors can be updated in O(n^2) after rank-1 change of A (`update`,
+    Bennett's algorithm) or after replacement of one column of A
+    (`replace_column`, Forrest-Tomlin). Forrest-Tomlin update keeps L and
+    stores U separately in permuted (logical) order together with row
+    eta transformations, solves with updated factors cost O(n^2 + k * n)
+    for k replaced columns. A is refactorized from scratch after
+    `refactor_threshold` updates.
+
+    Parameters
+    ----------
+    a : ndarray of shape (n, n)
+        contains L in low triangle, U in up triangle
+    row_ids : ndarray of shape (n,)
+        encoded P
+    col_ids : ndarray of shape (n,)
+        encoded Q
+    piv_option : ["row", "col", "full", "rook", "tournament"] (default: "row")
+        pivoting strategy used for refactorization
+    refactor_threshold : int or None (default: 50)
+        number of updates after which A is refactorized,
+        ``None`` disables refactorization
+    """
+    def __init__(
+        self,
+        a: NDArray,
+        row_ids: NDArray,
+        col_ids: NDArray,
+        piv_option: Union[None, Literal["row", "col", "full", "rook", "tournament"]] = "row",
+        refactor_threshold: Optional[int] = 50
+    ):
+        if refactor_threshold is not None and (
+            not isinstance(refactor_threshold, int) or refactor_threshold < 1
+        ):
+            raise ValueError(
+                "`refactor_threshold` must be None or a positive integer,"
+                f" got {refactor_threshold}."
+            )
+
+        self.a = a
+        self.row_ids = row_ids
+        self.col_ids = col_ids
+        self.piv_option = piv_option
+        self.refactor_threshold = refactor_threshold
+        self.n_updates = 0
+
+        # Forrest-Tomlin state: U, its logical order and row etas
+        self.u = None
+        self.order = None
+        self.etas = []
+
+    @property
+    def n(self) -> int:
+        return self.a.shape[0]
+
+    def solve(
+        self,
+        b: ArrayLike,
+        overwrite_b: bool = False
+    ) -> NDArray:
+        """
+        Solve AX = B using stored LU decomposition
+
+        Parameters
+        ----------
+        b : ArrayLike of shape (n, m)
+            input matrix B, such that
+            m - number of systems A x X[:,i] = B[:,i], i in [1, m]
+        overwrite_b : bool (default: False)
+            allow to overwrite `b` matrix
+
+        Returns
+        -------
+        b : ndarray of shape (n, m)
+            overwriten array `b` with m solution vectors
+        """
+        b, is_b1d = _check_rhs(b, self.n, overwrite_b)
+
+        b[:] = b[self.row_ids]
+        solve_triangular(self.a, b, lower=True, unit=True)
+        if self.u is None:
+            solve_triangular(self.a, b, lower=False)
+        else:
+            for p, rest, m in self.etas:
+                b[p] -= np.dot(m, b[rest])
+            u = self.u[np.ix_(self.order, self.order)]
+            b[self.order] = solve_triangular(u, b[self.order], lower=False)
+        ids = np.arange(self.n)
+        b[self.col_ids] = b[ids]
+
+        if is_b1d:
+            b = b.ravel()
+
+        return b
+
+    def solve_transposed(
+        self,
+        b: ArrayLike,
+        overwrite_b: bool = False
+    ) -> NDArray:
+        """
+        Solve A^T X = B using stored LU decomposition
+
+        Parameters
+        ----------
+        b : ArrayLike of shape (n, m)
+            input matrix B, such that
+            m - number of systems A^T x X[:,i] = B[:,i], i in [1, m]
+        overwrite_b : bool (default: False)
+            allow to overwrite `b` matrix
+
+        Returns
+        -------
+        b : ndarray of shape (n, m)
+            overwriten array `b` with m solution vectors
+        """
+        b, is_b1d = _check_rhs(b, self.n, overwrite_b)
+
+        # A^T = Q^T U^T L^T P^T
+        b[:] = b[self.col_ids]
+        if self.u is None:
+            solve_triangular(self.a, b, lower=False, transposed=True)
+        else:
+            u = self.u[np.ix_(self.order, self.order)]
+            b[self.order] = solve_triangular(u, b[self.order], lower=False, transposed=True)
+            for p, rest, m in reversed(self.etas):
+                b[rest] -= m[:, np.newaxis] * b[p]
+        solve_triangular(self.a, b, lower=True, transposed=True, unit=True)
+        ids = np.arange(self.n)
+        b[self.row_ids] = b[ids]
+
+        if is_b1d:
+            b = b.ravel()
+
+        return b
+
+    def det(self) -> float:
+        """
+        Get determinant of A using identity
+        det(A) = det(P)*det(L)*det(U)*det(Q) = det(P)*det(U)*det(Q)
+        """
+        det_sign = permutation_sign(self.row_ids) * permutation_sign(self.col_ids)
+        u = self.a if self.u is None else self.u
+        return det_sign * np.prod(np.diag(u))
+
+    def inv(self) -> NDArray:
+        """
+        Get inverse matrix A^-1
+        """
+        b = np.identity(self.n, dtype=self.a.dtype)
+        return self.solve(b, overwrite_b=True)
+
+    def update(
+        self,
+        x: ArrayLike,
+        y: ArrayLike
+    ) -> None:
+        """
+        Update factors in-place to decompose A + xy^T using Bennett's
+        algorithm in O(n^2). Permutations are kept, if there are replaced
+        columns (see `replace_column`) A is refactorized first.
+
+        Parameters
+        ----------
+        x : ArrayLike of shape (n,)
+            left vector of rank-1 update
+        y : ArrayLike of shape (n,)
+            right vector of rank-1 update
+        """
+        x = self._check_v(x, "x")
+        y = self._check_v(y, "y")
+
+        if self.u is not None:
+            self.refactor()
+
+        _bennett(self.a, x[self.row_ids], y[self.col_ids])
+        self._count_update()
+
+    def replace_column(
+        self,
+        j: int,
+        v: ArrayLike
+    ) -> None:
+        """
+        Update factors in-place to decompose A with column `j`
+        replaced by `v` using Forrest-Tomlin update in O(n^2).
+
+        Parameters
+        ----------
+        j : int
+            index of column of A to replace
+        v : ArrayLike of shape (n,)
+            new column of A
+        """
+        if not 0 <= j < self.n:
+            raise ValueError(
+                f"`j` must be in [0, {self.n}),"
+                f" got {j}."
+            )
+        v = self._check_v(v, "v")
+
+        if self.u is None:
+            self.u = np.triu(self.a)
+            self.order = np.arange(self.n)
+
+        # spike column s = R_k ... R_1 L^-1 P^T v
+        s = solve_triangular(self.a, v[self.row_ids, np.newaxis], lower=True, unit=True)[:, 0]
+        for p, rest, m in self.etas:
+            s[p] -= np.dot(m, s[rest])
+
+        # column `p` of U is replaced with spike, row `p` and col `p` are
+        # moved to the end of logical order, row `p` is eliminated by rows
+        # below it: m^T U_22 = U[p, rest]
+        p = np.flatnonzero(self.col_ids == j)[0]
+        pos = np.flatnonzero(self.order == p)[0]
+        rest = self.order[pos+1:]
+        u_22 = self.u[np.ix_(rest, rest)]
+        m = solve_triangular(u_22, self.u[p, rest, np.newaxis], lower=False, transposed=True)[:, 0]
+
+        u_pp = s[p] - np.dot(m, s[rest])
+        if u_pp == 0.0:
+            raise RuntimeError("`a` is a singular matrix.")
+
+        self.u[:, p] = s
+        self.u[p, rest] = 0.0
+        self.u[p, p] = u_pp
+        self.order = np.concatenate([self.order[:pos], rest, [p]])
+        self.etas.append((p, rest, m))
+        self._count_update()
+
+    def refactor(self) -> None:
+        """
+        Refactorize A from current factors in O(n^3),
+        drop accumulated Forrest-Tomlin transformations.
+        """
+        if self.u is None:
+            u = np.triu(self.a)
+        else:
+            # R^-1 = I + e_p m^T for each row eta R
+            u = self.u.copy()
+            for p, rest, m in reversed(self.etas):
+                u[p] += np.dot(m, u[rest])
+        l = np.tril(self.a, -1)
+        np.fill_diagonal(l, 1.0)
+
+        a = np.empty((self.n, self.n), dtype=self.a.dtype)
+        a[np.ix_(self.row_ids, self.col_ids)] = np.dot(l, u)
+        self.row_ids, self.col_ids = _lu(a, self.piv_option)
+        self.a = a
+
+        self.n_updates = 0
+        self.u = None
+        self.order = None
+        self.etas = []
+
+    def _count_update(self):
+        self.n_updates += 1
+        if self.refactor_threshold is not None and self.n_updates >= self.refactor_threshold:
+            self.refactor()
+
+    def _check_v(self, v, name):
+        v = _ensure_ndarray(
+            v,
+            ensure_1d=True,
+            dtype=FLOAT_DTYPES
+        )
+
+        if v.shape[0] != self.n:
+            raise ValueError(
+                f"`{name}` must have shape ({self.n},),"
+                f" got {v.shape}."
+            )
+
+        return v
+
+def lu_factor(
+    a: ArrayLike,
+    piv_option: Union[None, Literal["row", "col", "full", "rook", "tournament"]] = "row",
+    overwrite_a: bool = False,
+    refactor_threshold: Optional[int] = 50
+) -> LUFactor:
+    """
+    Get LU decomposition of square matrix A as
+    reusable factorization object.
+
+    Parameters
+    ----------
+    a : ArrayLike of shape (n, n)
+        input square matrix to decompose
+    piv_option : ["row", "col", "full", "rook", "tournament"] (default: "row")
+        pivoting strategy:
+        - ``None`` no pivoting (bad option)
+        - ``"row"`` to interchange rows only
+        - ``"col"`` to interchange cols only
+        - ``"full"`` to interchange both rows and cols
+        - ``"rook"`` to interchange both rows and cols, pivot is
+          maximal in its row and its col (alternating searches)
+        - ``"tournament"`` to interchange rows only, pivot rows
+          are chosen by tournament (CALU, see `lu`)
+
+    overwrite_a : bool (default: False)
+        allow to overwrite `a` matrix
+    refactor_threshold : int or None (default: 50)
+        number of updates (see `LUFactor.update` and `LUFactor.replace_column`)
+        after which A is refactorized, ``None`` disables refactorization
+
+    Returns
+    -------
+    factor : LUFactor
+        object with `solve`, `solve_transposed`, `det`, `inv`,
+        `update` and `replace_column` methods
+    """
+    copy_a = not overwrite_a
+    a = _ensure_ndarray(
+        a,
+        ensure_square=True,
+        copy=copy_a,
+        dtype=FLOAT_DTYPES
+    )
+
+    a, row_ids, col_ids = lu(a, piv_option=piv_option, mode="economic", overwrite_a=True)
+    return LUFactor(a, row_ids, col_ids, piv_option=piv_option, refactor_threshold=refactor_threshold)
@@ -0,0 +1,93 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from typing import Tuple
+
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
+
+def lu_update(
+    a: ArrayLike,
+    row_ids: ArrayLike,
+    col_ids: ArrayLike,
+    x: ArrayLike,
+    y: ArrayLike,
+    overwrite_a: bool = False
+) -> Tuple[NDArray, NDArray, NDArray]:
+    """
+    Get LU decomposition of A + xy^T from economic LU decomposition
+    of A (see `lu`) using Bennett's algorithm in O(n^2).
+    Permutations are kept, so no pivoting is performed during update,
+    refactorize A + xy^T if update fails or loses accuracy.
+
+    Parameters
+    ----------
+    a : ArrayLike of shape (n, n)
+        contains L in low triangle, U in up triangle
+    row_ids : ArrayLike of shape (n,)
+        encoded P
+    col_ids : ArrayLike of shape (n,)
+        encoded Q
+    x : ArrayLike of shape (n,)
+        left vector of rank-1 update
+    y : ArrayLike of shape (n,)
+        right vector of rank-1 update
+    overwrite_a : bool (default: False)
+        allow to overwrite `a` matrix
+
+    Returns
+    -------
+    tuple(a, row_ids, col_ids):
+        - `a` - ndarray of shape (n, n) contains L in low triangle, U in up triangle
+        - `row_ids` - ndarray of shape (n,) encoded P
+        - `col_ids` - ndarray of shape (n,) encoded Q
+    """
+    copy_a = not overwrite_a
+    a = _ensure_ndarray(
+        a,
+        ensure_square=True,
+        copy=copy_a,
+        dtype=FLOAT_DTYPES
+    )
+    row_ids = _ensure_ndarray(row_ids, ensure_1d=True, dtype="int64")
+    col_ids = _ensure_ndarray(col_ids, ensure_1d=True, dtype="int64")
+    x = _ensure_ndarray(x, ensure_1d=True, dtype=FLOAT_DTYPES)
+    y = _ensure_ndarray(y, ensure_1d=True, dtype=FLOAT_DTYPES)
+
+    n = a.shape[0]
+    for name, v in [("row_ids", row_ids), ("col_ids", col_ids), ("x", x), ("y", y)]:
+        if v.shape[0] != n:
+            raise ValueError(
+                f"`{name}` must have shape ({n},),"
+                f" got {v.shape}."
+            )
+
+    # A[row_ids][:, col_ids] + x[row_ids] y[col_ids]^T = LU + xy^T
+    _bennett(a, x[row_ids], y[col_ids])
+
+    return a, row_ids, col_ids
+
+def _bennett(
+    a: NDArray,
+    x: NDArray,
+    y: NDArray
+) -> None:
+    """
+    Overwrite `a` containing L and U with factors of LU + xy^T,
+    `x` and `y` are overwritten.
+    """
+    n = a.shape[0]
+    for k in range(n):
+        u_kk = a[k, k]
+        a[k, k] += x[k] * y[k]
+        if a[k, k] == 0.0:
+            raise RuntimeError(
+                "Zero pivot during update, refactorize the matrix."
+            )
+
+        # rest of update is rank-1 update of trailing factors:
+        # L_22 U_22 + (x_2 - x_k l) (u_kk y_2 - y_k u^T) / u'_kk
+        y_2 = (u_kk * y[k+1:] - y[k] * a[k, k+1:]) / a[k, k]
+        a[k, k+1:] += x[k] * y[k+1:]
+        y[k+1:] = y_2
+
+        x[k+1:] -= x[k] * a[k+1:, k]
+        a[k+1:, k] += y[k] * x[k+1:] / a[k, k]
@@ -3,7 +3,7 @@ from numpy.typing import ArrayLike, NDArray
 from typing import Literal, Tuple, Union
 
 from ..transforms.givens import givens
-from ..utils._validations import _ensure_ndarray
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
 
 def qr_givens(
     a: ArrayLike,
@@ -39,18 +39,18 @@ def qr_givens(
         a,
         ensure_2d=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     m, n = a.shape
     k = np.minimum(m, n)
 
     if mode in ["full", "economic"]:
-        q = np.identity(m)
+        q = np.identity(m, dtype=a.dtype)
 
     for i in range(k):
         for j in range(m-1, i, -1):
-            g = givens(a[j - 1, i], a[j, i], mode="ndarray")
+            g = givens(a[j - 1, i], a[j, i], mode="ndarray").astype(a.dtype, copy=False)
             a[j - 1:j + 1, i:] = np.dot(g, a[j - 1:j + 1, i:])
             if mode in ["full", "economic"]:
                 q[:, j - 1:j + 1] = np.dot(q[:, j - 1:j + 1], g.T)
@@ -2,7 +2,7 @@ import numpy as np
 from numpy.typing import ArrayLike, NDArray
 from typing import Tuple
 
-from ..utils._validations import _ensure_ndarray
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
 
 def qr_gram(
     a: ArrayLike,
@@ -32,12 +32,12 @@ def qr_gram(
         a,
         ensure_2d=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     m, n = a.shape
     k = np.minimum(m, n)
-    r = np.zeros((n, n))
+    r = np.zeros((n, n), dtype=a.dtype)
     for i in range(k):
         r[i, i] = np.linalg.norm(a[:, i])
         a[:, i] /= r[i, i]
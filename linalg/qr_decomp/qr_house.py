@@ -1,15 +1,18 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal, Tuple, Union
+from typing import Literal, Optional, Tuple, Union
 
-from ..transforms.householder import house
-from ..utils._validations import _ensure_ndarray
+from ..transforms.householder import house, _house_left
+from ..transforms.cy_householder import cy_house
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
+from ..utils.workspace import Workspace
 from ..utils.permutation import decode_permutation
 
 def qr_house(
     a: ArrayLike,
     mode: Literal["full", "economic", "r"] = "full",
-    overwrite_a=False
+    overwrite_a=False,
+    workspace: Optional[Workspace] = None
 ) -> Union[Tuple[NDArray, ...], NDArray]:
     """
     Get QR decomposition of rectangular matrix A (``A = QR``),
@@ -24,6 +27,9 @@ def qr_house(
         return options (see ``Returns`` section for details)
     overwrite_a : bool (default: False)
         allow to overwrite ``a``
+    workspace : Workspace or None (default: None)
+        reusable scratch buffers of reflections,
+        ``None`` allocates them once per call
 
     Returns
     -------
@@ -40,7 +46,7 @@ def qr_house(
         a,
         ensure_2d=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     if mode not in ["full", "economic", "r"]:
@@ -49,6 +55,9 @@ def qr_house(
             f" got {mode}."
         )
 
+    if workspace is None:
+        workspace = Workspace()
+
     m, n = a.shape
     k = np.minimum(m, n)
     if mode in ["full", "economic"]:
@@ -56,23 +65,25 @@ def qr_house(
     
     # compute R matrix and Householder vectors
     for i in range(k):
-        beta, v = house(a[i:, i], i=0)
+        v = workspace.get("v", (m - i,), a.dtype)
+        v[:] = a[i:, i]
+        beta = cy_house(v, 0)
         if mode in ["full", "economic"]:
             betas[i] = beta
-        a[i:, i:] -= beta * np.dot(np.outer(v, v), a[i:, i:])
+        _house_left(a[i:, i:], v, beta, workspace)
         a[i + 1:, i] = v[1:m - i]
 
     # compute Q matrix if needed
     if mode in ["full", "economic"]:
         if mode == "full":
-            q = np.identity(m)
+            q = np.identity(m, dtype=a.dtype)
         elif mode == "economic":
-            q = np.eye(m, k)
-        v = np.zeros(m)
+            q = np.eye(m, k, dtype=a.dtype)
+        v = np.zeros(m, dtype=a.dtype)
         for i in range(k-1, -1, -1):
             v[i] = 1.0
             v[i + 1:] = a[i + 1:, i]
-            q[i:, i:] -= betas[i] * np.dot(np.outer(v[i:], v[i:]), q[i:, i:])
+            _house_left(q[i:, i:], v[i:], betas[i], workspace)
 
     if mode == "full":
         return q, np.triu(a)
@@ -125,7 +136,7 @@ def qr_house_piv(
         a,
         ensure_2d=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     if mode not in ["full", "economic", "r"]:
@@ -159,10 +170,10 @@ def qr_house_piv(
     
     if mode in ["full", "economic"]:
         if mode == "full":
-            q = np.identity(m)
+            q = np.identity(m, dtype=a.dtype)
         elif mode == "economic":
-            q = np.eye(m, k)
-        v = np.zeros(m)
+            q = np.eye(m, k, dtype=a.dtype)
+        v = np.zeros(m, dtype=a.dtype)
         for i in range(k-1, -1, -1):
             v[i] = 1.0
             v[i + 1:] = a[i + 1:, i]
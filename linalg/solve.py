@@ -1,18 +1,31 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal
+from typing import Literal, Optional, Tuple
 
-from .utils._validations import _ensure_ndarray
-from .lu.lu import lu_solve
-from .sym_decomp.ldlt import sym_solve
-from .sympos_decomp.cholesky import sympos_solve
+from .utils._validations import _ensure_ndarray, FLOAT_DTYPES
+from .utils._kernels import solve_triangular, solve_diagonal
+from .utils._kernels import lu_solve_factored, ldlt_solve_factored, cho_solve_factored
+from .lu.lu import _lu
+from .lu.lu_factor import lu_factor
+from .sym_decomp.ldlt import _ldlt
+from .sym_decomp.ldlt_factor import ldlt_factor
+from .sympos_decomp.cholesky import _cholesky
+from .sympos_decomp.cho_factor import cho_factor
+from .solve_band import _solve_band, _solves_band
+from .solve_tridiag import _solve_tridiag
+
+# max number of refinement steps as in LAPACK DSGESV
+MIXED_MAX_ITER = 30
+# band solvers are used by "auto" mode if l + u + 1 <= n * AUTO_BAND_RATIO
+AUTO_BAND_RATIO = 0.25
 
 def solve(
     a: ArrayLike,
     b: ArrayLike,
-    assume_a: Literal["gen", "sym", "pos"] = "gen",
+    assume_a: Literal["gen", "sym", "pos", "auto"] = "gen",
     overwrite_a: bool = False,
-    overwrite_b: bool = False
+    overwrite_b: bool = False,
+    precision: Literal["double", "mixed"] = "double"
 ) -> NDArray:
     """
     Interface to solve AX = B, where A is square full-rank
@@ -25,7 +38,7 @@ def solve(
     b : ArrayLike of shape (n, m)
         input matrix B, such that
         m - number of systems A x X[:,i] = B[:,i], i in [1, m]
-    assume_a : ["gen", "sym", "pos"] (default: "gen")
+    assume_a : ["gen", "sym", "pos", "auto"] (default: "gen")
         Assume type of input matrix A:
         - ``"gen"`` - general square full-rank matrix,
           use LU decomposition to solve
@@ -33,11 +46,26 @@ def solve(
           use LDL^T decomposition to solve
         - ``"pos"`` - symmetric positive definite full-rank matrix,
           use Cholesky decomposition to solve
+        - ``"auto"`` - detect structure of A with O(n^2) checks and use
+          the cheapest solver: diagonal, triangular, diagonally dominant
+          tridiagonal (Thomas algorithm), banded (band LU, band Cholesky
+          or band LDL^T if A is symmetric), symmetric with positive
+          diagonal (Cholesky, LDL^T if A is not SPD), symmetric (LDL^T)
+          or general (LU). Symmetry is checked exactly.
     
     overwrite_a : bool (default: False)
         allow to overwrite `a`
     overwrite_b : bool (default: False)
         allow to overwrite `b`
+    precision : ["double", "mixed"] (default: "double")
+        precision of decomposition:
+        - ``"double"`` - decompose A in its own dtype (float64
+          or float32), no refinement
+        - ``"mixed"`` - decompose A in float32 and refine solution
+          with float64 residuals until float64 backward error is reached:
+          ||B - AX||_inf <= sqrt(n) * eps * ||A||_inf * ||X||_inf per column.
+          If float32 decomposition fails or refinement stalls,
+          float64 decomposition is used.
     
     Returns
     -------
@@ -49,13 +77,13 @@ def solve(
         a,
         ensure_square=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     
     if a.shape[0] != b.shape[0]:
@@ -64,17 +92,182 @@ def solve(
             f" got {a.shape[0]} and {b.shape[0]}."
         )
 
-    if assume_a not in ["gen", "sym", "pos"]:
+    if assume_a not in ["gen", "sym", "pos", "auto"]:
         raise ValueError(
-            "Unknown `assume_a` option: availible ['gen', 'sym', 'pos'],"
+            "Unknown `assume_a` option: availible ['gen', 'sym', 'pos', 'auto'],"
             f" got {assume_a}."
         )
 
+    if precision not in ["double", "mixed"]:
+        raise ValueError(
+            "`precision` must be in ['double', 'mixed'],"
+            f" got {precision}."
+        )
+
+    is_b1d = False
+    if b.ndim == 1:
+        b = b[:, np.newaxis]
+        is_b1d = True
+
+    is_auto = assume_a == "auto"
+    if is_auto:
+        assume_a, l, u = _detect_structure(a)
+        if assume_a not in ["gen", "sym", "pos"]:
+            b = _solve_structured(a, b, assume_a, l, u)
+            if is_b1d:
+                b = b.ravel()
+            return b
+
+    if precision == "mixed":
+        x = _solve_mixed(a, b, assume_a)
+        if x is not None:
+            if is_b1d:
+                x = x.ravel()
+            return x
+
+    # `a` and `b` are validated, call decomposition kernels directly
     if assume_a == "gen":
-        b = lu_solve(a, b, overwrite_a=True, overwrite_b=True)
+        row_ids, col_ids = _lu(a)
+        lu_solve_factored(a, row_ids, col_ids, b)
     elif assume_a == "sym":
-        b = sym_solve(a, b, overwrite_a=True, overwrite_b=True)
+        diag_ids = _ldlt(a)
+        ldlt_solve_factored(a, diag_ids, b)
+    elif assume_a == "pos" and not is_auto:
+        _cholesky(a)
+        cho_solve_factored(a, b)
     elif assume_a == "pos":
-        b = sympos_solve(a, b, overwrite_a=True, overwrite_b=True)
+        # A is only likely SPD, keep diagonal to restore A on failure
+        diag = np.diag(a).copy()
+        try:
+            _cholesky(a)
+            cho_solve_factored(a, b)
+        except RuntimeError:
+            # Cholesky overwrites lower triangle and diagonal only
+            a[:] = np.triu(a, 1) + np.triu(a, 1).T
+            np.fill_diagonal(a, diag)
+            diag_ids = _ldlt(a)
+            ldlt_solve_factored(a, diag_ids, b)
+
+    if is_b1d:
+        b = b.ravel()
     
-    return b
\ No newline at end of file
+    return b
+
+def _detect_structure(
+    a: NDArray
+) -> Tuple[str, int, int]:
+    """
+    Detect structure of square matrix A with vectorized O(n^2) checks,
+    return tuple(kind, l, u), where `l`, `u` are lower and upper
+    bandwidths and `kind` is one of "diag", "lower", "upper",
+    "tridiag", "band", "sym_band", "pos", "sym", "gen".
+    """
+    n = a.shape[0]
+    l = _bandwidth(a, lower=True)
+    u = _bandwidth(a, lower=False)
+
+    if l == 0 and u == 0:
+        return "diag", l, u
+    if l == 0:
+        return "upper", l, u
+    if u == 0:
+        return "lower", l, u
+
+    diag = np.diag(a)
+    if l == 1 and u == 1:
+        # Thomas algorithm is stable for diagonally dominant A
+        off = np.zeros(n)
+        off[1:] += np.abs(np.diag(a, -1))
+        off[:-1] += np.abs(np.diag(a, 1))
+        if np.all(np.abs(diag) > off):
+            return "tridiag", l, u
+
+    is_sym = l == u and np.array_equal(a, a.T)
+    if l + u + 1 <= n * AUTO_BAND_RATIO:
+        return ("sym_band" if is_sym else "band"), l, u
+    if is_sym:
+        return ("pos" if np.all(diag > 0.0) else "sym"), l, u
+    return "gen", l, u
+
+def _bandwidth(
+    a: NDArray,
+    lower: bool
+) -> int:
+    """
+    Lower or upper bandwidth of square `a`: offset of the outermost
+    diagonal with nonzero entry. Diagonals are strided views checked
+    from the corner inwards, so dense `a` exits at first diagonals.
+    """
+    n = a.shape[0]
+    sign = -1 if lower else 1
+    for k in range(n - 1, 0, -1):
+        if np.any(np.diagonal(a, sign * k)):
+            return k
+    return 0
+
+def _solve_structured(
+    a: NDArray,
+    b: NDArray,
+    kind: str,
+    l: int,
+    u: int
+) -> NDArray:
+    """
+    Solve AX = B with structured solver chosen by `_detect_structure`,
+    `a` and `b` of shape (n, m) are overwritten.
+    """
+    if kind in ["diag", "lower", "upper"]:
+        if np.any(np.diag(a) == 0.0):
+            raise RuntimeError("`a` is a singular matrix.")
+        if kind == "diag":
+            return solve_diagonal(a, b)
+        return solve_triangular(a, b, lower=kind == "lower")
+    elif kind == "tridiag":
+        return _solve_tridiag(np.diag(a, -1), np.diag(a).copy(), np.diag(a, 1), b)
+    elif kind == "band":
+        return _solve_band(a, l, u, b)
+    elif kind == "sym_band":
+        if np.all(np.diag(a) > 0.0):
+            # keep `a` for LDL^T fallback, Cholesky fails before `b` is touched
+            try:
+                return _solves_band(a.copy(), l, b, ensure_pos=True)
+            except RuntimeError:
+                pass
+        return _solves_band(a, l, b, ensure_pos=False)
+
+def _solve_mixed(
+    a: NDArray,
+    b: NDArray,
+    assume_a: Literal["gen", "sym", "pos"]
+) -> Optional[NDArray]:
+    """
+    Solve AX = B with float32 decomposition and float64 iterative
+    refinement, return None if refinement does not converge.
+    """
+    factorize = {"gen": lu_factor, "sym": ldlt_factor, "pos": cho_factor}[assume_a]
+    try:
+        factor = factorize(a.astype(np.float32), overwrite_a=True)
+    except RuntimeError:
+        return None
+
+    eps = np.finfo(np.float64).eps
+    tol = np.sqrt(a.shape[0]) * eps * np.linalg.norm(a, np.inf)
+
+    x = factor.solve(b.astype(np.float32), overwrite_b=True).astype(np.float64)
+    err_prev = np.inf
+    for _ in range(MIXED_MAX_ITER):
+        r = b - np.dot(a, x)
+        # relative residual of the worst column, zero column
+        # of B has zero solution and residual
+        scale = np.maximum(tol * np.max(np.abs(x), axis=0), np.finfo(np.float64).tiny)
+        err = np.max(np.max(np.abs(r), axis=0) / scale)
+        if err <= 1.0:
+            return x
+        # stop if refinement stalls or diverges
+        if not np.isfinite(err) or err > 0.5 * err_prev:
+            return None
+        err_prev = err
+
+        x += factor.solve(r.astype(np.float32), overwrite_b=True)
+
+    return None
\ No newline at end of file
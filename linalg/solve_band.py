@@ -1,10 +1,14 @@
 import numpy as np
+from functools import partial
 from numpy.typing import ArrayLike, NDArray
+from typing import Literal, Optional
 
-from .utils._validations import _ensure_ndarray
-from .lu.lu_band import lu_band_solve
-from .sym_decomp.ldlt_band import sym_band_solve
-from .sympos_decomp.cholesky_band import sympos_band_solve
+from .utils._validations import _ensure_ndarray, _check_n_jobs, FLOAT_DTYPES
+from .utils._kernels import solve_parallel
+from .lu.lu_band import _check_lu_band_args, _lu_band, _lu_band_compact
+from .lu.lu_band import _lu_band_solve, _lu_band_solve_compact
+from .sym_decomp.ldlt_band import _ldlt_band, _ldlt_band_solve
+from .sympos_decomp.cholesky_band import _cholesky_band, _cho_band_solve
 
 def solve_band(
     a: ArrayLike,
@@ -12,7 +16,9 @@ def solve_band(
     u: int,
     b: ArrayLike,
     overwrite_a: bool = False,
-    overwrite_b: bool = False
+    overwrite_b: bool = False,
+    storage: Literal["dense", "band"] = "dense",
+    n_jobs: Optional[int] = 1
 ) -> NDArray:
     """
     Solve AX = B, where A is a banded matrix.
@@ -20,8 +26,9 @@ def solve_band(
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        square input matrix A
+    a : ArrayLike of shape (n, n) or (2 * l + u + 1, n)
+        square input matrix A, or A in compact
+        band storage if `storage == "band"`
     l : int
         lower bandwidth of A
     u : int
@@ -35,6 +42,15 @@ def solve_band(
     
     overwrite_b : bool (default: False)
         allow to overwrite `b` matrix
+    storage : ["dense", "band"] (default: "dense")
+        storage of `a`:
+        - ``"dense"`` square (n, n) matrix
+        - ``"band"`` compact (2 * l + u + 1, n) band storage,
+          A[i, j] is stored in `a[l + u + i - j, j]`, first `l` rows
+          are workspace (see `utils.band.dense_to_band`)
+    n_jobs : int or None (default: 1)
+        number of threads, columns of B are split into `n_jobs` chunks
+        solved in parallel after decomposition. ``None`` means ``os.cpu_count()``.
     
     Returns
     -------
@@ -42,35 +58,61 @@ def solve_band(
         overwriten array `b` with m solution vectors
     """
     copy_a = not overwrite_a
-    a = _ensure_ndarray(
-        a,
-        ensure_square=True,
-        copy=copy_a,
-        dtype="float64"
-    )
+    a = _check_lu_band_args(a, l, u, "row", storage, copy_a)
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     
-    if a.shape[0] != b.shape[0]:
+    if a.shape[1] != b.shape[0]:
         raise ValueError(
             "`a` and `b` must have equal number of columns,"
-            f" got {a.shape[0]} and {b.shape[0]}."
+            f" got {a.shape[1]} and {b.shape[0]}."
         )
 
-    b = lu_band_solve(a, l, u, b, overwrite_a=True, overwrite_b=True)
+    n_jobs = _check_n_jobs(n_jobs)
+
+    is_b1d = False
+    if b.ndim == 1:
+        b = b[:, np.newaxis]
+        is_b1d = True
+
+    _solve_band(a, l, u, b, storage, n_jobs)
+
+    if is_b1d:
+        b = b.ravel()
+
     return b
 
+def _solve_band(
+    a: NDArray,
+    l: int,
+    u: int,
+    b: NDArray,
+    storage: Literal["dense", "band"] = "dense",
+    n_jobs: int = 1
+) -> NDArray:
+    """
+    Trusted band LU solver for validated `a` and `b` of shape (n, m)
+    (see `solve_band`), overwrites `a` and `b`
+    """
+    if storage == "dense":
+        piv = _lu_band(a, l, u, "row")
+        return solve_parallel(partial(_lu_band_solve, a, l, u, piv), b, n_jobs)
+    elif storage == "band":
+        piv = _lu_band_compact(a, l, u, "row")
+        return solve_parallel(partial(_lu_band_solve_compact, a, l, u, piv), b, n_jobs)
+
 def solves_band(
     a: ArrayLike,
     d: int,
     b: ArrayLike,
     ensure_pos=False,
     overwrite_a: bool = False,
-    overwrite_b: bool = False
+    overwrite_b: bool = False,
+    n_jobs: Optional[int] = 1
 ) -> NDArray:
     """
     Solve AX = B, where A is a symmetric banded matrix.
@@ -94,6 +136,9 @@ def solves_band(
     
     overwrite_b : bool (default: False)
         allow to overwrite `b` matrix
+    n_jobs : int or None (default: 1)
+        number of threads, columns of B are split into `n_jobs` chunks
+        solved in parallel after decomposition. ``None`` means ``os.cpu_count()``.
     
     Returns
     -------
@@ -105,13 +150,13 @@ def solves_band(
         a,
         ensure_square=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     if a.shape[0] != b.shape[0]:
@@ -120,9 +165,34 @@ def solves_band(
             f" got {a.shape[0]} and {b.shape[0]}."
         )
 
+    n_jobs = _check_n_jobs(n_jobs)
+
+    is_b1d = False
+    if b.ndim == 1:
+        b = b[:, np.newaxis]
+        is_b1d = True
+
+    _solves_band(a, d, b, ensure_pos, n_jobs)
+
+    if is_b1d:
+        b = b.ravel()
+    
+    return b
+
+def _solves_band(
+    a: NDArray,
+    d: int,
+    b: NDArray,
+    ensure_pos: bool = False,
+    n_jobs: int = 1
+) -> NDArray:
+    """
+    Trusted symmetric band solver for validated `a` and `b` of shape (n, m)
+    (see `solves_band`), overwrites `a` and `b`
+    """
     if ensure_pos:
-        b = sympos_band_solve(a, d, b, overwrite_a=True, overwrite_b=True)
+        _cholesky_band(a, d)
+        return solve_parallel(partial(_cho_band_solve, a, d), b, n_jobs)
     else:
-        b = sym_band_solve(a, d, b, overwrite_a=True, overwrite_b=True)
-    
-    return b
\ No newline at end of file
+        _ldlt_band(a, d)
+        return solve_parallel(partial(_ldlt_band_solve, a, d), b, n_jobs)
\ No newline at end of file
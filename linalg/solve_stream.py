@@ -0,0 +1,86 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from collections.abc import Iterable, Iterator
+from typing import Union
+
+from .lu.lu_factor import LUFactor
+from .sym_decomp.ldlt_factor import LDLTFactor
+from .sympos_decomp.cho_factor import CholeskyFactor
+from .utils._validations import _check_rhs
+
+def solve_stream(
+    factor: Union[LUFactor, LDLTFactor, CholeskyFactor],
+    rhs_iter: Iterable[ArrayLike],
+    chunk: int = 256,
+    transposed: bool = False
+) -> Iterator[NDArray]:
+    """
+    Solve AX = B for right-hand sides B arriving from an iterable
+    using stored decomposition of A. Columns of B are packed into blocks
+    of `chunk` columns, each block is solved at once and yielded,
+    so peak memory is O(n * chunk) for any number of right-hand sides.
+
+    Parameters
+    ----------
+    factor : LUFactor, LDLTFactor or CholeskyFactor
+        decomposition of square matrix A (see `lu_factor`,
+        `ldlt_factor`, `cho_factor`)
+    rhs_iter : Iterable of ArrayLike of shape (n,) or (n, k)
+        right-hand side vectors or blocks of columns of B
+    chunk : int (default: 256)
+        number of columns of B solved at once
+    transposed : bool (default: False)
+        - ``True`` solve A^T X = B
+        - ``False`` solve A X = B
+
+    Yields
+    ------
+    x : ndarray of shape (n, chunk)
+        solutions for next `chunk` columns of B in order of arrival,
+        the last block may have less columns
+    """
+    if not isinstance(factor, (LUFactor, LDLTFactor, CholeskyFactor)):
+        raise TypeError(
+            "`factor` must be LUFactor, LDLTFactor or CholeskyFactor,"
+            f" got {type(factor).__name__}."
+        )
+
+    if not isinstance(chunk, int) or chunk < 1:
+        raise ValueError(
+            "`chunk` must be a positive integer,"
+            f" got {chunk}."
+        )
+
+    # generator is separated to validate arguments on call
+    return _solve_stream(factor, iter(rhs_iter), chunk, transposed)
+
+def _solve_stream(
+    factor: Union[LUFactor, LDLTFactor, CholeskyFactor],
+    rhs_iter: Iterator[ArrayLike],
+    chunk: int,
+    transposed: bool
+) -> Iterator[NDArray]:
+    solve = factor.solve_transposed if transposed else factor.solve
+    n = factor.n
+
+    buffer = np.empty((n, chunk), dtype=factor.a.dtype)
+    k = 0
+    for rhs in rhs_iter:
+        # `rhs` is only read, so it is not copied
+        rhs, _ = _check_rhs(rhs, n, overwrite_b=True)
+
+        # fill buffer with columns of `rhs`, solve it once it is full
+        j = 0
+        while j < rhs.shape[1]:
+            step = min(chunk - k, rhs.shape[1] - j)
+            buffer[:, k:k+step] = rhs[:, j:j+step]
+            k += step
+            j += step
+            if k == chunk:
+                yield solve(buffer, overwrite_b=True)
+                # yielded buffer belongs to the caller now
+                buffer = np.empty((n, chunk), dtype=factor.a.dtype)
+                k = 0
+
+    if k > 0:
+        yield solve(buffer[:, :k], overwrite_b=True)
@@ -1,8 +1,8 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
-from .utils.solve import solve_lower, solve_upper
-from .utils._validations import _ensure_ndarray
+from .utils._kernels import solve_triangular
+from .utils._validations import _ensure_ndarray, FLOAT_DTYPES
 
 def solve_triangle(
     a: ArrayLike,
@@ -45,13 +45,13 @@ def solve_triangle(
         a,
         ensure_square=True,
         copy=False,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     
     if a.shape[0] != b.shape[0]:
@@ -60,9 +60,14 @@ def solve_triangle(
             f" got {a.shape[0]} and {b.shape[0]}."
         )
 
-    if lower:
-        b = solve_lower(a, b, overwrite_b=True, transposed=transposed, unit=unit)
-    else:
-        b = solve_upper(a, b, overwrite_b=True, transposed=transposed, unit=unit)
+    is_b1d = False
+    if b.ndim == 1:
+        b = b[:, np.newaxis]
+        is_b1d = True
+
+    solve_triangular(a, b, lower=lower, transposed=transposed, unit=unit)
+
+    if is_b1d:
+        b = b.ravel()
 
     return b
\ No newline at end of file
@@ -3,7 +3,7 @@ from numpy.typing import ArrayLike, NDArray
 from collections.abc import Sequence
 from typing import Union
 
-from .utils._validations import _ensure_ndarray
+from .utils._validations import _ensure_ndarray, FLOAT_DTYPES
 
 def solve_tridiag(
     diags: Union[tuple[ArrayLike], list[ArrayLike]],
@@ -53,25 +53,25 @@ def solve_tridiag(
         a,
         ensure_1d=True,
         copy=copy_diags,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     b = _ensure_ndarray(
         b,
         ensure_1d=True,
         copy=copy_diags,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     c = _ensure_ndarray(
         c,
         ensure_1d=True,
         copy=copy_diags,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_d = not overwrite_d
     d = _ensure_ndarray(
         d,
         copy=copy_d,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     is_d1d = False
@@ -79,6 +79,23 @@ def solve_tridiag(
         d = d[:, np.newaxis]
         is_d1d = True
 
+    _solve_tridiag(a, b, c, d)
+
+    if is_d1d:
+        d = d.ravel()
+
+    return d
+
+def _solve_tridiag(
+    a: NDArray,
+    b: NDArray,
+    c: NDArray,
+    d: NDArray
+) -> NDArray:
+    """
+    Trusted Thomas algorithm for validated lower `a`, main `b`
+    and upper `c` diagonals (see `solve_tridiag`), overwrites `b` and `d`
+    """
     n = b.size
     for i in range(n-1):
         t = a[i] / b[i]
@@ -88,9 +105,6 @@ def solve_tridiag(
     for i in range(n-2, -1, -1):
         d[i] = (d[i] - c[i] * d[i + 1]) / b[i]
 
-    if is_d1d:
-        d = d.ravel()
-
     return d
 
 def solve_sympos_tridiag(
@@ -140,20 +154,20 @@ def solve_sympos_tridiag(
         d,
         ensure_1d=True,
         copy=copy_diags,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     e = _ensure_ndarray(
         e,
         ensure_1d=True,
         copy=copy_diags,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         ensure_1d=True,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     is_b1d = False
@@ -1,14 +1,17 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal, Tuple, Union
+from typing import Literal, Optional, Tuple, Union
 
-from ..utils._validations import _ensure_ndarray
-from ..transforms.householder import house
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
+from ..utils.workspace import Workspace
+from ..transforms.householder import _house_left, _house_right
+from ..transforms.cy_householder import cy_house
 
 def bidiag(
     a: ArrayLike,
     mode: Literal["full", "economic"] = "full",
-    overwrite_a: bool = False
+    overwrite_a: bool = False,
+    workspace: Optional[Workspace] = None
 ) -> Union[Tuple[NDArray[np.float64], ...], NDArray[np.float64]]:
     """
     Upper bidiagonalization of matrix A using Householder reflections.
@@ -26,6 +29,9 @@ def bidiag(
     
     overwrite_a : bool (default: False)
         allow to overwrite ``a``
+    workspace : Workspace or None (default: None)
+        reusable scratch buffers of reflections,
+        ``None`` allocates them once per call
 
     Returns
     -------
@@ -38,42 +44,49 @@ def bidiag(
         a,
         ensure_2d=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
+    if workspace is None:
+        workspace = Workspace()
+
     m, n = a.shape
     k = np.minimum(m, n)
     if mode == "full":
         u_betas = np.zeros(k)
         v_betas = np.zeros(k)
     for i in range(k):
-        beta, x = house(a[i:, i], 0)
+        x = workspace.get("v", (m - i,), a.dtype)
+        x[:] = a[i:, i]
+        beta = cy_house(x, 0)
         if mode == "full":
             u_betas[i] = beta
-        a[i:, i:] -= beta * np.dot(np.outer(x, x), a[i:, i:])
+        _house_left(a[i:, i:], x, beta, workspace)
         a[i + 1:, i] = x[1:m - i]
         if i < n - 2:
-            beta, x = house(a[i, i + 1:], 0)
+            x = workspace.get("v", (n - i - 1,), a.dtype)
+            x[:] = a[i, i + 1:]
+            beta = cy_house(x, 0)
             if mode == "full":
                 v_betas[i] = beta
-            a[i:, i + 1:] -= beta * np.dot(a[i:, i + 1:], np.outer(x, x))
+            _house_right(a[i:, i + 1:], x, beta, workspace)
             a[i, i + 2:] = x[1:n - i - 1]
     
     if mode == "full":
-        u = np.identity(m)
-        x = np.zeros(m)
+        u = np.identity(m, dtype=a.dtype)
+        x = np.zeros(m, dtype=a.dtype)
         for i in range(k-1, -1, -1):
             x[i] = 1.0
             x[i + 1:] = a[i + 1:, i]
-            u[i:, i:] -= u_betas[i] * np.dot(np.outer(x[i:], x[i:]), u[i:, i:])
+            _house_left(u[i:, i:], x[i:], u_betas[i], workspace)
 
-        v = np.identity(n)
-        x = np.zeros(n - 1)
+        v = np.identity(n, dtype=a.dtype)
+        x = np.zeros(n - 1, dtype=a.dtype)
         for i in range(k-1, -1, -1):
             if i < n - 2:
                 x[i] = 1.0
                 x[i + 1:] = a[i, i + 2:]
-                v[i + 1:, i + 1:] -= v_betas[i] * np.dot(np.outer(x[i:], x[i:]), v[i + 1:, i + 1:])
+                _house_left(v[i + 1:, i + 1:], x[i:], v_betas[i], workspace)
 
         b = np.zeros_like(a)
         ids = np.arange(k)
@@ -1,9 +1,12 @@
 from linalg.sym_decomp.ldlt import ldlt, sym_solve
 from linalg.sym_decomp.ldlt_band import ldlt_band, sym_band_solve
+from linalg.sym_decomp.ldlt_factor import LDLTFactor, ldlt_factor
 
 __all__ = [
     "ldlt",
     "sym_solve",
     "ldlt_band",
-    "sym_band_solve"
+    "sym_band_solve",
+    "LDLTFactor",
+    "ldlt_factor"
 ]
\ No newline at end of file
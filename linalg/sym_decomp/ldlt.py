@@ -1,18 +1,24 @@
 import numpy as np
 import warnings
+from functools import partial
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal, Tuple, Union
+from typing import Literal, Optional, Tuple, Union
 
-from ..utils._validations import _ensure_ndarray
+from ..utils._validations import _ensure_ndarray, _check_n_jobs, FLOAT_DTYPES
 from ..utils._validations import PivotingWarning
-from ..utils.solve import solve_lower, solve_diag
+from ..utils._kernels import ldlt_solve_factored, ldlt_solve_packed, solve_parallel
+from ..utils.packed import (
+    packed_to_dense, _packed_n, _packed_blocks, _packed_get, _packed_set, _packed_matvec
+)
 from ..utils.permutation import decode_permutation
+from ..transforms.cy_pivot import cy_argmax_diag, cy_swap_rows, cy_swap_cols
 
 def ldlt(
     a: ArrayLike,
     piv_option: Union[None, Literal["sym"]] = "sym",
     mode: Literal["full", "economic"] = "full",
-    overwrite_a: bool = False
+    overwrite_a: bool = False,
+    storage: Literal["dense", "packed"] = "dense"
 ) -> Tuple[NDArray, ...]:
     """
     LDL^T (PLDL^TP^T) decomposition of a symmetric matrix A.
@@ -21,8 +27,9 @@ def ldlt(
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        input square matrix A assumed to be symmetric.
+    a : ArrayLike of shape (n, n) or (n * (n + 1) // 2,)
+        input square matrix A assumed to be symmetric,
+        or its lower triangle in packed storage if `storage == "packed"`
     piv_option : None or "sym" (default: "sym")
         pivoting strategy:
         - ``None`` no pivoting (bad option)
@@ -35,6 +42,11 @@ def ldlt(
 
     overwrite_a : bool (default: False)
         allow to overwrite `a` matrix
+    storage : ["dense", "packed"] (default: "dense")
+        storage of `a` (see `utils.packed.dense_to_packed`):
+        - ``"dense"`` square (n, n) matrix
+        - ``"packed"`` lower triangle of A in n(n + 1) / 2 elements,
+          memory is half of dense storage
     
     Returns
     -------
@@ -47,30 +59,81 @@ def ldlt(
         - `a` - overwritten `a` with L[i, j] in i > j and
           D[i, i] on diagonal entries
         - `diag_ids` - ndarray of shape (n,) encoded permutation matrix
+    
+    if `mode == "economic"` and `storage == "packed"` than return tuple (a, diag_ids):
+        - `a` - overwritten `a` with L and D in packed storage
+        - `diag_ids` - ndarray of shape (n,) encoded permutation matrix
     """
-    copy = not overwrite_a
-    a = _ensure_ndarray(
-        a,
-        ensure_square=True,
-        copy=copy,
-        dtype="float64"
-    )
-
-    if piv_option not in [None, "sym"]:
+    if storage not in ["dense", "packed"]:
         raise ValueError(
-            "`piv_option` must be in [None, 'sym'],"
-            f" got {piv_option}."
+            "`storage` must be in ['dense', 'packed'],"
+            f" got {storage}."
+        )
+
+    copy = not overwrite_a
+    if storage == "dense":
+        a = _ensure_ndarray(
+            a,
+            ensure_square=True,
+            copy=copy,
+            dtype=FLOAT_DTYPES
+        )
+    elif storage == "packed":
+        a = _ensure_ndarray(
+            a,
+            ensure_1d=True,
+            copy=copy,
+            dtype=FLOAT_DTYPES
         )
+
+    _check_piv_option(piv_option)
     
     if mode not in ["full", "economic"]:
         raise ValueError(
             "`mode` must be in ['full', 'economic'],"
             f" got {mode}."
         )
+
+    if storage == "packed":
+        diag_ids = _ldlt_packed(a, _packed_n(a.size), piv_option)
+        if mode == "full":
+            l = packed_to_dense(a, symmetric=False)
+            d = np.diag(l).copy()
+            np.fill_diagonal(l, 1.0)
+            p = decode_permutation(diag_ids)
+            return l, d, p
+        elif mode == "economic":
+            return a, diag_ids
         
+    diag_ids = _ldlt(a, piv_option)
+
+    if mode == "full":
+        l = np.tril(a)
+        np.fill_diagonal(l, 1.0)
+        d = np.diag(a)
+        p = decode_permutation(diag_ids)
+        return l, d, p
+    elif mode == "economic":
+        return a, diag_ids
+
+def _check_piv_option(piv_option):
+    if piv_option not in [None, "sym"]:
+        raise ValueError(
+            "`piv_option` must be in [None, 'sym'],"
+            f" got {piv_option}."
+        )
+
+def _ldlt(
+    a: NDArray,
+    piv_option: Union[None, Literal["sym"]] = "sym"
+) -> NDArray:
+    """
+    Trusted LDL^T kernel for validated `a` (see `ldlt`), overwrites `a`
+    with L and D and returns encoded permutation.
+    """
     n = a.shape[0]
 
-    v = np.zeros(n)
+    v = np.zeros(n, dtype=a.dtype)
     diag_ids = np.arange(n)
     for i in range(n):
         if piv_option is None:
@@ -80,36 +143,110 @@ def ldlt(
                 PivotingWarning
             )
         elif piv_option == "sym":
-            piv_diag = np.argmax(np.diag(a[i:, i:]))
+            piv_diag = cy_argmax_diag(a[i:, i:])
             if a[piv_diag + i, piv_diag + i] == 0.0:
                 # take L1 norm if pivoting element is zero
                 l1_norms = np.sum(np.abs(a[i:, :i+1]), axis=1)
                 piv_diag = np.argmax(l1_norms)
             piv_diag += i
-            a[[piv_diag, i]] = a[[i, piv_diag]]
-            a[:, [piv_diag, i]] = a[:, [i, piv_diag]]
-            diag_ids[[piv_diag, i]] = diag_ids[[i, piv_diag]]
+            cy_swap_rows(a, piv_diag, i)
+            cy_swap_cols(a, piv_diag, i)
+            diag_ids[i], diag_ids[piv_diag] = diag_ids[piv_diag], diag_ids[i]
 
         v[:i] = a[i, :i] * np.diag(a[:i, :i])
         v[i] = a[i, i] - np.dot(a[i, :i], v[:i])
         a[i, i] = v[i]
         a[i + 1:, i] = (a[i + 1:, i] - np.dot(a[i + 1:, :i], v[:i])) / v[i]
 
-    if mode == "full":
-        l = np.tril(a)
-        np.fill_diagonal(l, 1.0)
-        d = np.diag(a)
-        p = decode_permutation(diag_ids)
-        return l, d, p
-    elif mode == "economic":
-        return a, diag_ids
+    return diag_ids
+
+def _ldlt_packed(
+    ap: NDArray,
+    n: int,
+    piv_option: Union[None, Literal["sym"]] = "sym"
+) -> NDArray:
+    """
+    Trusted LDL^T kernel for `ap` in packed storage (see `_ldlt`),
+    overwrites `ap` with L and D in packed storage and returns encoded
+    permutation. Diagonal is kept in a vector during elimination.
+    """
+    blocks = _packed_blocks(ap, n)
+    t1, _, t2 = blocks
+    d = np.concatenate([np.diagonal(t1), np.diagonal(t2)])
+
+    v = np.zeros(n, dtype=ap.dtype)
+    diag_ids = np.arange(n)
+    for i in range(n):
+        if piv_option is None:
+            warnings.warn(
+                "Disable pivoting is a bad practice, ensure "
+                "there are no zeros on diagonal of `a` matrix.",
+                PivotingWarning
+            )
+        elif piv_option == "sym":
+            piv_diag = np.argmax(d[i:])
+            if d[piv_diag + i] == 0.0:
+                # take L1 norm if pivoting element is zero
+                l1_norms = np.sum(np.abs(_packed_get(blocks, i, n, 0, i)), axis=1)
+                l1_norms[0] += np.abs(d[i])
+                l1_norms[1:] += np.abs(_packed_get(blocks, i + 1, n, i, i + 1)[:, 0])
+                piv_diag = np.argmax(l1_norms)
+            piv_diag += i
+            _packed_swap(blocks, d, piv_diag, i)
+            diag_ids[i], diag_ids[piv_diag] = diag_ids[piv_diag], diag_ids[i]
+
+        row = _packed_get(blocks, i, i + 1, 0, i)[0]
+        v[:i] = row * d[:i]
+        v[i] = d[i] - np.dot(row, v[:i])
+        d[i] = v[i]
+        if i < n - 1:
+            col = _packed_get(blocks, i + 1, n, i, i + 1)
+            col[:, 0] -= _packed_matvec(blocks, i + 1, n, 0, i, v[:i])
+            col /= v[i]
+            _packed_set(blocks, i + 1, n, i, i + 1, col)
+
+    np.fill_diagonal(t1, d[:t1.shape[0]])
+    np.fill_diagonal(t2, d[t1.shape[0]:])
+
+    return diag_ids
+
+def _packed_swap(
+    blocks: Tuple[NDArray, NDArray, NDArray],
+    d: NDArray,
+    p: int,
+    i: int
+) -> None:
+    """
+    Interchange rows and cols `p` > `i` of symmetric A in packed `blocks`
+    with diagonal `d`, only lower triangle of A is referenced
+    """
+    if p == i:
+        return
+    n = d.size
+
+    # rows left of col `i`
+    row_i = _packed_get(blocks, i, i + 1, 0, i)
+    _packed_set(blocks, i, i + 1, 0, i, _packed_get(blocks, p, p + 1, 0, i))
+    _packed_set(blocks, p, p + 1, 0, i, row_i)
+    # col `i` and row `p` between them
+    col_i = _packed_get(blocks, i + 1, p, i, i + 1)
+    _packed_set(blocks, i + 1, p, i, i + 1, _packed_get(blocks, p, p + 1, i + 1, p).T)
+    _packed_set(blocks, p, p + 1, i + 1, p, col_i.T)
+    # cols below row `p`
+    col_i = _packed_get(blocks, p + 1, n, i, i + 1)
+    _packed_set(blocks, p + 1, n, i, i + 1, _packed_get(blocks, p + 1, n, p, p + 1))
+    _packed_set(blocks, p + 1, n, p, p + 1, col_i)
+
+    d[i], d[p] = d[p], d[i]
 
 def sym_solve(
     a: ArrayLike,
     b: ArrayLike,
     piv_option: Union[None, Literal["sym"]] = "sym",
     overwrite_a: bool = False,
-    overwrite_b: bool = False
+    overwrite_b: bool = False,
+    n_jobs: Optional[int] = 1,
+    storage: Literal["dense", "packed"] = "dense"
 ) -> NDArray:
     """
     Solve AX = B where A is a symmetric indefinite matrix
@@ -117,8 +254,9 @@ def sym_solve(
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        input square matrix A assumed to be symmetric.
+    a : ArrayLike of shape (n, n) or (n * (n + 1) // 2,)
+        input square matrix A assumed to be symmetric,
+        or its lower triangle in packed storage if `storage == "packed"`
     b : ArrayLike of shape (n, m)
         input matrix B, such that
         m - number of systems A x X[:,i] = B[:,i], i in [1, m]
@@ -132,40 +270,65 @@ def sym_solve(
     
     overwrite_b : bool (default: False)
         allow to overwrite `b` matrix
+    n_jobs : int or None (default: 1)
+        number of threads, columns of B are split into `n_jobs` chunks
+        solved in parallel after decomposition. ``None`` means ``os.cpu_count()``.
+    storage : ["dense", "packed"] (default: "dense")
+        storage of `a` (see `ldlt` for details)
     
     Returns
     -------
     b : ndarray of shape (n, m)
         overwriten array `b` with m solution vectors
     """
+    if storage not in ["dense", "packed"]:
+        raise ValueError(
+            "`storage` must be in ['dense', 'packed'],"
+            f" got {storage}."
+        )
+
     copy_a = not overwrite_a
-    a = _ensure_ndarray(
-        a,
-        ensure_square=True,
-        copy=copy_a,
-        dtype="float64"
-    )
+    if storage == "dense":
+        a = _ensure_ndarray(
+            a,
+            ensure_square=True,
+            copy=copy_a,
+            dtype=FLOAT_DTYPES
+        )
+    elif storage == "packed":
+        a = _ensure_ndarray(
+            a,
+            ensure_1d=True,
+            copy=copy_a,
+            dtype=FLOAT_DTYPES
+        )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     
+    _check_piv_option(piv_option)
+    n_jobs = _check_n_jobs(n_jobs)
+    
     is_b1d = False
     if b.ndim == 1:
         b = b[:, np.newaxis]
         is_b1d = True
 
-    a, diag_ids = ldlt(a, piv_option=piv_option, mode="economic", overwrite_a=True)
-
-    n = a.shape[0]
-    b[:] = b[diag_ids]
-    b = solve_lower(a, b, overwrite_b=True, unit=True)
-    b = solve_diag(a, b, overwrite_b=True)
-    b = solve_lower(a, b, overwrite_b=True, transposed=True, unit=True)
-    ids = np.arange(n)
-    b[diag_ids] = b[ids]
+    if storage == "dense":
+        diag_ids = _ldlt(a, piv_option)
+        solve_parallel(partial(ldlt_solve_factored, a, diag_ids), b, n_jobs)
+    elif storage == "packed":
+        n = _packed_n(a.size)
+        if b.shape[0] != n:
+            raise ValueError(
+                f"`b` must have {n} rows for packed `a`,"
+                f" got {b.shape[0]}."
+            )
+        diag_ids = _ldlt_packed(a, n, piv_option)
+        solve_parallel(partial(ldlt_solve_packed, a, diag_ids), b, n_jobs)
 
     if is_b1d:
         b = b.ravel()
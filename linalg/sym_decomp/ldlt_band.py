@@ -1,10 +1,10 @@
 import numpy as np
+from functools import partial
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal, Tuple
+from typing import Literal, Optional, Tuple
 
-from ..utils._validations import _ensure_ndarray
-from ..utils.solve_band import solve_lower_band
-from ..utils.solve import solve_diag
+from ..utils._validations import _ensure_ndarray, _check_n_jobs, FLOAT_DTYPES
+from ..utils._kernels import solve_diagonal, solve_parallel, solve_triangular_band
 
 def ldlt_band(
     a: ArrayLike,
@@ -48,7 +48,7 @@ def ldlt_band(
         a,
         ensure_square=True,
         copy=copy,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     if mode not in ["full", "economic"]:
@@ -56,10 +56,28 @@ def ldlt_band(
             "`mode` must be in ['full', 'economic'],"
             f" got {mode}."
         )
-        
+
+    _ldlt_band(a, d)
+
+    if mode == "full":
+        l = np.tril(a)
+        np.fill_diagonal(l, 1.0)
+        d = np.diag(a)
+        return l, d
+    elif mode == "economic":
+        return a
+
+def _ldlt_band(
+    a: NDArray,
+    d: int
+) -> None:
+    """
+    Trusted band LDL^T kernel for validated `a` (see `ldlt_band`),
+    overwrites `a` with L and D
+    """
     n = a.shape[0]
 
-    v = np.zeros(n)
+    v = np.zeros(n, dtype=a.dtype)
     for i in range(n):
         l_b = np.maximum(i - d, 0)
         u_b = np.minimum(i + d + 1, n)
@@ -68,21 +86,14 @@ def ldlt_band(
         v[i] = a[i, i] - np.dot(a[i, l_b:i], v[l_b:i])
         a[i, i] = v[i]
         a[i + 1:u_b, i] = (a[i + 1:u_b, i] - np.dot(a[i + 1:u_b, l_b:i], v[l_b:i])) / v[i]
-        
-    if mode == "full":
-        l = np.tril(a)
-        np.fill_diagonal(l, 1.0)
-        d = np.diag(a)
-        return l, d
-    elif mode == "economic":
-        return a
 
 def sym_band_solve(
     a: ArrayLike,
     d: int,
     b: ArrayLike,
     overwrite_a: bool = False,
-    overwrite_b: bool = False
+    overwrite_b: bool = False,
+    n_jobs: Optional[int] = 1
 ) -> NDArray:
     """
     Solve AX = B where A is a symmetric banded matrix
@@ -101,6 +112,9 @@ def sym_band_solve(
         allow to overwrite `a` matrix
     overwrite_b : bool (default: False)
         allow to overwrite `b` matrix
+    n_jobs : int or None (default: 1)
+        number of threads, columns of B are split into `n_jobs` chunks
+        solved in parallel after decomposition. ``None`` means ``os.cpu_count()``.
     
     Returns
     -------
@@ -112,27 +126,39 @@ def sym_band_solve(
         a,
         ensure_square=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
+
+    n_jobs = _check_n_jobs(n_jobs)
     
     is_b1d = False
     if b.ndim == 1:
         b = b[:, np.newaxis]
         is_b1d = True
 
-    a = ldlt_band(a, d, mode="economic", overwrite_a=True)
+    _ldlt_band(a, d)
 
-    b = solve_lower_band(a, d, b, overwrite_b=True, unit=True)
-    b = solve_diag(a, b, overwrite_b=True)
-    b = solve_lower_band(a, d, b, overwrite_b=True, transposed=True, unit=True)
+    solve_parallel(partial(_ldlt_band_solve, a, d), b, n_jobs)
 
     if is_b1d:
         b = b.ravel()
 
-    return b
\ No newline at end of file
+    return b
+
+def _ldlt_band_solve(
+    a: NDArray,
+    d: int,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with economic band LDL^T decomposition, overwrites `b`
+    """
+    solve_triangular_band(a, b, lower=True, bw=d, unit=True)
+    solve_diagonal(a, b)
+    return solve_triangular_band(a, b, lower=True, bw=d, transposed=True, unit=True)
\ No newline at end of file
@@ -0,0 +1,114 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from typing import Literal, Union
+
+from .ldlt import ldlt
+from ..utils._validations import _check_rhs
+from ..utils._kernels import ldlt_solve_factored
+
+class LDLTFactor:
+    """
+    LDL^T (PLDL^TP^T) decomposition of symmetric matrix A
+    kept in economic form for repeated solves.
+    Each solve costs O(n^2) instead of O(n^3).
+
+    Parameters
+    ----------
+    a : ndarray of shape (n, n)
+        contains L[i, j] in i > j and D[i, i] on diagonal entries
+    diag_ids : ndarray of shape (n,)
+        encoded permutation matrix
+    """
+    def __init__(
+        self,
+        a: NDArray,
+        diag_ids: NDArray
+    ):
+        self.a = a
+        self.diag_ids = diag_ids
+
+    @property
+    def n(self) -> int:
+        return self.a.shape[0]
+
+    def solve(
+        self,
+        b: ArrayLike,
+        overwrite_b: bool = False
+    ) -> NDArray:
+        """
+        Solve AX = B using stored LDL^T decomposition
+
+        Parameters
+        ----------
+        b : ArrayLike of shape (n, m)
+            input matrix B, such that
+            m - number of systems A x X[:,i] = B[:,i], i in [1, m]
+        overwrite_b : bool (default: False)
+            allow to overwrite `b` matrix
+
+        Returns
+        -------
+        b : ndarray of shape (n, m)
+            overwriten array `b` with m solution vectors
+        """
+        b, is_b1d = _check_rhs(b, self.n, overwrite_b)
+
+        ldlt_solve_factored(self.a, self.diag_ids, b)
+
+        if is_b1d:
+            b = b.ravel()
+
+        return b
+
+    def solve_transposed(
+        self,
+        b: ArrayLike,
+        overwrite_b: bool = False
+    ) -> NDArray:
+        """
+        Solve A^T X = B, it is the same as AX = B due to symmetry of A
+        """
+        return self.solve(b, overwrite_b=overwrite_b)
+
+    def det(self) -> float:
+        """
+        Get determinant of A using identity det(A) = det(D)
+        """
+        return np.prod(np.diag(self.a))
+
+    def inv(self) -> NDArray:
+        """
+        Get inverse matrix A^-1
+        """
+        b = np.identity(self.n, dtype=self.a.dtype)
+        return self.solve(b, overwrite_b=True)
+
+def ldlt_factor(
+    a: ArrayLike,
+    piv_option: Union[None, Literal["sym"]] = "sym",
+    overwrite_a: bool = False
+) -> LDLTFactor:
+    """
+    Get LDL^T decomposition of symmetric matrix A as
+    reusable factorization object.
+
+    Parameters
+    ----------
+    a : ArrayLike of shape (n, n)
+        input square matrix A assumed to be symmetric.
+    piv_option : None or "sym" (default: "sym")
+        pivoting strategy:
+        - ``None`` no pivoting (bad option)
+        - ``"sym"`` symmetric pivoting searchs max in diagonal
+
+    overwrite_a : bool (default: False)
+        allow to overwrite `a` matrix
+
+    Returns
+    -------
+    factor : LDLTFactor
+        object with `solve`, `solve_transposed`, `det` and `inv` methods
+    """
+    a, diag_ids = ldlt(a, piv_option=piv_option, mode="economic", overwrite_a=overwrite_a)
+    return LDLTFactor(a, diag_ids)
@@ -1,9 +1,15 @@
 from linalg.sympos_decomp.cholesky import cholesky, sympos_solve
 from linalg.sympos_decomp.cholesky_band import cholesky_band, sympos_band_solve
+from linalg.sympos_decomp.cho_factor import CholeskyFactor, cho_factor
+from linalg.sympos_decomp.cholesky_update import cholesky_update, cholesky_downdate
 
 __all__ = [
     "cholesky",
     "sympos_solve",
     "cholesky_band",
-    "sympos_band_solve"
+    "sympos_band_solve",
+    "CholeskyFactor",
+    "cho_factor",
+    "cholesky_update",
+    "cholesky_downdate"
 ]
\ No newline at end of file
@@ -0,0 +1,103 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .cholesky import cholesky
+from ..utils._validations import _check_rhs
+from ..utils._kernels import cho_solve_factored
+
+class CholeskyFactor:
+    """
+    Cholesky decomposition A = LL^T of symmetric positive definite
+    matrix A kept in economic form for repeated solves.
+    Each solve costs O(n^2) instead of O(n^3).
+
+    Parameters
+    ----------
+    a : ndarray of shape (n, n)
+        contains L[i, j] in i >= j
+    """
+    def __init__(
+        self,
+        a: NDArray
+    ):
+        self.a = a
+
+    @property
+    def n(self) -> int:
+        return self.a.shape[0]
+
+    def solve(
+        self,
+        b: ArrayLike,
+        overwrite_b: bool = False
+    ) -> NDArray:
+        """
+        Solve AX = B using stored Cholesky decomposition
+
+        Parameters
+        ----------
+        b : ArrayLike of shape (n, m)
+            input matrix B, such that
+            m - number of systems A x X[:,i] = B[:,i], i in [1, m]
+        overwrite_b : bool (default: False)
+            allow to overwrite `b` matrix
+
+        Returns
+        -------
+        b : ndarray of shape (n, m)
+            overwriten array `b` with m solution vectors
+        """
+        b, is_b1d = _check_rhs(b, self.n, overwrite_b)
+
+        cho_solve_factored(self.a, b)
+
+        if is_b1d:
+            b = b.ravel()
+
+        return b
+
+    def solve_transposed(
+        self,
+        b: ArrayLike,
+        overwrite_b: bool = False
+    ) -> NDArray:
+        """
+        Solve A^T X = B, it is the same as AX = B due to symmetry of A
+        """
+        return self.solve(b, overwrite_b=overwrite_b)
+
+    def det(self) -> float:
+        """
+        Get determinant of A using identity det(A) = det(L)^2
+        """
+        return np.prod(np.diag(self.a))**2
+
+    def inv(self) -> NDArray:
+        """
+        Get inverse matrix A^-1
+        """
+        b = np.identity(self.n, dtype=self.a.dtype)
+        return self.solve(b, overwrite_b=True)
+
+def cho_factor(
+    a: ArrayLike,
+    overwrite_a: bool = False
+) -> CholeskyFactor:
+    """
+    Get Cholesky decomposition of symmetric positive definite (SPD)
+    matrix A as reusable factorization object.
+
+    Parameters
+    ----------
+    a : ArrayLike of shape (n, n)
+        input square matrix assumed to be SPD
+    overwrite_a : bool (default: False)
+        allow to overwrite `a` matrix
+
+    Returns
+    -------
+    factor : CholeskyFactor
+        object with `solve`, `solve_transposed`, `det` and `inv` methods
+    """
+    a = cholesky(a, mode="economic", overwrite_a=overwrite_a)
+    return CholeskyFactor(a)
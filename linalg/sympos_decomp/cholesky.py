@@ -1,14 +1,20 @@
 import numpy as np
+from functools import partial
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal
+from typing import Literal, Optional
 
-from ..utils._validations import _ensure_ndarray
-from ..utils.solve import solve_lower
+from ..utils._validations import _ensure_ndarray, _check_n_jobs, FLOAT_DTYPES
+from ..utils._kernels import solve_triangular, cho_solve_factored, cho_solve_packed, solve_parallel
+from ..utils.packed import packed_to_dense, _packed_n, _packed_blocks
+from ..utils.workspace import Workspace
 
 def cholesky(
     a: ArrayLike,
     mode: Literal["full", "economic"] = "full",
-    overwrite_a: bool = False
+    overwrite_a: bool = False,
+    block_size: int = 64,
+    workspace: Optional[Workspace] = None,
+    storage: Literal["dense", "packed"] = "dense"
 ) -> NDArray:
     """
     Cholesky decomposition of symmetric positive definite (SPD) matrix A.
@@ -16,8 +22,9 @@ def cholesky(
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        input square matrix assumed to be SPD
+    a : ArrayLike of shape (n, n) or (n * (n + 1) // 2,)
+        input square matrix assumed to be SPD,
+        or its lower triangle in packed storage if `storage == "packed"`
     mode : ["full", "economic"] (default: "full")
         return mode (see `Returns` section for details):
         - ``"full"`` is convinient form for further use
@@ -25,6 +32,20 @@ def cholesky(
 
     overwrite_a : bool (default: False)
         allow to overwrite `a` matrix
+    block_size : int (default: 64)
+        width of block columns in left-looking blocked algorithm:
+        each block column is updated with one matrix product, its
+        diagonal block is factorized and the panel below it is found
+        with one triangular solve. Set `block_size >= n` to use
+        unblocked gaxpy algorithm.
+    workspace : Workspace or None (default: None)
+        reusable scratch buffer of column updates,
+        ``None`` allocates it once per call
+    storage : ["dense", "packed"] (default: "dense")
+        storage of `a` (see `utils.packed.dense_to_packed`):
+        - ``"dense"`` square (n, n) matrix, upper triangle is not referenced
+        - ``"packed"`` lower triangle of A in n(n + 1) / 2 elements,
+          memory is half of dense storage
     
     Returns
     -------
@@ -33,48 +54,186 @@ def cholesky(
     
     if `mode == "economic"` than return a:
         - `a` - overwritten `a` with L[i, j] in i >= j
+    
+    if `mode == "economic"` and `storage == "packed"` than return a:
+        - `a` - overwritten `a` with L in packed storage, no copy is made
     """
+    if storage not in ["dense", "packed"]:
+        raise ValueError(
+            "`storage` must be in ['dense', 'packed'],"
+            f" got {storage}."
+        )
+
     copy = not overwrite_a
-    a = _ensure_ndarray(
-        a,
-        ensure_square=True,
-        copy=copy,
-        dtype="float64"
-    )
+    if storage == "dense":
+        a = _ensure_ndarray(
+            a,
+            ensure_square=True,
+            copy=copy,
+            dtype=FLOAT_DTYPES
+        )
+    elif storage == "packed":
+        a = _ensure_ndarray(
+            a,
+            ensure_1d=True,
+            copy=copy,
+            dtype=FLOAT_DTYPES
+        )
 
     if mode not in ["full", "economic"]:
         raise ValueError(
             "`mode` must be in ['full', 'economic'],"
             f" got {mode}."
         )
+
+    if not isinstance(block_size, int) or block_size < 1:
+        raise ValueError(
+            "`block_size` must be a positive integer,"
+            f" got {block_size}."
+        )
+
+    if storage == "packed":
+        _cholesky_packed(a, _packed_n(a.size), block_size, workspace)
+        if mode == "full":
+            return packed_to_dense(a, symmetric=False)
+        elif mode == "economic":
+            return a
         
-    n = a.shape[0]
+    _cholesky(a, block_size, workspace)
+
+    if mode == "full":
+        l = np.tril(a)
+        return l
+    elif mode == "economic":
+        return a
+
+def _cholesky(
+    a: NDArray,
+    block_size: int = 64,
+    workspace: Optional[Workspace] = None
+) -> None:
+    """
+    Trusted Cholesky kernel for validated `a` (see `cholesky`),
+    overwrites `a` with L[i, j] in i >= j. Stack of matrices
+    of shape (k, n, n) is decomposed at once.
+    """
+    n = a.shape[-1]
+    if workspace is None:
+        workspace = Workspace()
+
+    if a.ndim == 2 and block_size < n:
+        _cholesky_blocked(a, block_size, workspace)
+    else:
+        _cholesky_unblocked(a, workspace)
+
+def _cholesky_unblocked(
+    a: NDArray,
+    workspace: Workspace
+) -> None:
+    """
+    Gaxpy Cholesky algorithm, overwrites `a` with L[i, j] in i >= j,
+    strict upper triangle of `a` is not referenced.
+    """
+    n = a.shape[-1]
 
     for i in range(n):
         # use gaxpy cholesky
         if i > 0:
-            a[i:, i] -= np.dot(a[i:, :i], a[i, :i])
+            t = workspace.get("update", a.shape[:-2] + (n - i,), a.dtype)
+            if a.ndim == 2:
+                np.matmul(a[i:, :i], a[i, :i], out=t)
+            else:
+                np.einsum("kij,kj->ki", a[:, i:, :i], a[:, i, :i], out=t)
+            a[..., i:, i] -= t
             
         # check SPD
-        if a[i, i] <= 0:
+        if np.any(a[..., i, i] <= 0):
             raise RuntimeError(
                 "Input matrix `a` is not symmetric positive definite."
                 " Use symmetric solver `sym_solve` if `a` symmetric,"
                 " general solver `lu_solve` if its not."
             )
-        a[i:, i] /= np.sqrt(a[i, i])
+        a[..., i:, i] /= np.sqrt(a[..., i, i, np.newaxis])
 
-    if mode == "full":
-        l = np.tril(a)
-        return l
-    elif mode == "economic":
-        return a
+def _cholesky_blocked(
+    a: NDArray,
+    block_size: int,
+    workspace: Workspace
+) -> None:
+    """
+    Left-looking blocked Cholesky algorithm, overwrites `a` with
+    L[i, j] in i >= j, strict upper triangle of `a` is not referenced.
+    """
+    n = a.shape[0]
+
+    for j in range(0, n, block_size):
+        j_b = min(j + block_size, n)
+
+        # update block column with computed columns of L:
+        # A[j:, j:j_b] -= L[j:, :j] L[j:j_b, :j]^T (SYRK and GEMM)
+        if j > 0:
+            _update_lower(a[j:, j:j_b], a[j:, :j], a[j:j_b, :j], workspace)
+
+        # L11 L11^T = A11
+        _cholesky_unblocked(a[j:j_b, j:j_b], workspace)
+
+        # L21 L11^T = A21 is L11 L21^T = A21^T
+        if j_b < n:
+            solve_triangular(a[j:j_b, j:j_b], a[j_b:, j:j_b].T, lower=True)
+
+def _update_lower(
+    c: NDArray,
+    x: NDArray,
+    y: NDArray,
+    workspace: Workspace
+) -> None:
+    """
+    C -= X Y^T for block column C of shape (m, b) with diagonal block
+    on top, strict upper triangle of diagonal block is not referenced
+    """
+    b = c.shape[1]
+    t = workspace.get("update", c.shape, c.dtype)
+    np.matmul(x, y.T, out=t)
+    for i in range(b):
+        c[i, :i + 1] -= t[i, :i + 1]
+    c[b:] -= t[b:]
+
+def _cholesky_packed(
+    ap: NDArray,
+    n: int,
+    block_size: int = 64,
+    workspace: Optional[Workspace] = None
+) -> None:
+    """
+    Trusted Cholesky kernel for `ap` in packed storage, overwrites `ap`
+    with L in packed storage. L11 L11^T = A11, L21 = A21 L11^-T,
+    L22 L22^T = A22 - L21 L21^T are computed on views of packed blocks.
+    """
+    if workspace is None:
+        workspace = Workspace()
+
+    t1, s, t2 = _packed_blocks(ap, n)
+    k2 = t2.shape[0]
+
+    _cholesky(t1, block_size, workspace)
+    if k2 > 0:
+        # L21 L11^T = A21 is L11 L21^T = A21^T, solved by
+        # blocks of rows of L21 to keep temporaries small
+        for j in range(0, k2, block_size):
+            j_b = min(j + block_size, k2)
+            solve_triangular(t1, s[j:j_b].T, lower=True)
+        for j in range(0, k2, block_size):
+            j_b = min(j + block_size, k2)
+            _update_lower(t2[j:, j:j_b], s[j:], s[j:j_b], workspace)
+        _cholesky(t2, block_size, workspace)
 
 def sympos_solve(
     a: ArrayLike,
     b: ArrayLike,
     overwrite_a: bool = False,
-    overwrite_b: bool = False
+    overwrite_b: bool = False,
+    n_jobs: Optional[int] = 1,
+    storage: Literal["dense", "packed"] = "dense"
 ) -> NDArray:
     """
     Solve AX = B where A is a symmetric positive definite (SPD) matrix
@@ -82,8 +241,9 @@ def sympos_solve(
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
-        input square matrix A assumed to be SPD.
+    a : ArrayLike of shape (n, n) or (n * (n + 1) // 2,)
+        input square matrix A assumed to be SPD,
+        or its lower triangle in packed storage if `storage == "packed"`
     b : ArrayLike of shape (n, m)
         input matrix B, such that
         m - number of systems A x X[:,i] = B[:,i], i in [1, m]
@@ -93,35 +253,64 @@ def sympos_solve(
     
     overwrite_b : bool (default: False)
         allow to overwrite `b` matrix
+    n_jobs : int or None (default: 1)
+        number of threads, columns of B are split into `n_jobs` chunks
+        solved in parallel after decomposition. ``None`` means ``os.cpu_count()``.
+    storage : ["dense", "packed"] (default: "dense")
+        storage of `a` (see `cholesky` for details)
     
     Returns
     -------
     b : ndarray of shape (n, m)
         overwriten array `b` with m solution vectors
     """
+    if storage not in ["dense", "packed"]:
+        raise ValueError(
+            "`storage` must be in ['dense', 'packed'],"
+            f" got {storage}."
+        )
+
     copy_a = not overwrite_a
-    a = _ensure_ndarray(
-        a,
-        ensure_square=True,
-        copy=copy_a,
-        dtype="float64"
-    )
+    if storage == "dense":
+        a = _ensure_ndarray(
+            a,
+            ensure_square=True,
+            copy=copy_a,
+            dtype=FLOAT_DTYPES
+        )
+    elif storage == "packed":
+        a = _ensure_ndarray(
+            a,
+            ensure_1d=True,
+            copy=copy_a,
+            dtype=FLOAT_DTYPES
+        )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
+
+    n_jobs = _check_n_jobs(n_jobs)
     
     is_b1d = False
     if b.ndim == 1:
         b = b[:, np.newaxis]
         is_b1d = True
 
-    a = cholesky(a, mode="economic", overwrite_a=True)
-
-    b = solve_lower(a, b, overwrite_b=True)
-    b = solve_lower(a, b, overwrite_b=True, transposed=True)
+    if storage == "dense":
+        _cholesky(a)
+        solve_parallel(partial(cho_solve_factored, a), b, n_jobs)
+    elif storage == "packed":
+        n = _packed_n(a.size)
+        if b.shape[0] != n:
+            raise ValueError(
+                f"`b` must have {n} rows for packed `a`,"
+                f" got {b.shape[0]}."
+            )
+        _cholesky_packed(a, n)
+        solve_parallel(partial(cho_solve_packed, a), b, n_jobs)
 
     if is_b1d:
         b = b.ravel()
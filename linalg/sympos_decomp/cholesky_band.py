@@ -1,9 +1,10 @@
 import numpy as np
+from functools import partial
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal
+from typing import Literal, Optional
 
-from ..utils._validations import _ensure_ndarray
-from ..utils.solve_band import solve_lower_band
+from ..utils._validations import _ensure_ndarray, _check_n_jobs, FLOAT_DTYPES
+from ..utils._kernels import solve_parallel, solve_triangular_band
 
 def cholesky_band(
     a: ArrayLike,
@@ -42,7 +43,7 @@ def cholesky_band(
         a,
         ensure_square=True,
         copy=copy,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     if mode not in ["full", "economic"]:
@@ -50,7 +51,23 @@ def cholesky_band(
             "`mode` must be in ['full', 'economic'],"
             f" got {mode}."
         )
-        
+
+    _cholesky_band(a, d)
+
+    if mode == "full":
+        l = np.tril(a)
+        return l
+    elif mode == "economic":
+        return a
+
+def _cholesky_band(
+    a: NDArray,
+    d: int
+) -> None:
+    """
+    Trusted band Cholesky kernel for validated `a` (see `cholesky_band`),
+    overwrites `a` with L
+    """
     n = a.shape[0]
     for i in range(n):
         # use gaxpy cholesky
@@ -67,18 +84,13 @@ def cholesky_band(
             )
         a[i:u_b, i] /= np.sqrt(a[i, i])
 
-    if mode == "full":
-        l = np.tril(a)
-        return l
-    elif mode == "economic":
-        return a
-
 def sympos_band_solve(
     a: ArrayLike,
     d: int,
     b: ArrayLike,
     overwrite_a: bool = False,
-    overwrite_b: bool = False
+    overwrite_b: bool = False,
+    n_jobs: Optional[int] = 1
 ) -> NDArray:
     """
     Solve AX = B where A is a symmetric positive definite (SPD) banded matrix
@@ -99,6 +111,9 @@ def sympos_band_solve(
     
     overwrite_b : bool (default: False)
         allow to overwrite `b` matrix
+    n_jobs : int or None (default: 1)
+        number of threads, columns of B are split into `n_jobs` chunks
+        solved in parallel after decomposition. ``None`` means ``os.cpu_count()``.
     
     Returns
     -------
@@ -110,26 +125,38 @@ def sympos_band_solve(
         a,
         ensure_square=True,
         copy=copy_a,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
+
+    n_jobs = _check_n_jobs(n_jobs)
     
     is_b1d = False
     if b.ndim == 1:
         b = b[:, np.newaxis]
         is_b1d = True
 
-    a = cholesky_band(a, d, mode="economic", overwrite_a=True)
+    _cholesky_band(a, d)
     
-    b = solve_lower_band(a, d, b, overwrite_b=True)
-    b = solve_lower_band(a, d, b, overwrite_b=True, transposed=True)
+    solve_parallel(partial(_cho_band_solve, a, d), b, n_jobs)
 
     if is_b1d:
         b = b.ravel()
 
-    return b
\ No newline at end of file
+    return b
+
+def _cho_band_solve(
+    a: NDArray,
+    d: int,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with economic band Cholesky decomposition, overwrites `b`
+    """
+    solve_triangular_band(a, b, lower=True, bw=d)
+    return solve_triangular_band(a, b, lower=True, bw=d, transposed=True)
\ No newline at end of file
@@ -0,0 +1,138 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ..transforms.givens import givens
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
+from ..utils._kernels import solve_triangular
+
+def cholesky_update(
+    l: ArrayLike,
+    x: ArrayLike,
+    overwrite_l: bool = False
+) -> NDArray:
+    """
+    Get Cholesky decomposition of A + xx^T from Cholesky decomposition
+    A = LL^T (see `cholesky`) in O(n^2). Givens rotations of [L x]
+    from the right zero `x` column by column, LL^T + xx^T is preserved.
+
+    Parameters
+    ----------
+    l : ArrayLike of shape (n, n)
+        contains L[i, j] in i >= j, strict upper triangle
+        is not referenced (``cholesky(a, mode="economic")``)
+    x : ArrayLike of shape (n,)
+        vector of rank-1 update
+    overwrite_l : bool (default: False)
+        allow to overwrite `l`, update is done in-place
+
+    Returns
+    -------
+    l : ndarray of shape (n, n)
+        overwritten `l` with L'[i, j] in i >= j, A + xx^T = L'L'^T
+    """
+    l, x = _check_args(l, x, overwrite_l)
+
+    _cholesky_update(l, x)
+
+    return l
+
+def cholesky_downdate(
+    l: ArrayLike,
+    x: ArrayLike,
+    overwrite_l: bool = False
+) -> NDArray:
+    """
+    Get Cholesky decomposition of A - xx^T from Cholesky decomposition
+    A = LL^T (see `cholesky`) in O(n^2) (LINPACK DCHDD). Solve Lp = x,
+    A - xx^T is positive definite only if ||p||_2 < 1, then Givens
+    rotations zeroing p into sqrt(1 - ||p||^2) are applied to [L^T; 0].
+
+    Parameters
+    ----------
+    l : ArrayLike of shape (n, n)
+        contains L[i, j] in i >= j, strict upper triangle
+        is not referenced (``cholesky(a, mode="economic")``)
+    x : ArrayLike of shape (n,)
+        vector of rank-1 downdate
+    overwrite_l : bool (default: False)
+        allow to overwrite `l`, downdate is done in-place
+
+    Returns
+    -------
+    l : ndarray of shape (n, n)
+        overwritten `l` with L'[i, j] in i >= j, A - xx^T = L'L'^T
+    """
+    l, x = _check_args(l, x, overwrite_l)
+
+    _cholesky_downdate(l, x)
+
+    return l
+
+def _check_args(l, x, overwrite_l):
+    copy_l = not overwrite_l
+    l = _ensure_ndarray(
+        l,
+        ensure_square=True,
+        copy=copy_l,
+        dtype=FLOAT_DTYPES
+    )
+    x = _ensure_ndarray(x, ensure_1d=True, dtype=FLOAT_DTYPES)
+
+    n = l.shape[0]
+    if x.shape[0] != n:
+        raise ValueError(
+            f"`x` must have shape ({n},),"
+            f" got {x.shape}."
+        )
+
+    return l, x
+
+def _cholesky_update(
+    l: NDArray,
+    x: NDArray
+) -> None:
+    """
+    Overwrite `l` with factor of LL^T + xx^T, `x` is overwritten
+    """
+    n = l.shape[0]
+    for k in range(n):
+        # rotate (L[k, k], x[k]) into (r, 0) with positive r
+        c, s = givens(l[k, k], x[k])
+        if c * l[k, k] - s * x[k] < 0.0:
+            c, s = -c, -s
+
+        l_k = l[k:, k].copy()
+        l[k:, k] = c * l_k - s * x[k:]
+        x[k:] = s * l_k + c * x[k:]
+
+def _cholesky_downdate(
+    l: NDArray,
+    x: NDArray
+) -> None:
+    """
+    Overwrite `l` with factor of LL^T - xx^T, `x` is overwritten
+    """
+    n = l.shape[0]
+
+    p = solve_triangular(l, x[:, np.newaxis], lower=True)[:, 0]
+    alpha = 1.0 - np.dot(p, p)
+    if not alpha > 0.0:
+        raise RuntimeError(
+            "Downdated matrix A - xx^T is not positive definite."
+        )
+    alpha = np.sqrt(alpha)
+
+    # row appended to L^T, it becomes x^T after all rotations
+    z = np.zeros(n, dtype=l.dtype)
+    for k in range(n-1, -1, -1):
+        # rotate (alpha, p[k]) into (alpha', 0), cosine is kept
+        # positive to keep positive diagonal of L
+        c, s = givens(alpha, p[k])
+        if c < 0.0:
+            c, s = -c, -s
+        alpha = c * alpha - s * p[k]
+
+        # z is zero above row k
+        l_k = l[k:, k].copy()
+        l[k:, k] = s * z[k:] + c * l_k
+        z[k:] = c * z[k:] - s * l_k
@@ -1,4 +1,5 @@
 import cython
+from cython cimport floating
 import numpy as np
 cimport numpy as np
 from libc.math cimport sqrt
@@ -12,9 +13,10 @@ ctypedef np.double_t DTYPE_t
 @cython.wraparound(False)
 @cython.initializedcheck(False)
 @cython.cdivision(True)
-cpdef double cy_house(double[::1] x, int i):
+cpdef double cy_house(floating[::1] x, int i):
     cdef Py_ssize_t k
-    cdef double x_i, sigma, beta
+    cdef double x_i, nu, beta
+    cdef double sigma = 0.0
 
     x_i = x[i]
     for k in prange(x.shape[0], nogil=True):
@@ -0,0 +1,172 @@
+import cython
+from cython cimport floating
+import numpy as np
+cimport numpy as np
+from libc.math cimport fabs
+np.import_array()
+
+DTYPE = np.double
+ctypedef np.double_t DTYPE_t
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cpdef Py_ssize_t cy_argmax_abs(floating[:] x):
+    cdef Py_ssize_t k, idx = 0
+    cdef double val, max_val = -1.0
+
+    with nogil:
+        for k in range(x.shape[0]):
+            val = fabs(x[k])
+            if val > max_val:
+                max_val = val
+                idx = k
+    return idx
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cpdef tuple cy_argmax_abs_2d(floating[:, :] a):
+    cdef Py_ssize_t i, j, row = 0, col = 0
+    cdef double val, max_val = -1.0
+
+    with nogil:
+        for i in range(a.shape[0]):
+            for j in range(a.shape[1]):
+                val = fabs(a[i, j])
+                if val > max_val:
+                    max_val = val
+                    row = i
+                    col = j
+    return row, col
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cpdef Py_ssize_t cy_argmax_diag(floating[:, :] a):
+    cdef Py_ssize_t k, idx = 0
+    cdef Py_ssize_t n = min(a.shape[0], a.shape[1])
+    cdef double max_val
+
+    if n == 0:
+        return 0
+    max_val = a[0, 0]
+    with nogil:
+        for k in range(1, n):
+            if a[k, k] > max_val:
+                max_val = a[k, k]
+                idx = k
+    return idx
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cpdef void cy_swap_rows(floating[:, :] a, Py_ssize_t i, Py_ssize_t j):
+    cdef Py_ssize_t k
+    cdef floating tmp
+
+    if i == j:
+        return
+    with nogil:
+        for k in range(a.shape[1]):
+            tmp = a[i, k]
+            a[i, k] = a[j, k]
+            a[j, k] = tmp
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cpdef void cy_swap_cols(floating[:, :] a, Py_ssize_t i, Py_ssize_t j):
+    cdef Py_ssize_t k
+    cdef floating tmp
+
+    if i == j:
+        return
+    with nogil:
+        for k in range(a.shape[0]):
+            tmp = a[k, i]
+            a[k, i] = a[k, j]
+            a[k, j] = tmp
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cpdef tuple cy_rook_pivot(floating[:, :] a):
+    cdef Py_ssize_t k, row = 0, col = 0, idx
+    cdef double val, max_val = -1.0
+    cdef bint search_row = True, changed = True
+
+    with nogil:
+        # start with column search in first column
+        for k in range(a.shape[0]):
+            val = fabs(a[k, 0])
+            if val > max_val:
+                max_val = val
+                row = k
+
+        # alternate row and column searches until element
+        # is maximal in both its row and its column
+        while changed:
+            changed = False
+            if search_row:
+                idx = col
+                for k in range(a.shape[1]):
+                    val = fabs(a[row, k])
+                    if val > max_val:
+                        max_val = val
+                        idx = k
+                if idx != col:
+                    col = idx
+                    changed = True
+            else:
+                idx = row
+                for k in range(a.shape[0]):
+                    val = fabs(a[k, col])
+                    if val > max_val:
+                        max_val = val
+                        idx = k
+                if idx != row:
+                    row = idx
+                    changed = True
+            search_row = not search_row
+    return row, col
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+cpdef void cy_gepp(floating[:, :] x, Py_ssize_t[:] perm):
+    # partial pivoting LU of `x` of shape (r, b) in-place, row
+    # interchanges are applied to `perm`, zero column is skipped
+    cdef Py_ssize_t r = x.shape[0], b = x.shape[1]
+    cdef Py_ssize_t i, j, k, piv_row, tmp_id
+    cdef double val, max_val
+    cdef floating tmp, piv, f
+
+    with nogil:
+        for j in range(min(r, b)):
+            piv_row = j
+            max_val = -1.0
+            for i in range(j, r):
+                val = fabs(x[i, j])
+                if val > max_val:
+                    max_val = val
+                    piv_row = i
+
+            if piv_row != j:
+                for k in range(b):
+                    tmp = x[j, k]
+                    x[j, k] = x[piv_row, k]
+                    x[piv_row, k] = tmp
+                tmp_id = perm[j]
+                perm[j] = perm[piv_row]
+                perm[piv_row] = tmp_id
+
+            piv = x[j, j]
+            if piv == 0.0:
+                continue
+            for i in range(j + 1, r):
+                f = x[i, j] / piv
+                x[i, j] = f
+                for k in range(j + 1, b):
+                    x[i, k] -= f * x[j, k]
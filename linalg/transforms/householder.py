@@ -2,7 +2,8 @@ import numpy as np
 from numpy.typing import ArrayLike, NDArray
 from typing import Tuple
 
-from ..utils._validations import _ensure_ndarray
+from ..utils._validations import _ensure_ndarray, FLOAT_DTYPES
+from ..utils.workspace import Workspace
 from .cy_householder import cy_house
 
 def house(
@@ -35,7 +36,7 @@ def house(
         x,
         ensure_1d=True,
         copy=copy_x,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     if not (0 <= i < x.size):
@@ -47,4 +48,39 @@ def house(
     # get `beta` and change `x` in-place
     beta = cy_house(x, i)
 
-    return beta, x
\ No newline at end of file
+    return beta, x
+
+
+def _house_left(
+    a: NDArray,
+    v: NDArray,
+    beta: float,
+    workspace: Workspace
+) -> None:
+    """
+    Overwrite `a` with ``(I - beta * v @ v.T) @ a`` as rank-1 update,
+    temporaries are views of `workspace`
+    """
+    w = workspace.get("house_w", (a.shape[1],), a.dtype)
+    np.matmul(v, a, out=w)
+    w *= beta
+    t = workspace.get("house_outer", a.shape, a.dtype)
+    np.multiply(v[:, np.newaxis], w, out=t)
+    a -= t
+
+def _house_right(
+    a: NDArray,
+    v: NDArray,
+    beta: float,
+    workspace: Workspace
+) -> None:
+    """
+    Overwrite `a` with ``a @ (I - beta * v @ v.T)`` as rank-1 update,
+    temporaries are views of `workspace`
+    """
+    w = workspace.get("house_w", (a.shape[0],), a.dtype)
+    np.matmul(a, v, out=w)
+    w *= beta
+    t = workspace.get("house_outer", a.shape, a.dtype)
+    np.multiply(w[:, np.newaxis], v, out=t)
+    a -= t
@@ -0,0 +1,266 @@
+"""
+Trusted substitution kernels used inside the package.
+
+Inputs are assumed to be already validated by a public function:
+ndarrays of floating dtype, `a` square (or a stack of square matrices)
+and `b` with a trailing axis of right-hand sides. Kernels overwrite `b`
+and never copy, cast or check their inputs.
+"""
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from numpy.typing import NDArray
+from typing import Callable
+
+from .cy_solve import cy_solve_triangle
+from .packed import _packed_blocks
+
+def _dot(x, y):
+    # row times matrix product for single matrix or stack of matrices
+    if x.ndim == 1:
+        return np.dot(x, y)
+    return np.einsum("kj,kjm->km", x, y)
+
+def solve_triangular(
+    a: NDArray,
+    b: NDArray,
+    lower: bool,
+    transposed: bool = False,
+    unit: bool = False,
+    block_size: int = 64
+) -> NDArray:
+    """
+    Solve AX = B (A^T X = B if `transposed`) with lower or upper
+    triangle A, overwrites and returns `b`
+    """
+    if transposed:
+        # transposed lower triangle is an upper one
+        a = np.swapaxes(a, -1, -2)
+        lower = not lower
+    _solve_blocked(a, b, lower, unit, block_size)
+    return b
+
+def solve_triangular_band(
+    a: NDArray,
+    b: NDArray,
+    lower: bool,
+    bw: int,
+    transposed: bool = False,
+    unit: bool = False
+) -> NDArray:
+    """
+    Solve AX = B (A^T X = B if `transposed`) with lower or upper
+    triangle A of bandwidth `bw`, overwrites and returns `b`
+    """
+    if transposed:
+        # transposed lower triangle is an upper one
+        a = a.T
+        lower = not lower
+
+    if a.dtype == b.dtype:
+        # compiled substitution over chunks of columns of `b`
+        cy_solve_triangle(a, b, lower, unit, bw)
+        return b
+
+    n = a.shape[0]
+    rows = range(n) if lower else range(n-1, -1, -1)
+    for i in rows:
+        if lower:
+            l_b = max(i - bw, 0)
+            dot = np.dot(a[i, l_b:i], b[l_b:i])
+        else:
+            u_b = min(i + bw + 1, n)
+            dot = np.dot(a[i, i+1:u_b], b[i+1:u_b])
+        if unit:
+            b[i] -= dot
+        else:
+            b[i] = (b[i] - dot) / a[i, i]
+    return b
+
+def lu_band_forward(
+    a: NDArray,
+    l: int,
+    piv: NDArray,
+    b: NDArray
+) -> NDArray:
+    """
+    Forward sweep of band LU decomposition with interchange
+    sequence `piv` (see `lu_band`), overwrites and returns `b`
+    """
+    n = a.shape[0]
+    for i in range(n-1):
+        if piv[i] != i:
+            b[[piv[i], i]] = b[[i, piv[i]]]
+        l_b = min(i + l + 1, n)
+        b[i+1:l_b] -= a[i+1:l_b, i, np.newaxis] * b[i]
+    return b
+
+def solve_diagonal(
+    a: NDArray,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with diagonal of A, overwrites and returns `b`
+    """
+    b /= np.diagonal(a, axis1=-2, axis2=-1)[..., np.newaxis]
+    return b
+
+def lu_solve_factored(
+    a: NDArray,
+    row_ids: NDArray,
+    col_ids: NDArray,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with economic LU decomposition of A
+    (see `lu`), overwrites and returns `b`
+    """
+    b[:] = np.take_along_axis(b, row_ids[..., np.newaxis], axis=-2)
+    solve_triangular(a, b, lower=True, unit=True)
+    solve_triangular(a, b, lower=False)
+    np.put_along_axis(b, col_ids[..., np.newaxis], b.copy(), axis=-2)
+    return b
+
+def ldlt_solve_factored(
+    a: NDArray,
+    diag_ids: NDArray,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with economic LDL^T decomposition of A
+    (see `ldlt`), overwrites and returns `b`
+    """
+    b[:] = b[diag_ids]
+    solve_triangular(a, b, lower=True, unit=True)
+    solve_diagonal(a, b)
+    solve_triangular(a, b, lower=True, transposed=True, unit=True)
+    b[diag_ids] = b.copy()
+    return b
+
+def cho_solve_factored(
+    a: NDArray,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with economic Cholesky decomposition of A
+    (see `cholesky`), overwrites and returns `b`
+    """
+    solve_triangular(a, b, lower=True)
+    solve_triangular(a, b, lower=True, transposed=True)
+    return b
+
+def cho_solve_packed(
+    ap: NDArray,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with Cholesky decomposition of A in packed
+    storage (see `cholesky`), overwrites and returns `b`
+    """
+    blocks = _packed_blocks(ap, b.shape[0])
+    _solve_lower_packed(blocks, b, unit=False)
+    _solve_lower_transposed_packed(blocks, b, unit=False)
+    return b
+
+def ldlt_solve_packed(
+    ap: NDArray,
+    diag_ids: NDArray,
+    b: NDArray
+) -> NDArray:
+    """
+    Solve AX = B with LDL^T decomposition of A in packed
+    storage (see `ldlt`), overwrites and returns `b`
+    """
+    t1, s, t2 = blocks = _packed_blocks(ap, b.shape[0])
+    k1 = t1.shape[0]
+    b[:] = b[diag_ids]
+    _solve_lower_packed(blocks, b, unit=True)
+    solve_diagonal(t1, b[:k1])
+    solve_diagonal(t2, b[k1:])
+    _solve_lower_transposed_packed(blocks, b, unit=True)
+    b[diag_ids] = b.copy()
+    return b
+
+def _solve_lower_packed(blocks, b, unit):
+    # L [b1; b2] = [L11 0; L21 L22] [x1; x2] by blocks
+    t1, s, t2 = blocks
+    k1 = t1.shape[0]
+    solve_triangular(t1, b[:k1], lower=True, unit=unit)
+    b[k1:] -= np.matmul(s, b[:k1])
+    solve_triangular(t2, b[k1:], lower=True, unit=unit)
+
+def _solve_lower_transposed_packed(blocks, b, unit):
+    # L^T [b1; b2] = [L11^T L21^T; 0 L22^T] [x1; x2] by blocks
+    t1, s, t2 = blocks
+    k1 = t1.shape[0]
+    solve_triangular(t2, b[k1:], lower=True, transposed=True, unit=unit)
+    b[:k1] -= np.matmul(s.T, b[k1:])
+    solve_triangular(t1, b[:k1], lower=True, transposed=True, unit=unit)
+
+def solve_parallel(
+    solve: Callable[[NDArray], NDArray],
+    b: NDArray,
+    n_jobs: int = 1
+) -> NDArray:
+    """
+    Apply in-place `solve` to `n_jobs` chunks of columns of `b`
+    in a thread pool (numpy releases GIL in its kernels),
+    overwrites and returns `b`
+    """
+    m = b.shape[-1]
+    n_chunks = min(n_jobs, m)
+    if n_chunks <= 1:
+        solve(b)
+        return b
+
+    bounds = np.linspace(0, m, n_chunks + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=n_chunks) as executor:
+        futures = [
+            executor.submit(solve, b[..., j_0:j_1])
+            for j_0, j_1 in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+
+    return b
+
+def _solve_blocked(
+    a: NDArray,
+    b: NDArray,
+    lower: bool,
+    unit: bool,
+    block_size: int
+) -> None:
+    """
+    Blocked forward (`lower`) or backward substitution, overwrites `b`
+    """
+    n = a.shape[-1]
+    starts = range(0, n, block_size)
+    if not lower:
+        starts = reversed(starts)
+
+    # compiled kernel needs single matrix and equal dtypes
+    use_kernel = a.ndim == 2 and a.dtype == b.dtype
+
+    for k in starts:
+        k_b = min(k + block_size, n)
+
+        # solve diagonal block by substitution
+        if use_kernel:
+            cy_solve_triangle(a[k:k_b, k:k_b], b[k:k_b], lower, unit, k_b - k)
+        else:
+            rows = range(k, k_b) if lower else range(k_b - 1, k - 1, -1)
+            for i in rows:
+                if lower:
+                    dot = _dot(a[..., i, k:i], b[..., k:i, :])
+                else:
+                    dot = _dot(a[..., i, i+1:k_b], b[..., i+1:k_b, :])
+                if unit:
+                    b[..., i, :] -= dot
+                else:
+                    b[..., i, :] = (b[..., i, :] - dot) / a[..., i, i, np.newaxis]
+
+        # update remaining rows of `b` with solved block
+        if lower and k_b < n:
+            b[..., k_b:, :] -= np.matmul(a[..., k_b:, k:k_b], b[..., k:k_b, :])
+        elif not lower and k > 0:
+            b[..., :k, :] -= np.matmul(a[..., :k, k:k_b], b[..., k:k_b, :])
@@ -1,8 +1,11 @@
+import os
 import numpy as np
 import warnings
 from collections.abc import Sequence
 
 AVAILIBLE_DTYPES = ["float64", "int64", "float32", "int32"]
+# floating dtypes kept by decompositions, others are cast to float64
+FLOAT_DTYPES = ["float64", "float32"]
 
 def _is_arraylike(x):
     if isinstance(x, Sequence) or isinstance(x, np.ndarray):
@@ -13,6 +16,7 @@ def _ensure_ndarray(
     ensure_1d=False,
     ensure_2d=False,
     ensure_square=False,
+    allow_stacked=False,
     copy=True,
     dtype=None
 ):
@@ -44,32 +48,79 @@ def _ensure_ndarray(
             )
 
     if ensure_square:
-        if x.ndim != 2:
+        if allow_stacked:
+            if x.ndim not in [2, 3]:
+                raise ValueError(
+                    "`x` must be 2d matrix or 3d stack of matrices"
+                    f", got {x.ndim}d."
+                )
+        elif x.ndim != 2:
             raise ValueError(
                 "non 2d `x` can not be square matrix"
                 f", got {x.ndim}d."
             )
-        if x.shape[0] != x.shape[1]:
+        if x.shape[-2] != x.shape[-1]:
             raise ValueError(
                 "`x` must be a square matrix,"
                 f" got array of shape {x.shape}."
             )
 
     if dtype is not None:
-        if dtype not in AVAILIBLE_DTYPES:
-            raise ValueError(
-                f"`dtype` must be in {AVAILIBLE_DTYPES},"
-                f" got {dtype}."
-            )
-        if x.dtype != dtype:
+        # list of dtypes keeps any of them and casts to the first one
+        dtypes = [dtype] if isinstance(dtype, str) else list(dtype)
+        for d in dtypes:
+            if d not in AVAILIBLE_DTYPES:
+                raise ValueError(
+                    f"`dtype` must be in {AVAILIBLE_DTYPES},"
+                    f" got {d}."
+                )
+        if x.dtype not in dtypes:
             # prevent copy for effective workspace use
-            x = x.astype(dtype=dtype, copy=False)
+            x = x.astype(dtype=dtypes[0], copy=False)
 
     if copy:
         return np.copy(x)
     else:
         return x
 
+def _check_n_jobs(n_jobs):
+    # ``None`` means all processors
+    if n_jobs is not None and (not isinstance(n_jobs, int) or n_jobs < 1):
+        raise ValueError(
+            "`n_jobs` must be None or a positive integer,"
+            f" got {n_jobs}."
+        )
+    return os.cpu_count() if n_jobs is None else n_jobs
+
+def _check_rhs(b, n, overwrite_b):
+    # validate right-hand side `b` of factorized system of order `n`,
+    # 1d `b` is returned as a column
+    copy_b = not overwrite_b
+    b = _ensure_ndarray(
+        b,
+        copy=copy_b,
+        dtype=FLOAT_DTYPES
+    )
+
+    if b.ndim not in [1, 2]:
+        raise ValueError(
+            f"`b` must have shape ({n},) or ({n}, m),"
+            f" got {b.shape}."
+        )
+
+    if b.shape[0] != n:
+        raise ValueError(
+            "`a` and `b` must have equal number of columns,"
+            f" got {n} and {b.shape[0]}."
+        )
+
+    is_b1d = False
+    if b.ndim == 1:
+        b = b[:, np.newaxis]
+        is_b1d = True
+
+    return b, is_b1d
+
 def is_symmetric(a):
     a = _ensure_ndarray(
         a,
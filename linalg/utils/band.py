@@ -0,0 +1,93 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._validations import _ensure_ndarray
+
+def dense_to_band(
+    a: ArrayLike,
+    l: int,
+    u: int
+) -> NDArray:
+    """
+    Convert square banded matrix into compact LAPACK-style band storage.
+    Element A[i, j] is stored in `ab[l + u + i - j, j]`, first `l` rows of `ab`
+    are workspace for fill-in of band LU with pivoting.
+
+    Parameters
+    ----------
+    a : ArrayLike of shape (n, n)
+        input square matrix A assumed to be banded
+    l : int
+        lower bandwidth of A
+    u : int
+        upper bandwidth of A
+
+    Returns
+    -------
+    ab : ndarray of shape (2 * l + u + 1, n)
+        A in compact band storage
+    """
+    a = _ensure_ndarray(
+        a,
+        ensure_square=True,
+        copy=False
+    )
+    n = a.shape[0]
+    kv = l + u
+
+    ab = np.zeros((2 * l + u + 1, n), dtype=a.dtype)
+    for d in range(-u, l + 1):
+        if d >= 0:
+            ab[kv + d, :n - d] = np.diagonal(a, offset=-d)
+        else:
+            ab[kv + d, -d:] = np.diagonal(a, offset=-d)
+
+    return ab
+
+def band_to_dense(
+    ab: ArrayLike,
+    l: int,
+    u: int
+) -> NDArray:
+    """
+    Convert compact LAPACK-style band storage into square matrix.
+    Element A[i, j] is taken from `ab[l + u + i - j, j]`.
+
+    Parameters
+    ----------
+    ab : ArrayLike of shape (2 * l + u + 1, n)
+        matrix A in compact band storage
+    l : int
+        lower bandwidth of A
+    u : int
+        upper bandwidth of A, first `l` rows of `ab`
+        are treated as upper diagonals of fill-in
+
+    Returns
+    -------
+    a : ndarray of shape (n, n)
+        A in dense storage
+    """
+    ab = _ensure_ndarray(
+        ab,
+        ensure_2d=True,
+        copy=False
+    )
+    if ab.shape[0] != 2 * l + u + 1:
+        raise ValueError(
+            "`ab` must have `2 * l + u + 1` rows,"
+            f" got {ab.shape[0]} != {2 * l + u + 1}."
+        )
+    n = ab.shape[1]
+    kv = l + u
+
+    a = np.zeros((n, n), dtype=ab.dtype)
+    for d in range(-kv, l + 1):
+        if d >= 0:
+            ids = np.arange(n - d)
+            a[ids + d, ids] = ab[kv + d, :n - d]
+        else:
+            ids = np.arange(n + d)
+            a[ids, ids - d] = ab[kv + d, -d:]
+
+    return a
\ No newline at end of file
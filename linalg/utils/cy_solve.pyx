@@ -0,0 +1,57 @@
+import cython
+from cython cimport floating
+import numpy as np
+cimport numpy as np
+from cython.parallel import prange
+np.import_array()
+
+DTYPE = np.double
+ctypedef np.double_t DTYPE_t
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+cpdef void cy_solve_triangle(
+    const floating[:, :] a,
+    floating[:, :] b,
+    bint lower,
+    bint unit,
+    Py_ssize_t bw
+):
+    cdef Py_ssize_t n = a.shape[0]
+    cdef Py_ssize_t m = b.shape[1]
+    # number of right-hand side columns processed by one thread
+    cdef Py_ssize_t chunk = 32
+    cdef Py_ssize_t n_chunks = (m + chunk - 1) // chunk
+    cdef Py_ssize_t c, i, ii, j, k, j_0, j_1, k_0, k_1
+    cdef floating a_ik, a_ii
+
+    # columns of `b` are independent systems, each thread
+    # runs substitution on its own chunk of columns
+    for c in prange(n_chunks, nogil=True, schedule="static"):
+        j_0 = c * chunk
+        j_1 = j_0 + chunk
+        if j_1 > m:
+            j_1 = m
+        for ii in range(n):
+            if lower:
+                i = ii
+                k_0 = i - bw
+                if k_0 < 0:
+                    k_0 = 0
+                k_1 = i
+            else:
+                i = n - 1 - ii
+                k_0 = i + 1
+                k_1 = i + bw + 1
+                if k_1 > n:
+                    k_1 = n
+            for k in range(k_0, k_1):
+                a_ik = a[i, k]
+                for j in range(j_0, j_1):
+                    b[i, j] = b[i, j] - a_ik * b[k, j]
+            if not unit:
+                a_ii = a[i, i]
+                for j in range(j_0, j_1):
+                    b[i, j] = b[i, j] / a_ii
@@ -0,0 +1,197 @@
+import math
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from typing import Iterator, Tuple
+
+from ._validations import _ensure_ndarray
+
+def dense_to_packed(
+    a: ArrayLike
+) -> NDArray:
+    """
+    Convert lower triangle of square symmetric (or lower triangular)
+    matrix into packed storage of n(n + 1) / 2 elements.
+    Rectangular full packed layout (LAPACK RFP) is used: with
+    k1 = n - n // 2 packed array reshaped to (n + 1 - n % 2, k1) holds
+    lower triangle of A[:k1, :k1] in its rows `1 - n % 2` and below,
+    lower triangle of A[k1:, k1:] transposed in its upper triangle
+    shifted by `n % 2` columns, and A[k1:, :k1] in its last n // 2 rows.
+    All three blocks are strided views, so factorizations and solves
+    on packed storage use matrix products and triangular solves.
+
+    Parameters
+    ----------
+    a : ArrayLike of shape (n, n)
+        input square matrix A, upper triangle is not referenced
+
+    Returns
+    -------
+    ap : ndarray of shape (n * (n + 1) // 2,)
+        lower triangle of A in packed storage
+    """
+    a = _ensure_ndarray(
+        a,
+        ensure_square=True,
+        copy=False
+    )
+    n = a.shape[0]
+
+    ap = np.zeros(n * (n + 1) // 2, dtype=a.dtype)
+    t1, s, t2 = _packed_blocks(ap, n)
+    k1 = t1.shape[0]
+    # blocks T1 and T2 share rows of storage, so rows are copied
+    # up to diagonal
+    for i in range(k1):
+        t1[i, :i + 1] = a[i, :i + 1]
+    for i in range(n - k1):
+        t2[i, :i + 1] = a[k1 + i, k1:k1 + i + 1]
+    s[:] = a[k1:, :k1]
+
+    return ap
+
+def packed_to_dense(
+    ap: ArrayLike,
+    symmetric: bool = True
+) -> NDArray:
+    """
+    Convert packed storage (see `dense_to_packed`) into square matrix.
+
+    Parameters
+    ----------
+    ap : ArrayLike of shape (n * (n + 1) // 2,)
+        lower triangle of A in packed storage
+    symmetric : bool (default: True)
+        - ``True`` return symmetric A
+        - ``False`` return lower triangle of A, zeros above diagonal
+
+    Returns
+    -------
+    a : ndarray of shape (n, n)
+        A in dense storage
+    """
+    ap = _ensure_ndarray(
+        ap,
+        ensure_1d=True,
+        copy=False
+    )
+    n = _packed_n(ap.size)
+
+    a = np.zeros((n, n), dtype=ap.dtype)
+    t1, s, t2 = _packed_blocks(ap, n)
+    k1 = t1.shape[0]
+    for i in range(k1):
+        a[i, :i + 1] = t1[i, :i + 1]
+    for i in range(n - k1):
+        a[k1 + i, k1:k1 + i + 1] = t2[i, :i + 1]
+    a[k1:, :k1] = s
+
+    if symmetric:
+        for i in range(n):
+            a[:i, i] = a[i, :i]
+
+    return a
+
+def _packed_n(size: int) -> int:
+    # order n of matrix with n(n + 1) / 2 packed elements
+    n = (math.isqrt(8 * size + 1) - 1) // 2
+    if n * (n + 1) // 2 != size:
+        raise ValueError(
+            "Packed storage must have n * (n + 1) / 2 elements,"
+            f" got {size}."
+        )
+    return n
+
+def _packed_blocks(
+    ap: NDArray,
+    n: int
+) -> Tuple[NDArray, NDArray, NDArray]:
+    """
+    Views (T1, S, T2) of packed `ap` on blocks A[:k1, :k1], A[k1:, :k1]
+    and A[k1:, k1:] with k1 = n - n // 2, only lower triangles of T1 and T2
+    belong to them
+    """
+    k1 = n - n // 2
+    k2 = n // 2
+    off = 1 - n % 2
+    r = ap.reshape(n + off, k1)
+
+    t1 = r[off:off + k1]
+    s = r[k1 + off:]
+    t2 = r[:k2, 1 - off:].T
+    return t1, s, t2
+
+def _packed_pieces(
+    k1: int,
+    r0: int,
+    r1: int,
+    c0: int,
+    c1: int
+) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Split rectangle A[r0:r1, c0:c1] of lower triangle of A
+    into parts lying in blocks T1, S, T2 (see `_packed_blocks`)
+    """
+    for r_a, r_b in ((r0, min(r1, k1)), (max(r0, k1), r1)):
+        for c_a, c_b in ((c0, min(c1, k1)), (max(c0, k1), c1)):
+            if r_a < r_b and c_a < c_b:
+                yield r_a, r_b, c_a, c_b
+
+def _packed_block(
+    blocks: Tuple[NDArray, NDArray, NDArray],
+    r0: int,
+    r1: int,
+    c0: int,
+    c1: int
+) -> NDArray:
+    """
+    View of A[r0:r1, c0:c1] lying in one of `blocks` (see `_packed_pieces`)
+    """
+    t1, s, t2 = blocks
+    k1 = t1.shape[0]
+    if r0 < k1:
+        return t1[r0:r1, c0:c1]
+    elif c0 < k1:
+        return s[r0 - k1:r1 - k1, c0:c1]
+    else:
+        return t2[r0 - k1:r1 - k1, c0 - k1:c1 - k1]
+
+def _packed_get(
+    blocks: Tuple[NDArray, NDArray, NDArray],
+    r0: int,
+    r1: int,
+    c0: int,
+    c1: int
+) -> NDArray:
+    # copy of A[r0:r1, c0:c1] lying in lower triangle of A
+    x = np.empty((r1 - r0, c1 - c0), dtype=blocks[0].dtype)
+    for r_a, r_b, c_a, c_b in _packed_pieces(blocks[0].shape[0], r0, r1, c0, c1):
+        x[r_a - r0:r_b - r0, c_a - c0:c_b - c0] = _packed_block(blocks, r_a, r_b, c_a, c_b)
+    return x
+
+def _packed_set(
+    blocks: Tuple[NDArray, NDArray, NDArray],
+    r0: int,
+    r1: int,
+    c0: int,
+    c1: int,
+    x: NDArray
+) -> None:
+    # set A[r0:r1, c0:c1] lying in lower triangle of A to `x`
+    for r_a, r_b, c_a, c_b in _packed_pieces(blocks[0].shape[0], r0, r1, c0, c1):
+        _packed_block(blocks, r_a, r_b, c_a, c_b)[:] = x[r_a - r0:r_b - r0, c_a - c0:c_b - c0]
+
+def _packed_matvec(
+    blocks: Tuple[NDArray, NDArray, NDArray],
+    r0: int,
+    r1: int,
+    c0: int,
+    c1: int,
+    x: NDArray
+) -> NDArray:
+    # A[r0:r1, c0:c1] @ x for rectangle lying in lower triangle of A
+    y = np.zeros(r1 - r0, dtype=blocks[0].dtype)
+    for r_a, r_b, c_a, c_b in _packed_pieces(blocks[0].shape[0], r0, r1, c0, c1):
+        y[r_a - r0:r_b - r0] += np.matmul(
+            _packed_block(blocks, r_a, r_b, c_a, c_b), x[c_a - c0:c_b - c0]
+        )
+    return y
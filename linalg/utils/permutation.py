@@ -1,6 +1,6 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
-from typing import Literal, Tuple
+from typing import Literal, Tuple, Union
 
 from ._validations import _ensure_ndarray
 
@@ -12,26 +12,35 @@ def decode_permutation(
 
     Parameters
     ----------
-    p_ids : ArrayLike of shape (n,)
-        encoded permutation vector
+    p_ids : ArrayLike of shape (n,) or (k, n)
+        encoded permutation vector or stack of vectors
     
     Returns
     -------
-    p : ndarray of shape (n, n)
+    p : ndarray of shape (n, n) or (k, n, n)
         permutation matrix such that
         - p @ A permutes rows of A
         - A @ p permutes cols of A
     """
     p_ids = _ensure_ndarray(
         p_ids,
-        ensure_1d=True,
         dtype="int32"
     )
-    n = p_ids.size
+    if p_ids.ndim not in [1, 2]:
+        raise ValueError(
+            "`p_ids` must be 1d vector or 2d stack of vectors"
+            f", got {p_ids.ndim}d."
+        )
+    n = p_ids.shape[-1]
     ids = np.arange(n, dtype="int32")
 
-    p = np.identity(n, dtype="int32")
-    p[p_ids] = p[ids]
+    if p_ids.ndim == 1:
+        p = np.identity(n, dtype="int32")
+        p[p_ids] = p[ids]
+    else:
+        k = p_ids.shape[0]
+        p = np.zeros((k, n, n), dtype="int32")
+        p[np.arange(k)[:, np.newaxis], p_ids, ids] = 1
     return p
 
 def encode_permutation(
@@ -61,6 +70,53 @@ def encode_permutation(
     p_ids = np.arange(n, dtype="int32")
     return np.dot(p_ids, p)
 
+def permutation_sign(
+    p_ids: ArrayLike
+) -> Union[int, NDArray]:
+    """
+    Get sign (parity) of encoded permutation
+
+    Parameters
+    ----------
+    p_ids : ArrayLike of shape (n,) or (k, n)
+        encoded permutation vector or stack of vectors
+    
+    Returns
+    -------
+    sign : int or ndarray of shape (k,)
+        ``1`` for even permutation, ``-1`` for odd permutation
+    """
+    p_ids = _ensure_ndarray(
+        p_ids,
+        dtype="int64"
+    )
+    if p_ids.ndim not in [1, 2]:
+        raise ValueError(
+            "`p_ids` must be 1d vector or 2d stack of vectors"
+            f", got {p_ids.ndim}d."
+        )
+    is_1d = p_ids.ndim == 1
+    p_ids = np.atleast_2d(p_ids)
+    k, n = p_ids.shape
+    batch_ids = np.arange(k)
+    # positions of values in `p_ids`
+    pos = np.argsort(p_ids, axis=1)
+
+    # sort `p_ids` by transpositions and count them
+    sign = np.ones(k, dtype="int64")
+    for i in range(n):
+        j = pos[:, i]
+        p_i = p_ids[:, i]
+        sign[j != i] *= -1
+        p_ids[batch_ids, j] = p_i
+        pos[batch_ids, p_i] = j
+        p_ids[:, i] = i
+        pos[:, i] = i
+
+    if is_1d:
+        return int(sign[0])
+    return sign
+
 def to_triangle(
     a: ArrayLike,
     type: Literal["upper", "lower"] = "upper",
@@ -2,8 +2,9 @@ import numpy as np
 from numpy.typing import ArrayLike, NDArray
 from typing import Literal
 
-from ._validations import _ensure_ndarray
+from ._validations import _ensure_ndarray, FLOAT_DTYPES
 from .permutation import to_triangle
+from ._kernels import solve_triangular, solve_diagonal
 
 def solve_diag(
     a: ArrayLike,
@@ -31,13 +32,13 @@ def solve_diag(
     a = _ensure_ndarray(
         a,
         ensure_square=True,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
 
     is_b1d = False
@@ -45,7 +46,7 @@ def solve_diag(
         b = b[:, np.newaxis]
         is_b1d = True
 
-    b[:] = b / np.diag(a)[:, np.newaxis]
+    solve_diagonal(a, b)
 
     if is_b1d:
         b = b.ravel()
@@ -57,16 +58,21 @@ def solve_lower(
     b: ArrayLike,
     overwrite_b=False,
     transposed: bool = False,
-    unit: bool = False
+    unit: bool = False,
+    block_size: int = 64
 ) -> NDArray:
     """
     Solve AX=B, where A is a lower triangle matrix
+    or a stack of lower triangle matrices.
+    Blocked algorithm: each diagonal block of A is solved by
+    substitution, remaining rows of B are updated with one
+    matrix product per block.
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
+    a : ArrayLike of shape (n, n) or (k, n, n)
         input matrix A
-    b : ArrayLike of shape (n, m)
+    b : ArrayLike of shape (n, m) or (k, n, m)
         input matrix B, such that
         m - number of systems A x X[:,i] = B[:,i], i in [1, m]
     overwrite_b : bool (default: False)
@@ -78,47 +84,42 @@ def solve_lower(
     unit : bool (default: False)
         - ``True`` assume diagonal entries of A to 1.0
         - ``False`` no any assumptions
+    block_size : int (default: 64)
+        size of diagonal blocks of A
 
     Returns
     -------
-    b : ndarray of shape (n, m)
+    b : ndarray of shape (n, m) or (k, n, m)
         overwriten array `b` with m solution vectors
     """
     a = _ensure_ndarray(
         a,
         ensure_square=True,
-        dtype="float64"
+        allow_stacked=True,
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     
+    if not isinstance(block_size, int) or block_size < 1:
+        raise ValueError(
+            "`block_size` must be a positive integer,"
+            f" got {block_size}."
+        )
+
     is_b1d = False
-    if b.ndim == 1:
-        b = b[:, np.newaxis]
+    if b.ndim == a.ndim - 1:
+        b = b[..., np.newaxis]
         is_b1d = True
 
-    n = a.shape[0]
-    if not transposed:
-        if not unit:
-            for i in range(n):
-                b[i] = (b[i] - np.dot(a[i, :i], b[:i])) / a[i, i]
-        else:
-            for i in range(n):
-                b[i] = b[i] - np.dot(a[i, :i], b[:i])
-    else:
-        if not unit:
-            for i in range(n-1, -1, -1):
-                b[i] = (b[i] - np.dot(a[i+1:, i], b[i+1:])) / a[i, i]
-        else:
-            for i in range(n-1, -1, -1):
-                b[i] = b[i] - np.dot(a[i+1:, i], b[i+1:])
+    solve_triangular(a, b, lower=True, transposed=transposed, unit=unit, block_size=block_size)
 
     if is_b1d:
-        b = b.ravel()
+        b = b[..., 0]
 
     return b
 
@@ -127,16 +128,21 @@ def solve_upper(
     b: ArrayLike,
     overwrite_b=False,
     transposed: bool = False,
-    unit: bool = False
+    unit: bool = False,
+    block_size: int = 64
 ) -> NDArray:
     """
     Solve AX=B, where A is an upper triangle matrix
+    or a stack of upper triangle matrices.
+    Blocked algorithm: each diagonal block of A is solved by
+    substitution, remaining rows of B are updated with one
+    matrix product per block.
 
     Parameters
     ----------
-    a : ArrayLike of shape (n, n)
+    a : ArrayLike of shape (n, n) or (k, n, n)
         input matrix A
-    b : ArrayLike of shape (n, m)
+    b : ArrayLike of shape (n, m) or (k, n, m)
         input matrix B, such that
         m - number of systems A x X[:,i] = B[:,i], i in [1, m]
     overwrite_b : bool (default: False)
@@ -148,47 +154,42 @@ def solve_upper(
     unit : bool (default: False)
         - ``True`` assume diagonal entries of A to 1.0
         - ``False`` no any assumptions
+    block_size : int (default: 64)
+        size of diagonal blocks of A
 
     Returns
     -------
-    b : ndarray of shape (n, m)
+    b : ndarray of shape (n, m) or (k, n, m)
         overwriten array `b` with m solution vectors
     """
     a = _ensure_ndarray(
         a,
         ensure_square=True,
-        dtype="float64"
+        allow_stacked=True,
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
+    
+    if not isinstance(block_size, int) or block_size < 1:
+        raise ValueError(
+            "`block_size` must be a positive integer,"
+            f" got {block_size}."
+        )
 
     is_b1d = False
-    if b.ndim == 1:
-        b = b[:, np.newaxis]
+    if b.ndim == a.ndim - 1:
+        b = b[..., np.newaxis]
         is_b1d = True
 
-    n = a.shape[0]
-    if not transposed:
-        if not unit:
-            for i in range(n-1, -1, -1):
-                b[i] = (b[i] - np.dot(a[i, i+1:], b[i+1:])) / a[i, i]
-        else:
-            for i in range(n-1, -1, -1):
-                b[i] = b[i] - np.dot(a[i, i+1:], b[i+1:])
-    else:
-        if not unit:
-            for i in range(n):
-                b[i] = (b[i] - np.dot(a[:i, i], b[:i])) / a[i, i]
-        else:
-            for i in range(n):
-                b[i] = b[i] - np.dot(a[:i, i], b[:i])
+    solve_triangular(a, b, lower=False, transposed=transposed, unit=unit, block_size=block_size)
 
     if is_b1d:
-        b = b.ravel()
+        b = b[..., 0]
 
     return b
 
@@ -241,7 +242,7 @@ def solve_triangle(
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     if type not in ["upper", "lower"]:
         raise ValueError(
@@ -258,10 +259,7 @@ def solve_triangle(
 
     n = a.shape[0]
     b[:] = b[row_ids]
-    if type == "upper":
-        b = solve_upper(a, b, overwrite_b=True, transposed=transposed, unit=unit)
-    elif type == "lower":
-        b = solve_lower(a, b, overwrite_b=True, transposed=transposed, unit=unit)
+    solve_triangular(a, b, lower=type == "lower", transposed=transposed, unit=unit)
     ids = np.arange(n)
     b[col_ids] = b[ids]
 
@@ -1,7 +1,8 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
-from ._validations import _ensure_ndarray
+from ._validations import _ensure_ndarray, FLOAT_DTYPES
+from ._kernels import solve_triangular_band, lu_band_forward
 
 def solve_lower_band(
     a: ArrayLike,
@@ -46,13 +47,14 @@ def solve_lower_band(
     a = _ensure_ndarray(
         a,
         ensure_square=True,
-        dtype="float64"
+        copy=False,
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     
     is_b1d = False
@@ -60,25 +62,72 @@ def solve_lower_band(
         b = b[:, np.newaxis]
         is_b1d = True
 
-    n = a.shape[0]
-    if not transposed:
-        if not unit:
-            for i in range(n):
-                l_b = np.maximum(i - l, 0)
-                b[i] = (b[i] - np.dot(a[i, l_b:i], b[l_b:i])) / a[i, i]
-        else:
-            for i in range(n):
-                l_b = np.maximum(i - l, 0)
-                b[i] = b[i] - np.dot(a[i, l_b:i], b[l_b:i])
-    else:
-        if not unit:
-            for i in range(n-1, -1, -1):
-                u_b = np.minimum(i + l + 1, n)
-                b[i] = (b[i] - np.dot(a[i+1:u_b, i], b[i+1:u_b])) / a[i, i]
-        else:
-            for i in range(n-1, -1, -1):
-                u_b = np.minimum(i + l + 1, n)
-                b[i] = b[i] - np.dot(a[i+1:u_b, i], b[i+1:u_b])
+    solve_triangular_band(a, b, lower=True, bw=l, transposed=transposed, unit=unit)
+
+    if is_b1d:
+        b = b.ravel()
+
+    return b
+
+def solve_lower_band_piv(
+    a: ArrayLike,
+    l: int,
+    piv: ArrayLike,
+    b: ArrayLike,
+    overwrite_b=False
+) -> NDArray:
+    """
+    Forward sweep of band LU decomposition: solve AX = B, where
+    A = P_0 L_0 P_1 L_1 ... P_{n-2} L_{n-2}, P_i interchanges rows i and
+    piv[i], L_i is a unit lower triangular elementary matrix with
+    multipliers in `a[i+1:i+l+1, i]`. Interchanges and band updates
+    are applied together in O(n * l * m).
+
+    Parameters
+    ----------
+    a : ArrayLike of shape (n, n)
+        square input matrix with multipliers of L with
+        bandwidth `l` in low triangle (see `lu_band`)
+    l : int
+        lower bandwidth of L
+    piv : ArrayLike of shape (n,)
+        interchange sequence, row i was interchanged
+        with row piv[i] on i-th step of elimination
+    b : ArrayLike of shape (n, m)
+        input matrix B, such that
+        m - number of systems A x X[:,i] = B[:,i], i in [1, m]
+    overwrite_b : bool (default: False)
+        allow to overwrite `b` matrix
+    
+    Returns
+    -------
+    b : ndarray of shape (n, m)
+        overwriten array `b` with m solution vectors
+    """
+    a = _ensure_ndarray(
+        a,
+        ensure_square=True,
+        copy=False,
+        dtype=FLOAT_DTYPES
+    )
+    piv = _ensure_ndarray(
+        piv,
+        ensure_1d=True,
+        dtype="int64"
+    )
+    copy_b = not overwrite_b
+    b = _ensure_ndarray(
+        b,
+        copy=copy_b,
+        dtype=FLOAT_DTYPES
+    )
+    
+    is_b1d = False
+    if b.ndim == 1:
+        b = b[:, np.newaxis]
+        is_b1d = True
+
+    lu_band_forward(a, l, piv, b)
 
     if is_b1d:
         b = b.ravel()
@@ -128,13 +177,14 @@ def solve_upper_band(
     a = _ensure_ndarray(
         a,
         ensure_square=True,
-        dtype="float64"
+        copy=False,
+        dtype=FLOAT_DTYPES
     )
     copy_b = not overwrite_b
     b = _ensure_ndarray(
         b,
         copy=copy_b,
-        dtype="float64"
+        dtype=FLOAT_DTYPES
     )
     
     is_b1d = False
@@ -142,25 +192,7 @@ def solve_upper_band(
         b = b[:, np.newaxis]
         is_b1d = True
 
-    n = a.shape[0]
-    if not transposed:
-        if not unit:
-            for i in range(n-1, -1, -1):
-                u_b = np.minimum(i + u + 1, n)
-                b[i] = (b[i] - np.dot(a[i, i+1:u_b], b[i+1:u_b])) / a[i, i]
-        else:
-            for i in range(n-1, -1, -1):
-                u_b = np.minimum(i + u + 1, n)
-                b[i] = b[i] - np.dot(a[i, i+1:u_b], b[i+1:u_b])
-    else:
-        if not unit:
-            for i in range(n):
-                l_b = np.maximum(i - u, 0)
-                b[i] = (b[i] - np.dot(a[l_b:i, i], b[l_b:i])) / a[i, i]
-        else:
-            for i in range(n):
-                l_b = np.maximum(i - u, 0)
-                b[i] = b[i] - np.dot(a[l_b:i, i], b[l_b:i])
+    solve_triangular_band(a, b, lower=False, bw=u, transposed=transposed, unit=unit)
 
     if is_b1d:
         b = b.ravel()
@@ -0,0 +1,50 @@
+import math
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+from typing import Dict, Tuple
+
+class Workspace:
+    """
+    Reusable scratch buffers of factorization loops (`lu`, `cholesky`,
+    `qr_house`, `bidiag`, `house_hess`). Every temporary of a loop step
+    is a view of a named buffer, buffer is allocated on first request
+    and grows only if a larger view is requested. Factorizations of
+    matrices not larger than the previous ones allocate no scratch memory.
+
+    With ``overwrite_a=True`` and economic output repeated
+    factorizations run without steady-state allocations.
+    Workspace must not be shared between concurrently running calls.
+    """
+    def __init__(self):
+        self._buffers: Dict[Tuple[str, np.dtype], NDArray] = {}
+
+    def get(
+        self,
+        name: str,
+        shape: Tuple[int, ...],
+        dtype: DTypeLike = np.float64
+    ) -> NDArray:
+        """
+        Get C-contiguous uninitialized view of shape `shape`
+        on buffer `name` of dtype `dtype`
+        """
+        size = math.prod(shape)
+        key = (name, np.dtype(dtype))
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[key] = buffer
+        return buffer[:size].reshape(shape)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Total size of allocated buffers in bytes
+        """
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def clear(self) -> None:
+        """
+        Release all buffers
+        """
+        self._buffers.clear()
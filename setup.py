@@ -20,6 +20,22 @@ givens_ext = Extension(
     extra_link_args=["-fopenmp"]
 )
 
+pivot_ext = Extension(
+    name="linalg.transforms.cy_pivot",
+    sources=["linalg/transforms/cy_pivot.pyx"],
+    include_dirs=[np.get_include()],
+    extra_compile_args=["-fopenmp"],
+    extra_link_args=["-fopenmp"]
+)
+
+solve_ext = Extension(
+    name="linalg.utils.cy_solve",
+    sources=["linalg/utils/cy_solve.pyx"],
+    include_dirs=[np.get_include()],
+    extra_compile_args=["-fopenmp"],
+    extra_link_args=["-fopenmp"]
+)
+
 setup(
     name="linalg",
     version=__version__,
@@ -28,6 +44,6 @@ setup(
     python_requires=">=3.9",
     install_requires=["numpy>=1.22.3", "Cython>=0.29.32"],
     packages=find_packages(),
-    ext_modules=cythonize([house_ext, givens_ext]),
+    ext_modules=cythonize([house_ext, givens_ext, pivot_ext, solve_ext]),
     zip_safe=False
 )
\ No newline at end of file
@@ -4,6 +4,8 @@ from numpy.testing import assert_allclose
 from linalg.lu.lu_band import lu_band, lu_band_solve
 from linalg.sym_decomp.ldlt_band import ldlt_band, sym_band_solve
 from linalg.sympos_decomp.cholesky_band import cholesky_band, sympos_band_solve
+from linalg.utils.band import dense_to_band, band_to_dense
+from linalg.utils.solve_band import solve_lower_band, solve_upper_band
 
 
 def test_banded():
@@ -48,3 +50,70 @@ def test_banded():
 
     x = sym_band_solve(a, 2, b)
     assert_allclose(b, a @ x, atol=1e-12)
+
+def test_banded_storage():
+    a = np.array([
+        [5, 2, -1, 0, 0, 0],
+        [2, 4, 2, -2, 0, 0],
+        [0, 3, 3, 2, -3, 0],
+        [0, 0, 1, 2, 2, -3],
+        [0, 0, 0, 4, 1, 2],
+        [0, 0, 0, 0, 2, -1]
+    ])
+    ab = dense_to_band(a, 1, 2)
+    assert ab.shape == (5, 6)
+    assert_allclose(a, band_to_dense(ab, 1, 2))
+
+    # test lu
+    l, u, p = lu_band(ab, 1, 2, storage="band")
+    assert_allclose(a, p @ l @ u, atol=1e-12)
+
+    # test solve
+    b = np.array([[0, 1], [1, 2], [2, 3], [2, 4], [3, 5], [3, 6]])
+    x = lu_band_solve(ab, 1, 2, b, storage="band")
+    assert_allclose(b, a @ x, atol=1e-12)
+
+
+def test_banded_pivoting():
+    rng = np.random.default_rng(0)
+    n, l, u = 40, 3, 2
+    a = np.triu(np.tril(rng.standard_normal((n, n)), u), -l)
+    b = rng.standard_normal((n, 3))
+
+    # multipliers of L stay within lower bandwidth
+    lu, piv = lu_band(a, l, u, mode="economic")
+    assert np.all(np.tril(lu, -l - 1) == 0.0)
+    assert np.all(piv >= np.arange(n))
+
+    l_full, u_full, p = lu_band(a, l, u)
+    assert_allclose(a, p @ l_full @ u_full, atol=1e-12)
+
+    for storage, a_in in [("dense", a), ("band", dense_to_band(a, l, u))]:
+        x = lu_band_solve(a_in, l, u, b, storage=storage)
+        assert_allclose(b, a @ x, atol=1e-10)
+
+
+def test_band_substitution():
+    rng = np.random.default_rng(0)
+    n, l, u = 30, 3, 2
+    a = np.triu(np.tril(rng.standard_normal((n, n)), u), -l) + n * np.identity(n)
+    # more systems than one chunk of compiled kernel
+    b = rng.standard_normal((n, 70))
+
+    for solve_func, t, bw in [
+        (solve_lower_band, np.tril(a), l),
+        (solve_upper_band, np.triu(a), u)
+    ]:
+        for transposed in [False, True]:
+            for unit in [False, True]:
+                t_ = t.copy()
+                if unit:
+                    np.fill_diagonal(t_, 1.0)
+                if transposed:
+                    t_ = t_.T
+                x = solve_func(t, bw, b, transposed=transposed, unit=unit)
+                assert_allclose(b, t_ @ x, atol=1e-12)
+
+                # mixed precision falls back to numpy substitution
+                x_32 = solve_func(t.astype(np.float32), bw, b, transposed=transposed, unit=unit)
+                assert_allclose(x, x_32, rtol=1e-4, atol=1e-5)
@@ -1,7 +1,11 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 
 from linalg.sympos_decomp.cholesky import cholesky, sympos_solve
+from linalg.sympos_decomp.cho_factor import cho_factor
+from linalg.sympos_decomp.cholesky_update import cholesky_update, cholesky_downdate
+from linalg.utils.packed import dense_to_packed, packed_to_dense
 
 def test_cholesky():
     # check decomposition
@@ -23,3 +27,69 @@ def test_cholesky():
     b = np.array([7, 8, -4, 6])
     x = sympos_solve(a, b)
     assert_allclose(b, a @ x, atol=1e-12)
+
+def test_cho_factor():
+    a = np.array([
+        [4, 1, -1, 0],
+        [1, 3, -1, 0],
+        [-1, -1, 5, 2],
+        [0, 0, 2, 4]
+    ])
+    b = np.array([[7, 1], [8, 2], [-4, 3], [6, 4]])
+    factor = cho_factor(a)
+    assert_allclose(b, a @ factor.solve(b), atol=1e-12)
+    assert_allclose(b, a.T @ factor.solve_transposed(b), atol=1e-12)
+    assert_allclose(np.linalg.det(a), factor.det(), atol=1e-12)
+    assert_allclose(np.identity(4), a @ factor.inv(), atol=1e-12)
+
+@pytest.mark.parametrize("block_size", [1, 7, 64, 200])
+def test_cholesky_blocked(block_size):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((150, 150))
+    a = x @ x.T + 150 * np.identity(150)
+    l = cholesky(a, mode="economic", block_size=block_size)
+    assert_allclose(np.tril(l), np.linalg.cholesky(a), atol=1e-10)
+    # strict upper triangle keeps A
+    assert_allclose(np.triu(l, 1), np.triu(a, 1))
+
+    a[100, 100] = -1.0
+    with pytest.raises(RuntimeError):
+        cholesky(a, block_size=block_size)
+
+@pytest.mark.parametrize("n, block_size", [(1, 64), (6, 2), (7, 2), (150, 16)])
+def test_cholesky_packed(n, block_size):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((n, n))
+    a = x @ x.T + n * np.identity(n)
+    ap = dense_to_packed(a)
+
+    l = cholesky(ap, mode="economic", block_size=block_size, storage="packed")
+    assert l.shape == (n * (n + 1) // 2,)
+    assert_allclose(packed_to_dense(l, symmetric=False), np.linalg.cholesky(a), atol=1e-10)
+    assert_allclose(cholesky(ap, storage="packed"), np.linalg.cholesky(a), atol=1e-10)
+
+    b = rng.standard_normal(n)
+    assert_allclose(a @ sympos_solve(ap, b, storage="packed"), b, atol=1e-10)
+
+    with pytest.raises(ValueError):
+        cholesky(np.append(ap, 0.0), storage="packed")
+
+def test_cholesky_update():
+    rng = np.random.default_rng(0)
+    y = rng.standard_normal((30, 30))
+    a = y @ y.T + 30 * np.identity(30)
+    x = rng.standard_normal(30)
+    l = cholesky(a, mode="economic")
+
+    l_up = cholesky_update(l, x)
+    assert_allclose(np.tril(l_up), np.linalg.cholesky(a + np.outer(x, x)), atol=1e-10)
+
+    l_down = cholesky_downdate(l_up, x, overwrite_l=True)
+    assert np.shares_memory(l_down, l_up)
+    assert_allclose(np.tril(l_down), np.tril(l), atol=1e-10)
+
+    # A - xx^T has negative A[0, 0]
+    x = np.zeros(30)
+    x[0] = 2.0 * np.sqrt(a[0, 0])
+    with pytest.raises(RuntimeError):
+        cholesky_downdate(l, x)
@@ -32,7 +32,7 @@ from linalg.elim import determinant
         )
     ]
 )
-@pytest.mark.parametrize("piv_option", ["row", "col", "full"])
+@pytest.mark.parametrize("piv_option", ["row", "col", "full", "rook"])
 @pytest.mark.parametrize("strategy", ["gauss", "gaussj"])
 def test_gauss_solve(a, b, piv_option, strategy):
     x = solve_elim(a, b, piv_option=piv_option, strategy=strategy)
@@ -49,6 +49,20 @@ def test_gauss_inv():
     identity = np.identity(a.shape[0])
     assert_allclose(identity, a @ a_inv, atol=1e-12)
 
+@pytest.mark.parametrize("piv_option", ["row", "col", "full", "rook"])
+@pytest.mark.parametrize("strategy", ["gauss", "gaussj"])
+def test_gauss_inv_inplace(piv_option, strategy):
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((50, 50))
+    a_copy = a.copy()
+    a_inv = inverse(a, piv_option=piv_option, strategy=strategy, overwrite_a=True)
+    assert_allclose(np.identity(50), a_copy @ a_inv, atol=1e-10)
+    if strategy == "gaussj":
+        assert np.shares_memory(a, a_inv)
+
+    with pytest.raises(RuntimeError):
+        inverse(np.ones((3, 3)), piv_option=piv_option, strategy="gaussj")
+
 def test_gauss_det():
     a = np.array([
         [4, 5, 2, 3],
@@ -1,12 +1,26 @@
 import numpy as np
+import pytest
+import tracemalloc
 from numpy.testing import assert_allclose
 
 from linalg import solve
 from linalg import solve_triangle
-from linalg import det
+from linalg import det, slogdet
 from linalg import inv
 from linalg import solve_band, solves_band
 from linalg import qr
+from linalg import condest, rcond
+from linalg import solve_stream
+from linalg import Workspace
+from linalg.lu import lu, lu_factor, lu_solve
+from linalg.sympos_decomp import cholesky, cho_factor, sympos_solve
+from linalg.sym_decomp import ldlt, ldlt_factor, sym_solve
+from linalg.qr_decomp import qr_house
+from linalg.svd_decomp import bidiag
+from linalg.eig_unsym import house_hess
+from linalg.utils.band import dense_to_band
+from linalg.utils.solve import solve_lower, solve_upper
+from linalg.solve import _detect_structure, _solve_mixed
 
 def test_general():
     # test solve
@@ -98,3 +112,292 @@ def test_general():
     ])
     q, r, p = qr(a, mode="full", pivoting=True, decode_p=True)
     assert_allclose(a, q @ r @ p, atol=1e-12)
+
+def test_general_stacked():
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((10, 5, 5))
+    assert_allclose(np.linalg.det(a), det(a), atol=1e-12)
+    assert_allclose(np.tile(np.identity(5), (10, 1, 1)), a @ inv(a), atol=1e-12)
+
+
+def test_solve_mixed():
+    rng = np.random.default_rng(0)
+    n = 50
+    a = rng.standard_normal((n, n))
+    b = rng.standard_normal((n, 2))
+    eps = np.finfo(np.float64).eps
+
+    for assume_a, m in [("gen", a), ("sym", a + a.T), ("pos", a @ a.T + n * np.identity(n))]:
+        x = solve(m, b, assume_a=assume_a, precision="mixed")
+        assert x.dtype == np.float64
+        # float64 backward error is reached
+        r = np.max(np.abs(b - m @ x), axis=0)
+        bound = np.sqrt(n) * eps * np.linalg.norm(m, np.inf) * np.max(np.abs(x), axis=0)
+        assert np.all(r <= bound)
+
+    # zero column of B converges at once, no float64 fallback
+    b[:, 1] = 0.0
+    x = _solve_mixed(a.copy(), b, "gen")
+    assert x is not None
+    assert np.all(x[:, 1] == 0.0)
+    assert_allclose(solve(a, b), x)
+
+    # refinement stalls for ill-conditioned matrix, float64 fallback is used
+    q, _ = np.linalg.qr(rng.standard_normal((n, n)))
+    m = q @ np.diag(np.logspace(0, -12, n)) @ q.T
+    assert_allclose(solve(m, b), solve(m, b, precision="mixed"))
+
+
+@pytest.mark.parametrize("assume_a", ["gen", "sym", "pos"])
+def test_general_float32(assume_a):
+    rng = np.random.default_rng(0)
+    n = 20
+    a = rng.standard_normal((n, n))
+    if assume_a == "sym":
+        a = a + a.T
+    elif assume_a == "pos":
+        a = a @ a.T + n * np.identity(n)
+    a = a.astype(np.float32)
+    b = rng.standard_normal(n).astype(np.float32)
+
+    # float32 is kept end to end
+    x = solve(a, b, assume_a=assume_a)
+    assert x.dtype == np.float32
+    assert_allclose(b, a @ x, atol=1e-4)
+    for out in [lu(a), cholesky(a) if assume_a == "pos" else ldlt(a), bidiag(a), house_hess(a)]:
+        assert all(o.dtype == np.float32 for o in out if o.dtype.kind == "f")
+    assert inv(a).dtype == np.float32
+    assert det(a).dtype == np.float32
+
+
+@pytest.mark.parametrize("assume_a", ["gen", "sym", "pos"])
+def test_condest(assume_a):
+    rng = np.random.default_rng(0)
+    n = 30
+    q_1, _ = np.linalg.qr(rng.standard_normal((n, n)))
+    q_2, _ = np.linalg.qr(rng.standard_normal((n, n)))
+    s = np.logspace(0, -6, n)
+    if assume_a == "gen":
+        a = q_1 @ np.diag(s) @ q_2.T
+        factors = lu(a, mode="economic")
+    elif assume_a == "sym":
+        a = q_1 @ np.diag(s * (-1) ** np.arange(n)) @ q_1.T
+        factors = ldlt(a, mode="economic")
+    elif assume_a == "pos":
+        a = q_1 @ np.diag(s) @ q_1.T
+        factors = cholesky(a, mode="economic")
+
+    # estimate is a lower bound of condition number within small factor
+    cond = np.linalg.cond(a, 1)
+    est = condest(factors, np.linalg.norm(a, 1), assume_a=assume_a)
+    assert cond / 3 <= est <= cond * (1 + 1e-6)
+    assert_allclose(1.0 / est, rcond(factors, np.linalg.norm(a, 1), assume_a=assume_a))
+
+
+@pytest.mark.parametrize("block_size", [1, 5, 64])
+@pytest.mark.parametrize("transposed", [False, True])
+@pytest.mark.parametrize("unit", [False, True])
+def test_solve_blocked(block_size, transposed, unit):
+    rng = np.random.default_rng(0)
+    n = 23
+    a = rng.standard_normal((n, n)) + n * np.identity(n)
+    b = rng.standard_normal((n, 3))
+    for solve_func, tri in [(solve_lower, np.tril), (solve_upper, np.triu)]:
+        t = tri(a)
+        if unit:
+            np.fill_diagonal(t, 1.0)
+        if transposed:
+            t = t.T
+        x = solve_func(a, b, transposed=transposed, unit=unit, block_size=block_size)
+        assert_allclose(b, t @ x, atol=1e-12)
+
+
+def test_solve_auto():
+    rng = np.random.default_rng(0)
+    n = 40
+    a = rng.standard_normal((n, n))
+    b = rng.standard_normal(n)
+    band = np.triu(np.tril(a, 2), -3)
+    sym_band = np.triu(np.tril(a + a.T, 2), -2)
+    tridiag = np.triu(np.tril(a, 1), -1) + 4.0 * np.identity(n)
+
+    cases = [
+        ("diag", np.diag(np.diag(a))),
+        ("lower", np.tril(a) + n * np.identity(n)),
+        ("upper", np.triu(a) + n * np.identity(n)),
+        ("tridiag", tridiag),
+        # not diagonally dominant tridiagonal is solved with band LU
+        ("band", tridiag - 4.0 * np.identity(n)),
+        ("band", band),
+        ("sym_band", sym_band + 10.0 * np.identity(n)),
+        ("sym_band", sym_band),
+        ("pos", a @ a.T),
+        # positive diagonal, but not SPD: LDL^T fallback
+        ("pos", a + a.T + 4.0 * np.identity(n)),
+        ("sym", a + a.T),
+        ("gen", a)
+    ]
+    for kind, m in cases:
+        assert _detect_structure(m)[0] == kind
+        x = solve(m, b, assume_a="auto")
+        assert_allclose(b, m @ x, atol=1e-8)
+
+    l, u = _detect_structure(band)[1:]
+    assert (l, u) == (3, 2)
+
+    # bandwidths are found without index arrays of nonzeros
+    m = np.triu(rng.standard_normal((1000, 1000)), -5)
+    tracemalloc.start()
+    assert _detect_structure(m)[1:] == (5, 999)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 1000 * 1000
+
+    with pytest.raises(RuntimeError):
+        solve(np.diag(np.arange(n)), b, assume_a="auto")
+
+
+def test_solve_stream():
+    rng = np.random.default_rng(0)
+    n = 20
+    a = rng.standard_normal((n, n))
+    b = rng.standard_normal((n, 53))
+    # stream of single vectors and column blocks of different widths
+    rhs = [b[:, 0], b[:, 1:8], b[:, 8:40], b[:, 40], b[:, 41:]]
+
+    for factor in [lu_factor(a), ldlt_factor(a + a.T), cho_factor(a @ a.T)]:
+        for transposed in [False, True]:
+            blocks = list(solve_stream(factor, iter(rhs), chunk=16, transposed=transposed))
+            assert [x.shape[1] for x in blocks] == [16, 16, 16, 5]
+            solve_func = factor.solve_transposed if transposed else factor.solve
+            assert_allclose(np.hstack(blocks), solve_func(b), atol=1e-10)
+
+    with pytest.raises(ValueError):
+        solve_stream(lu_factor(a), rhs, chunk=0)
+    with pytest.raises(ValueError):
+        next(solve_stream(lu_factor(a), [np.ones(n + 1)]))
+    with pytest.raises(ValueError):
+        next(solve_stream(lu_factor(a), [np.ones((n, 2, 2))]))
+
+
+def test_solve_n_jobs():
+    rng = np.random.default_rng(0)
+    n = 30
+    a = rng.standard_normal((n, n))
+    spd = a @ a.T + n * np.identity(n)
+    band = np.triu(np.tril(a, 2), -3) + n * np.identity(n)
+    sym_band = np.triu(np.tril(spd, 2), -2)
+    b = rng.standard_normal((n, 50))
+
+    solvers = [
+        (a, lambda m, **kw: lu_solve(m, b, **kw)),
+        (a + a.T, lambda m, **kw: sym_solve(m, b, **kw)),
+        (spd, lambda m, **kw: sympos_solve(m, b, **kw)),
+        (band, lambda m, **kw: solve_band(m, 3, 2, b, **kw)),
+        (band, lambda m, **kw: solve_band(dense_to_band(m, 3, 2), 3, 2, b, storage="band", **kw)),
+        (sym_band, lambda m, **kw: solves_band(m, 2, b, ensure_pos=True, **kw)),
+        (sym_band, lambda m, **kw: solves_band(m, 2, b, **kw))
+    ]
+    for m, solve_func in solvers:
+        x = solve_func(m)
+        assert_allclose(b, m @ x, atol=1e-10)
+        # more threads than columns, uneven chunks
+        for n_jobs in [3, 64, None]:
+            assert_allclose(x, solve_func(m, n_jobs=n_jobs), atol=1e-12)
+
+    with pytest.raises(ValueError):
+        lu_solve(a, b, n_jobs=0)
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 64])
+def test_inv_inplace(block_size):
+    rng = np.random.default_rng(0)
+    for shape in [(1, 1), (17, 17), (4, 17, 17), (70, 70)]:
+        a = rng.standard_normal(shape)
+        a_inv = inv(a, block_size=block_size)
+        assert_allclose(np.linalg.inv(a), a_inv, atol=1e-10)
+
+    # inverse overwrites input
+    a = rng.standard_normal((10, 10))
+    a_inv = inv(a.copy(), overwrite_a=True, block_size=block_size)
+    assert_allclose(np.identity(10), a @ a_inv, atol=1e-12)
+
+    with pytest.raises(RuntimeError):
+        inv(np.ones((5, 5)), block_size=block_size)
+
+
+def test_slogdet():
+    rng = np.random.default_rng(0)
+    # det overflows for such matrices
+    a = rng.standard_normal((6, 200, 200)) * 100.0
+    spd = a @ np.swapaxes(a, -1, -2) + np.identity(200)
+
+    for m, assume_a in [(a, "gen"), (spd, "gen"), (spd, "pos")]:
+        sign, logdet = slogdet(m, assume_a=assume_a)
+        sign_np, logdet_np = np.linalg.slogdet(m)
+        assert sign.shape == logdet.shape == (6,)
+        assert_allclose(sign_np, sign)
+        assert_allclose(logdet_np, logdet)
+        sign, logdet = slogdet(m[0], assume_a=assume_a)
+        assert_allclose(sign_np[0], sign)
+        assert_allclose(logdet_np[0], logdet)
+
+    with pytest.raises(RuntimeError):
+        slogdet(a, assume_a="pos")
+
+    # singular matrices in stack do not affect other matrices
+    a = rng.standard_normal((4, 100, 100))
+    a[1, 50] = a[1, 10]
+    a[3, :, 70] = 0.0
+    sign, logdet = slogdet(a)
+    sign_np, logdet_np = np.linalg.slogdet(a[[0, 2]])
+    assert_allclose(sign[[1, 3]], 0.0)
+    assert_allclose(logdet[[1, 3]], -np.inf)
+    assert_allclose(sign[[0, 2]], sign_np)
+    assert_allclose(logdet[[0, 2]], logdet_np)
+    # blocked LU of single matrix
+    sign, logdet = slogdet(a[3])
+    assert sign == 0.0 and logdet == -np.inf
+
+@pytest.mark.parametrize("name", ["lu", "lu_unblocked", "cholesky", "qr_house", "bidiag", "house_hess"])
+def test_workspace(name):
+    rng = np.random.default_rng(0)
+    n = 400
+    x = rng.standard_normal((n, n))
+    src = x @ x.T + n * np.identity(n) if name == "cholesky" else x
+    a = src.copy()
+
+    def factorize(workspace):
+        if name == "lu":
+            return lu(a, mode="economic", overwrite_a=True, workspace=workspace)[0]
+        elif name == "lu_unblocked":
+            return lu(a, mode="economic", overwrite_a=True, block_size=n, workspace=workspace)[0]
+        elif name == "cholesky":
+            return cholesky(a, mode="economic", overwrite_a=True, workspace=workspace)
+        elif name == "qr_house":
+            # only R output is allocated
+            return qr_house(a, mode="r", overwrite_a=True, workspace=workspace)
+        elif name == "bidiag":
+            return bidiag(a, mode="economic", overwrite_a=True, workspace=workspace)
+        elif name == "house_hess":
+            return house_hess(a, mode="hess", overwrite_a=True, workspace=workspace)
+
+    expected = factorize(None).copy()
+
+    # warm up workspace, then repeat factorization of the same size
+    workspace = Workspace()
+    np.copyto(a, src)
+    factorize(workspace)
+    nbytes = workspace.nbytes
+    np.copyto(a, src)
+    tracemalloc.start()
+    result = factorize(workspace)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert_allclose(result, expected, atol=1e-10)
+    assert workspace.nbytes == nbytes
+    # no temporaries of matrix size, numpy keeps ufunc buffers
+    # of fixed size for strided operands
+    output = a.nbytes if name == "qr_house" else 0
+    assert peak - output < a.nbytes // 4
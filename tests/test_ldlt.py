@@ -3,6 +3,8 @@ import pytest
 from numpy.testing import assert_allclose
 
 from linalg.sym_decomp.ldlt import ldlt, sym_solve
+from linalg.sym_decomp.ldlt_factor import ldlt_factor
+from linalg.utils.packed import dense_to_packed, packed_to_dense
 
 @pytest.mark.parametrize("a",
     [
@@ -52,4 +54,34 @@ def test_ldlt(a):
 )
 def test_ldlt_solve(a, b):
     x = sym_solve(a, b, piv_option="sym")
-    assert_allclose(b, a @ x, atol=1e-12)
\ No newline at end of file
+    assert_allclose(b, a @ x, atol=1e-12)
+
+def test_ldlt_factor():
+    a = np.array([
+        [10, 0, 30],
+        [0, 0, 80],
+        [30, 80, 0]
+    ])
+    b = np.array([[1, 4], [2, 5], [3, 6]])
+    factor = ldlt_factor(a)
+    assert_allclose(b, a @ factor.solve(b), atol=1e-12)
+    assert_allclose(b, a.T @ factor.solve_transposed(b), atol=1e-12)
+    assert_allclose(np.linalg.det(a), factor.det(), atol=1e-8)
+    assert_allclose(np.identity(3), a @ factor.inv(), atol=1e-12)
+
+@pytest.mark.parametrize("n", [1, 6, 7, 50])
+def test_ldlt_packed(n):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((n, n))
+    a = x + x.T
+    ap = dense_to_packed(a)
+    assert ap.shape == (n * (n + 1) // 2,)
+    assert_allclose(packed_to_dense(ap), a)
+
+    a_ldlt, diag_ids = ldlt(a, mode="economic")
+    ap_ldlt, diag_ids_packed = ldlt(ap, mode="economic", storage="packed")
+    assert_allclose(diag_ids_packed, diag_ids)
+    assert_allclose(packed_to_dense(ap_ldlt, symmetric=False), np.tril(a_ldlt), atol=1e-10)
+
+    b = rng.standard_normal((n, 2))
+    assert_allclose(a @ sym_solve(ap, b, storage="packed"), b, atol=1e-8)
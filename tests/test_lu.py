@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from linalg.lu import lu_solve, lu
+from linalg.lu import lu_solve, lu, lu_factor, lu_update
 
 @pytest.mark.parametrize("a",
     [
@@ -19,7 +19,7 @@ from linalg.lu import lu_solve, lu
         ])
     ]
 )
-@pytest.mark.parametrize("piv_option", ["row", "col", "full"])
+@pytest.mark.parametrize("piv_option", ["row", "col", "full", "rook"])
 def test_lu(a, piv_option):
     l, u, p, q = lu(a, piv_option=piv_option)
     assert_allclose(a, p @ l @ u @ q, atol=1e-12)
@@ -50,7 +50,98 @@ def test_lu(a, piv_option):
         )
     ]
 )
-@pytest.mark.parametrize("piv_option", ["row", "col", "full"])
+@pytest.mark.parametrize("piv_option", ["row", "col", "full", "rook", "tournament"])
 def test_lu_solve(a, b, piv_option):
     x = lu_solve(a, b, piv_option=piv_option)
-    assert_allclose(b, a @ x, atol=1e-12)
\ No newline at end of file
+    assert_allclose(b, a @ x, atol=1e-12)
+
+@pytest.mark.parametrize("block_size", [1, 7, 32])
+def test_lu_blocked(block_size):
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((50, 50))
+    l, u, p, q = lu(a, block_size=block_size)
+    assert_allclose(a, p @ l @ u @ q, atol=1e-12)
+
+    # blocked and unblocked algorithms return the same economic layout
+    a_b, row_ids_b, col_ids_b = lu(a, mode="economic", block_size=block_size)
+    a_u, row_ids_u, col_ids_u = lu(a, mode="economic", block_size=a.shape[0])
+    assert_allclose(a_u, a_b, atol=1e-12)
+    assert np.array_equal(row_ids_u, row_ids_b)
+    assert np.array_equal(col_ids_u, col_ids_b)
+
+@pytest.mark.parametrize("n_jobs", [1, 3])
+@pytest.mark.parametrize("block_size", [4, 16, 64])
+def test_lu_tournament(n_jobs, block_size):
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((60, 60))
+    l, u, p, q = lu(a, piv_option="tournament", block_size=block_size, n_jobs=n_jobs)
+    assert_allclose(a, p @ l @ u @ q, atol=1e-12)
+    assert_allclose(np.identity(60), q)
+
+    # economic layout is shared with partial pivoting
+    a_t, row_ids, col_ids = lu(
+        a, piv_option="tournament", mode="economic", block_size=block_size, n_jobs=n_jobs
+    )
+    l_t = np.tril(a_t, -1) + np.identity(60)
+    assert_allclose(a[row_ids][:, col_ids], l_t @ np.triu(a_t), atol=1e-12)
+
+    a[:, 10] = 0.0
+    with pytest.raises(RuntimeError):
+        lu(a, piv_option="tournament", block_size=block_size, n_jobs=n_jobs)
+
+@pytest.mark.parametrize("piv_option", ["row", "col", "full", "rook"])
+def test_lu_factor(piv_option):
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((6, 6))
+    b = rng.standard_normal((6, 2))
+    factor = lu_factor(a, piv_option=piv_option)
+    assert_allclose(b, a @ factor.solve(b), atol=1e-12)
+    assert_allclose(b, a.T @ factor.solve_transposed(b), atol=1e-12)
+    assert_allclose(np.linalg.det(a), factor.det(), atol=1e-12)
+    assert_allclose(np.identity(6), a @ factor.inv(), atol=1e-12)
+
+    with pytest.raises(ValueError):
+        lu_factor(np.tile(a, (3, 1, 1)), piv_option=piv_option)
+    with pytest.raises(ValueError):
+        factor.solve(b[:5])
+
+@pytest.mark.parametrize("piv_option", ["row", "full"])
+@pytest.mark.parametrize("refactor_threshold", [None, 3])
+def test_lu_factor_update(piv_option, refactor_threshold):
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((8, 8))
+    b = rng.standard_normal((8, 2))
+
+    # Bennett rank-1 update of economic factors
+    x, y = rng.standard_normal(8), rng.standard_normal(8)
+    lu_a, row_ids, col_ids = lu(a, piv_option=piv_option, mode="economic")
+    lu_a, row_ids, col_ids = lu_update(lu_a, row_ids, col_ids, x, y)
+    l = np.tril(lu_a, -1) + np.identity(8)
+    assert_allclose((a + np.outer(x, y))[row_ids][:, col_ids], l @ np.triu(lu_a), atol=1e-12)
+
+    # Forrest-Tomlin column replacements mixed with rank-1 updates
+    factor = lu_factor(a, piv_option=piv_option, refactor_threshold=refactor_threshold)
+    for j in [3, 0, 7, 3, 5]:
+        v = rng.standard_normal(8)
+        factor.replace_column(j, v)
+        a[:, j] = v
+        assert_allclose(b, a @ factor.solve(b), atol=1e-10)
+        assert_allclose(b, a.T @ factor.solve_transposed(b), atol=1e-10)
+        assert_allclose(np.linalg.det(a), factor.det(), rtol=1e-10)
+
+    factor.update(x, y)
+    a += np.outer(x, y)
+    assert_allclose(b, a @ factor.solve(b), atol=1e-10)
+
+@pytest.mark.parametrize("piv_option", ["row", "col", "full", "rook"])
+def test_lu_stacked(piv_option):
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((10, 5, 5))
+    b = rng.standard_normal((10, 5, 2))
+    l, u, p, q = lu(a, piv_option=piv_option)
+    assert_allclose(a, p @ l @ u @ q, atol=1e-12)
+
+    x = lu_solve(a, b, piv_option=piv_option)
+    assert_allclose(b, a @ x, atol=1e-12)
+    x = lu_solve(a, b[..., 0], piv_option=piv_option)
+    assert_allclose(b[..., 0], np.einsum("kij,kj->ki", a, x), atol=1e-12)
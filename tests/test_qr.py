@@ -35,3 +35,9 @@ def test_qr(a, qr_func, mode):
     else:
         q, r = qr_func(a)
         assert_allclose(a, q @ r, atol=1e-12)
+
+@pytest.mark.parametrize("qr_func", [qr_house, qr_house_piv, qr_givens, qr_gram])
+def test_qr_float32(qr_func):
+    a = np.random.default_rng(0).standard_normal((9, 6)).astype(np.float32)
+    q, r = qr_func(a)[:2]
+    assert q.dtype == np.float32 and r.dtype == np.float32
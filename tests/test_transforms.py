@@ -2,6 +2,9 @@ import numpy as np
 from numpy.testing import assert_allclose
 
 from linalg.transforms import house, givens
+from linalg.transforms.cy_pivot import (
+    cy_argmax_abs, cy_argmax_abs_2d, cy_argmax_diag, cy_rook_pivot, cy_swap_rows, cy_swap_cols
+)
 
 def test_transforms():
     # test householder
@@ -20,3 +23,27 @@ def test_transforms():
         [s, c]
     ])
     assert_allclose(0.0, (g @ x[[1, 3]])[1], atol=1e-12)
+
+
+def test_pivot_kernels():
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((7, 5))
+
+    assert cy_argmax_abs(a[2:, 1]) == np.argmax(np.abs(a[2:, 1]))
+    assert cy_argmax_abs(a[3, :]) == np.argmax(np.abs(a[3, :]))
+    idx = np.unravel_index(np.argmax(np.abs(a[1:, 2:])), a[1:, 2:].shape)
+    assert cy_argmax_abs_2d(a[1:, 2:]) == idx
+    assert cy_argmax_diag(a[1:, 1:]) == np.argmax(np.diagonal(a[1:, 1:]))
+
+    b = a.copy()
+    cy_swap_rows(b, 1, 4)
+    cy_swap_cols(b, 0, 3)
+    check = a[[0, 4, 2, 3, 1, 5, 6]][:, [3, 1, 2, 0, 4]]
+    assert_allclose(check, b)
+
+    # rook pivot is maximal in its row and its column
+    for _ in range(10):
+        a = rng.standard_normal((8, 6))
+        row, col = cy_rook_pivot(a)
+        assert np.abs(a[row, col]) == np.max(np.abs(a[row]))
+        assert np.abs(a[row, col]) == np.max(np.abs(a[:, col]))